@@ -2,87 +2,36 @@ import streamlit as st
 import pandas as pd
 import os
 import sys
-import random
 from datetime import datetime
 import streamlit.components.v1 as components
-import time
-from functools import lru_cache
 import matplotlib.pyplot as plt
 from io import BytesIO
 
 # Add parent directory to path to import the crawler modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Import the source modules
+# Results are collected column by column and exported row by row; these only need pandas and openpyxl, so they are imported unconditionally
+from sources.article import is_placeholder
+from sources.batch import ArticleBatch
+from sources.export import MIME_TYPES, archive, render_articles
+
+# Source metadata only; each source's module is imported the first time it is searched
+from sources import AVAILABLE_SOURCES, get_source_function, get_max_pages
+from sources.pagination import Paginator
+from sources.stream import iter_sources
+
+# Import the optional search stages
 try:
-    from sources import AVAILABLE_SOURCES, get_source_function
+    from sources import article_body, near_dup, result_cache
+    from sources.dates import normalize_dates
+    from sources.urls import SeenIndex
 except ImportError:
-    # Define a fallback if sources module isn't available
-    from naver_news_downloader import get_naver_news, save_to_excel
-    
-    # Placeholder functions for Google Search and YouTube
-    def get_google_search_results(keyword, max_pages=1, start_page=1):
-        """Placeholder function for Google Search results"""
-        results = []
-        # Generate some dummy results
-        for i in range(1, random.randint(5, 10)):
-            results.append({
-                '제목': f"Google result: {keyword} - Article {i}",
-                '내용': f"This is a sample description for {keyword} related content. Contains various information about the topic searched.",
-                '언론사': f"Google Source {i}",
-                '날짜': datetime.now().strftime('%Y.%m.%d'),
-                '링크': f"https://www.google.com/search?q={keyword.replace(' ', '+')}#{i}"
-            })
-        # Simulate network delay
-        time.sleep(0.5)
-        return results
-
-    def get_youtube_videos(keyword, max_pages=1, start_page=1):
-        """Placeholder function for YouTube search results"""
-        results = []
-        # Generate some dummy results
-        for i in range(1, random.randint(3, 8)):
-            results.append({
-                '제목': f"YouTube: {keyword} - Video {i}",
-                '내용': f"This is a sample description for {keyword} related YouTube video. Watch this video to learn more about this topic.",
-                '언론사': f"YouTube Channel {i}",
-                '날짜': datetime.now().strftime('%Y.%m.%d'),
-                '링크': f"https://www.youtube.com/results?search_query={keyword.replace(' ', '+')}#{i}"
-            })
-        # Simulate network delay
-        time.sleep(0.5)
-        return results
-    
-    # Define our available sources
-    AVAILABLE_SOURCES = {
-        "naver_news": {
-            "name": "Naver News",
-            "icon": "🇰🇷",
-            "function": get_naver_news,
-            "enabled": True,
-            "description": "Official Korean news articles from Naver",
-        },
-        "google_search": {
-            "name": "Google Search",
-            "icon": "🔍",
-            "function": get_google_search_results,
-            "enabled": True,
-            "description": "Web search results from Google",
-        },
-        "youtube": {
-            "name": "YouTube",
-            "icon": "▶️",
-            "function": get_youtube_videos,
-            "enabled": True,
-            "description": "Video content from YouTube",
-        },
-    }
-    
-    def get_source_function(source_key):
-        """Get the function for a specific source"""
-        if source_key in AVAILABLE_SOURCES and AVAILABLE_SOURCES[source_key]["enabled"]:
-            return AVAILABLE_SOURCES[source_key]["function"]
-        return None
+    # Define a fallback if these modules aren't available
+    article_body = None
+    near_dup = None
+    result_cache = None
+    normalize_dates = None
+    SeenIndex = None
 
 # Import other pages
 try:
@@ -100,9 +49,15 @@ except ImportError:
         # Check if we have data from search
         if hasattr(st.session_state, 'visualization_data') and st.session_state.visualization_data is not None:
             df = st.session_state.visualization_data
+            if isinstance(df, ArticleBatch):
+                df = df.to_frame()
             keyword = st.session_state.visualization_keyword
             st.subheader(f"Visualizing data for '{keyword}'")
             
+            # Count each syndicated story once
+            if 'Cluster' in df.columns and st.checkbox("One Result per Story", value=load_settings()["search"].get("keep_cluster_representatives", False)):
+                df = df.drop_duplicates(subset='Cluster', keep='first')
+            
             # Overview statistics
             col1, col2, col3 = st.columns(3)
             col1.metric("Total Items", len(df))
@@ -111,8 +66,12 @@ except ImportError:
             # Date range if available
             if '날짜' in df.columns:
                 try:
-                    df['날짜'] = pd.to_datetime(df['날짜'], errors='coerce')
-                    date_range = (df['날짜'].max() - df['날짜'].min()).days
+                    # Resolve relative dates ("3일 전") against the time of the search
+                    if normalize_dates is not None:
+                        dates = normalize_dates(df['날짜'], st.session_state.get('visualization_fetched_at'))
+                    else:
+                        dates = pd.to_datetime(df['날짜'], errors='coerce')
+                    date_range = (dates.max() - dates.min()).days
                     col3.metric("Date Range (days)", date_range)
                 except:
                     col3.metric("Date Range", "N/A")
@@ -137,8 +96,11 @@ except ImportError:
                     source_data['Percentage'] = (source_data['Count'] / source_data['Count'].sum() * 100).round(2)
                     st.dataframe(source_data)
                     
-                # Word cloud if content column exists
-                content_col = '내용' if '내용' in df.columns else None
+                # Word cloud from the full article text when it was fetched, else the snippets
+                if '본문' in df.columns and df['본문'].astype(str).str.strip().any():
+                    content_col = '본문'
+                else:
+                    content_col = '내용' if '내용' in df.columns else None
                 if content_col:
                     try:
                         st.subheader("Word Cloud")
@@ -349,22 +311,23 @@ def make_clickable(link):
     # Returns a clickable link that opens in a new tab
     return f'<a href="{link}" target="_blank" rel="noopener noreferrer">{link}</a>'
 
-def dataframe_with_clickable_links(df):
+def dataframe_with_clickable_links(data):
+    # Accepts a DataFrame or an ArticleBatch; the long 본문 column is never shown
     # Memory optimization: limit dataframe size for display
     # If dataframe is very large, show only first 100 rows to avoid memory issues
-    if len(df) > 100:
-        display_df = df.head(100).copy()
-        st.warning(f"⚠️ Showing only the first 100 of {len(df)} results to optimize performance. All results will still be included in the Excel download.")
+    if len(data) > 100:
+        st.warning(f"⚠️ Showing only the first 100 of {len(data)} results to optimize performance. All results will still be included in the Excel download.")
+        data = data.head(100)
+    
+    if isinstance(data, ArticleBatch):
+        display_df = data.to_frame(exclude=['본문'])
     else:
-        display_df = df.copy()
-        
-    # Convert links to clickable HTML
-    df_html = display_df.copy()
+        display_df = data.drop(columns=['본문'], errors='ignore')
     
-    # Apply the clickable links to all URL fields
-    for col in df_html.columns:
-        if col.lower().endswith('url') or col.lower().endswith('link') or col == 'url' or col == 'link':
-            df_html[col] = df_html[col].apply(make_clickable)
+    # Convert links to clickable HTML in a single new frame
+    link_columns = [col for col in display_df.columns
+                    if col.lower().endswith('url') or col.lower().endswith('link') or col == 'url' or col == 'link']
+    df_html = display_df.assign(**{col: display_df[col].map(make_clickable) for col in link_columns})
     
     # Get the styling
     styles = [
@@ -447,81 +410,99 @@ def dataframe_with_clickable_links(df):
     """
     return html
 
-def save_to_excel(articles, filename):
-    """Save results to Excel file"""
-    import openpyxl
-    from openpyxl import Workbook
+# Implement caching for expensive operations
+def cached_search(keyword, source_key, max_pages=1, start_page=1):
+    """
+    Cached version of source function calls to reduce redundant API calls.
     
-    # Make sure the downloads directory exists
-    # Use mobile-aware path if available
-    if MOBILE_SUPPORT_ENABLED:
-        downloads_dir = get_mobile_downloads_dir()
-        # Make sure filename includes the path
-        if not os.path.dirname(filename):
-            filename = os.path.join(downloads_dir, os.path.basename(filename))
+    Single-page results are kept in the on-disk result cache (shared between
+    processes and restarts) while advanced.cache_results is enabled.
+    """
+    try:
+        use_cache = result_cache is not None and max_pages == 1 and result_cache.is_enabled()
+        if use_cache:
+            cached = result_cache.get(source_key, keyword, start_page)
+            if cached is not None:
+                return cached
+        
+        source_function = get_source_function(source_key)
+        if source_function:
+            results = source_function(keyword, max_pages=max_pages, start_page=start_page)
+            # Only real results are cached: a page that failed comes back empty or as generated
+            # placeholders, and caching those would hide the real results until the entry expires
+            if use_cache and results and not any(is_placeholder(result) for result in results):
+                result_cache.put(source_key, keyword, start_page, results)
+            return results
+        return []
+    except Exception as e:
+        st.error(f"Error in cached search for {source_key}: {str(e)}")
+        return []
+
+def script_context_initializer():
+    """Get a thread initializer that attaches worker threads to the current Streamlit script so they can report errors"""
+    import threading
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
     
-    # Ensure the directory exists
-    os.makedirs(os.path.dirname(filename) if os.path.dirname(filename) else '.', exist_ok=True)
+    ctx = get_script_run_ctx()
     
-    wb = Workbook()
-    ws = wb.active
+    def attach_context():
+        add_script_run_ctx(threading.current_thread(), ctx)
     
-    # Get all keys/columns from the articles
-    all_keys = set()
-    for article in articles:
-        all_keys.update(article.keys())
+    return attach_context
+
+def search_source_pages(keyword, source_key, max_pages=1, start_page=1, window=1, executor=None):
+    """
+    Follow one source's result pages through cached_search, stopping once they run dry.
     
-    # Order columns - put standard columns first
-    standard_columns = ['제목', '내용', '언론사', '날짜', '링크', 'Source']
-    columns = []
-    for col in standard_columns:
-        if col in all_keys:
-            columns.append(col)
-            all_keys.remove(col)
-    # Add any remaining keys
-    columns.extend(sorted(all_keys))
+    One Paginator spans the whole page loop: results already seen on an earlier
+    page of the source are dropped, and the source stops as soon as a page adds
+    fewer than search.min_new_articles new results. Up to `window` pages are
+    requested at a time; the first window is one page and later ones grow with the
+    pages parsed, so a keyword that runs dry early costs a request or two.
     
-    # Add header row
-    ws.append(columns)
+    Pages are fetched on `executor` when one is given. Sources searched together
+    share one executor, so its size bounds the fetches in flight across all of them.
+    Without one, pages are fetched one at a time on the calling thread.
     
-    # Add data rows
-    for article in articles:
-        row = []
-        for col in columns:
-            row.append(article.get(col, ""))
-        ws.append(row)
+    A source that cannot be reached returns generated placeholders. They are
+    passed on only while the source has no real results, and the source stops there.
     
-    # Auto-adjust column widths
-    for column in ws.columns:
-        max_length = 0
-        column = [cell for cell in column]
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        # Limit width to prevent extremely wide columns
-        adjusted_width = min(max_length + 2, 100)
-        ws.column_dimensions[column[0].column_letter].width = adjusted_width
+    Yields:
+        tuple: (page, list of new results from that page)
+    """
+    paginator = Paginator(max_pages)
+    pages = list(range(start_page, start_page + max_pages))
+    found_real = False
+    pending = []
+    
+    def search(page):
+        return cached_search(keyword, source_key, max_pages=1, start_page=page)
     
-    # Save file
-    wb.save(filename)
-    print(f"Data saved to {filename}")
-    print(f"File location: {os.path.abspath(filename)}")
-
-# Implement caching for expensive operations
-@lru_cache(maxsize=32)
-def cached_search(keyword, source_key, max_pages=1, start_page=1):
-    """Cached version of source function calls to reduce redundant API calls"""
     try:
-        source_function = get_source_function(source_key)
-        if source_function:
-            return source_function(keyword, max_pages=max_pages, start_page=start_page)
-        return []
-    except Exception as e:
-        st.error(f"Error in cached search for {source_key}: {str(e)}")
-        return []
+        for batch in paginator.windows(pages, window):
+            paginator.record_requests(len(batch))
+            if executor is not None:
+                pending = [executor.submit(search, page) for page in batch]
+                batch_results = (future.result() for future in pending)
+            else:
+                batch_results = map(search, batch)
+            
+            for page, page_results in zip(batch, batch_results):
+                if any(is_placeholder(result) for result in page_results):
+                    if not found_real:
+                        yield page, page_results
+                    paginator.should_stop = True
+                    break
+                
+                new_results = paginator.add_page(page_results)
+                found_real = found_real or bool(new_results)
+                yield page, new_results
+                if paginator.should_stop:
+                    break
+    finally:
+        # Pages of the last window that are no longer needed give their slots back
+        for future in pending:
+            future.cancel()
 
 def search_page():
     # Apply mobile UI settings if available
@@ -562,11 +543,12 @@ def search_page():
         """, unsafe_allow_html=True)
         
         # Create checkboxes for all available sources
+        default_sources = settings["search"].get("default_sources", ["naver_news", "google_search"])
         selected_sources = {}
         for source_key, source_info in AVAILABLE_SOURCES.items():
             selected_sources[source_key] = st.checkbox(
                 f"{source_info['icon']} {source_info['name']}", 
-                value=source_key in ["naver_news", "google_search"],  # Default selected sources
+                value=source_key in default_sources,
                 help=source_info["description"],
                 key=f"source_{source_key}"
             )
@@ -580,6 +562,22 @@ def search_page():
         with st.expander("Search Settings"):
             pages = st.number_input("Number of Pages", min_value=1, max_value=settings["search"]["max_pages"], value=settings["search"]["default_pages"])
             max_results = st.slider("Results Limit", min_value=10, max_value=100, value=limit_results, step=10)
+            if article_body is not None:
+                fetch_bodies = st.checkbox(
+                    "Fetch Full Article Text",
+                    value=settings["advanced"].get("fetch_article_bodies", False),
+                    help="Open each result and save the article text in a 본문 column (slower; texts are cached)"
+                )
+            else:
+                fetch_bodies = False
+            if near_dup is not None and near_dup.is_enabled():
+                one_per_story = st.checkbox(
+                    "One Result per Story",
+                    value=settings["search"].get("keep_cluster_representatives", False),
+                    help="Export only the first of each group of near-identical results (e.g. rewritten wire stories)"
+                )
+            else:
+                one_per_story = False
         
         # Adjust button size for mobile if needed
         button_style = "height:3rem;font-size:1.1rem;" if use_compact_layout else ""
@@ -727,9 +725,12 @@ def search_page():
         
         # Modify the content function to use caching
         def get_content_with_progress():
-            articles = []
+            articles = ArticleBatch()
             active_sources = []
             
+            # The same story often comes back from several sources under different URLs
+            seen = SeenIndex() if SeenIndex is not None else None
+            
             # Get list of selected sources
             for source_key, is_selected in selected_sources.items():
                 if is_selected and source_key in AVAILABLE_SOURCES:
@@ -737,69 +738,136 @@ def search_page():
             
             if not active_sources:
                 status_text.text("Please select at least one source")
-                return []
+                return articles
                 
             status_text.text(f"Searching for '{keyword}' in {len(active_sources)} sources...")
             
-            # Track progress across all selected sources
-            total_steps = len(active_sources) * pages
-            current_step = 0
+            # Query all selected sources at once when parallel requests are enabled, otherwise one after another
+            advanced_settings = settings.get("advanced", {})
+            parallel = advanced_settings.get("parallel_requests", False)
+            window = max(1, advanced_settings.get("max_workers", 6)) if parallel else 1
             
-            # Fetch from each selected source
-            for source_key in active_sources:
-                source_info = AVAILABLE_SOURCES[source_key]
-                source_name = source_info["name"]
-                
-                # For some sources, limit the number of pages to avoid long searches
-                source_pages = min(pages, 3) if source_key in ["google_search", "youtube", "medium", "twitter", "threads"] else pages
-                
-                for page in range(1, source_pages + 1):
-                    current_step += 1
-                    current_progress = current_step / total_steps
-                    progress_bar.progress(current_progress)
-                    status_text.text(f"Fetching {source_name} - page {page}/{source_pages}...")
-                    
-                    try:
-                        # Use the cached search function instead of direct calls
-                        page_results = cached_search(keyword, source_key, max_pages=1, start_page=page)
-                        
-                        # Add source information to results
-                        for result in page_results:
-                            result['Source'] = source_name
-                        
-                        articles.extend(page_results)
-                        
-                        # Limit total results if needed
-                        if len(articles) >= max_results:
+            # One pool for every source, so max_workers bounds the page fetches in flight for the whole search
+            from concurrent.futures import ThreadPoolExecutor
+            executor = ThreadPoolExecutor(max_workers=window, initializer=script_context_initializer()) if parallel else None
+            
+            # Track progress across all selected sources (some sources cap their page count to avoid long searches)
+            source_pages = {source_key: get_max_pages(source_key, pages) for source_key in active_sources}
+            total_steps = sum(source_pages.values())
+            pages_done = {source_key: 0 for source_key in active_sources}
+            errors = []
+            attach_context = script_context_initializer()
+            # Sent after a source's last result, through the same stream so it arrives after them
+            end_of_source = object()
+            
+            def follow(source_key, keyword, max_pages, start_page):
+                # Runs on the stream's worker threads, which may change between results
+                page_results = search_source_pages(keyword, source_key, max_pages, start_page, window, executor)
+                try:
+                    while True:
+                        attach_context()
+                        entry = next(page_results, None)
+                        if entry is None:
                             break
-                            
-                    except Exception as e:
-                        st.error(f"Error fetching {source_name} content: {str(e)}")
-                        continue
-                
-                # Check if we've reached the total limit
-                if len(articles) >= max_results:
-                    break
+                        page, new_results = entry
+                        pages_done[source_key] = page - start_page + 1
+                        yield from new_results
+                except Exception as e:
+                    errors.append((source_key, e))
+                finally:
+                    page_results.close()
+                yield end_of_source
             
-            progress_bar.progress(1.0)
+            # Results are appended into the batch as they arrive, in whatever order the sources answer.
+            # `order` lists them as a serial search would return them: by source, then page, without
+            # duplicates. A source's results join it once every source ranked before it has finished.
+            rows_by_source = {source_key: [] for source_key in active_sources}
+            finished = set()
+            order = []
+            settled = {source_key: 0 for source_key in active_sources}
+            position = 0
+            
+            def settle():
+                nonlocal position
+                while position < len(active_sources):
+                    source_key = active_sources[position]
+                    rows = rows_by_source[source_key]
+                    for index, link in rows[settled[source_key]:]:
+                        if seen is None or seen.add(link):
+                            order.append(index)
+                    settled[source_key] = len(rows)
+                    if source_key not in finished:
+                        return
+                    position += 1
+            
+            stream = iter_sources(keyword, active_sources, max_pages=source_pages, iterate=follow,
+                                  concurrency=None if parallel else 1)
+            completed = 0
+            try:
+                for source_key, article in stream:
+                    if article is end_of_source:
+                        finished.add(source_key)
+                    else:
+                        source_name = AVAILABLE_SOURCES[source_key]["name"]
+                        if sum(pages_done.values()) != completed:
+                            completed = sum(pages_done.values())
+                            progress_bar.progress(min(completed / total_steps, 1.0))
+                            status_text.text(f"Fetched {source_name} - page {pages_done[source_key]}/{source_pages[source_key]}...")
+                        
+                        rows_by_source[source_key].append((len(articles), article.get('링크')))
+                        articles.append(article, Source=source_name)
+                    
+                    # Stop the remaining sources once the leading, settled results fill the limit
+                    settle()
+                    if len(order) >= max_results:
+                        break
+            finally:
+                stream.close()
+                if executor is not None:
+                    executor.shutdown(wait=False, cancel_futures=True)
             
-            # Limit results to max_results
-            if len(articles) > max_results:
-                articles = articles[:max_results]
+            for source_key, error in errors:
+                st.error(f"Error fetching {AVAILABLE_SOURCES[source_key]['name']} content: {str(error)}")
             
+            progress_bar.progress(1.0)
+            
+            # Sources that could not be opened never send their end marker
+            if len(order) < max_results:
+                finished.update(active_sources)
+                settle()
+            articles = articles.take(order[:max_results])
+            report_duplicates(seen)
             return articles
         
+        def report_duplicates(seen):
+            if seen is not None and seen.duplicates:
+                status_text.text(f"Skipped {seen.duplicates} results already found under another link")
+        
         # Get articles with better error handling
         try:
             articles = get_content_with_progress()
             
+            # Follow each result's link for the full article text
+            if fetch_bodies and articles:
+                status_text.text(f"Fetching full text of {len(articles)} articles...")
+                progress_bar.progress(0.0)
+                article_body.add_bodies(articles, progress=lambda done, total: progress_bar.progress(done / total))
+                progress_bar.progress(1.0)
+            
+            # Label rewritten copies of the same story with a shared cluster id
+            if near_dup is not None and near_dup.is_enabled() and articles:
+                near_dup.add_clusters(articles)
+            
             with results_container:
                 if articles:
-                    # Convert to DataFrame for display
-                    df = pd.DataFrame(articles)
+                    # DataFrame view of the batch (built once, shared with the visualization page)
+                    df = articles.to_frame()
                     
                     # Show results
-                    st.subheader(f"Found {len(articles)} items for '{keyword}'")
+                    if 'Cluster' in df.columns:
+                        st.subheader(f"Found {len(articles)} items ({df['Cluster'].nunique()} stories) for '{keyword}'")
+                    else:
+                        st.subheader(f"Found {len(articles)} items for '{keyword}'")
                     
                     # Get table height from settings or mobile config
                     table_height = mobile_settings.get("table_height", settings["display"]["table_height"])
@@ -811,7 +879,7 @@ def search_page():
                     # Display layout based on mobile or desktop
                     if use_compact_layout:
                         # Mobile-friendly layout (single column)
-                        st.components.v1.html(dataframe_with_clickable_links(df), height=table_height)
+                        st.components.v1.html(dataframe_with_clickable_links(articles), height=table_height)
                         st.write("### Source Distribution")
                         for idx, row in source_counts.iterrows():
                             st.metric(row['Source'], row['Count'])
@@ -819,7 +887,7 @@ def search_page():
                         # Desktop layout (two columns)
                         col1, col2 = st.columns([2, 1])
                         with col1:
-                            st.components.v1.html(dataframe_with_clickable_links(df), height=table_height)
+                            st.components.v1.html(dataframe_with_clickable_links(articles), height=table_height)
                         with col2:
                             st.write("### Source Distribution")
                             for idx, row in source_counts.iterrows():
@@ -834,28 +902,33 @@ def search_page():
                     else:
                         downloads_dir = "downloads"
                     
-                    os.makedirs(downloads_dir, exist_ok=True)
                     filename = f"{downloads_dir}/{keyword}_results_{today}.xlsx"
                     
+                    # Check if download is enabled (may be disabled on some mobile platforms)
+                    download_enabled = mobile_settings.get("download_enabled", True) if MOBILE_SUPPORT_ENABLED else True
+                    
+                    # Without a download button the saved file is the only copy, so it is always kept
+                    keep_copy = not download_enabled or settings.get("advanced", {}).get("archive_downloads", True)
+                    
+                    export_rows = articles
+                    if one_per_story and near_dup is not None:
+                        export_rows = near_dup.keep_representatives(articles)
+                    
                     try:
-                        save_to_excel(articles, filename)
-                        
-                        # Check if download is enabled (may be disabled on some mobile platforms)
-                        download_enabled = mobile_settings.get("download_enabled", True) if MOBILE_SUPPORT_ENABLED else True
+                        # Rendered in memory and handed to the download button; the copy on disk is written in the background
+                        file_data = render_articles(export_rows, 'xlsx')
+                        if keep_copy:
+                            archive(file_data, filename, background=download_enabled)
                         
                         if download_enabled:
-                            # Provide download button - fix the error by reading the file first
                             try:
-                                with open(filename, "rb") as file:
-                                    file_data = file.read()
-                                    
                                 col1, col2 = st.columns([1, 1])
                                 with col1:
                                     st.download_button(
                                         label="Download Excel File",
                                         data=file_data,
                                         file_name=f"{keyword}_results_{today}.xlsx",
-                                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                                        mime=MIME_TYPES['xlsx'],
                                         key="download_results_button"
                                     )
                                 with col2:
@@ -863,37 +936,39 @@ def search_page():
                                     if st.button("📊 Visualize These Results", use_container_width=True, key="view_results_button"):
                                         st.session_state.current_page = 'visualize'
                                         # Store the current results for visualization
-                                        st.session_state.visualization_data = df
+                                        st.session_state.visualization_data = articles
                                         st.session_state.visualization_keyword = keyword
+                                        st.session_state.visualization_fetched_at = datetime.now()
                                         st.rerun()
                             except Exception as e:
                                 st.error(f"Download button error: {str(e)}")
-                                st.write(f"File saved to: {filename}")
+                                if keep_copy:
+                                    st.write(f"File saved to: {filename}")
                         else:
                             # On platforms where download is disabled, just show the file location
                             st.info(f"Results saved to: {filename}")
                             if st.button("📊 Visualize These Results", use_container_width=True, key="view_results_button"):
                                 st.session_state.current_page = 'visualize'
-                                st.session_state.visualization_data = df
+                                st.session_state.visualization_data = articles
                                 st.session_state.visualization_keyword = keyword
+                                st.session_state.visualization_fetched_at = datetime.now()
                                 st.rerun()
                     except Exception as e:
                         st.error(f"Excel save error: {str(e)}")
                         # Try CSV as fallback
                         try:
                             csv_filename = f"{downloads_dir}/{keyword}_results_{today}.csv"
-                            df.to_csv(csv_filename, index=False)
-                            st.success(f"Results saved as CSV instead at {csv_filename}")
+                            file_data = render_articles(export_rows, 'csv')
+                            if keep_copy:
+                                archive(file_data, csv_filename, background=download_enabled)
+                                st.success(f"Results saved as CSV instead at {csv_filename}")
                             
                             if download_enabled:
-                                with open(csv_filename, "rb") as file:
-                                    file_data = file.read()
-                                    
                                 st.download_button(
                                     label="Download CSV File (Excel failed)",
                                     data=file_data,
                                     file_name=f"{keyword}_results_{today}.csv",
-                                    mime="text/csv",
+                                    mime=MIME_TYPES['csv'],
                                     key="download_csv_button"
                                 )
                         except Exception as csv_err:
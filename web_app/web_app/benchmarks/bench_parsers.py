@@ -0,0 +1,175 @@
+"""
+Offline parser benchmark for the source modules.
+
+Runs every source's page parser over its saved HTML fixture with each installed
+parser backend and reports pages/sec, articles/sec and peak memory. No network
+access is needed.
+
+Usage (from web_app/web_app):
+    python benchmarks/bench_parsers.py
+    python benchmarks/bench_parsers.py --repeat 50 --output results.json
+    python benchmarks/bench_parsers.py --baseline results.json --tolerance 0.2
+
+With --baseline, the run fails (exit code 1) when any source/backend pair is
+slower than the baseline by more than the tolerance, or extracts a different
+number of articles.
+"""
+
+import argparse
+import contextlib
+import gzip
+import importlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(BENCH_DIR, 'fixtures')
+
+# Allow running as a script from anywhere
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from sources import parsers
+
+# Source -> (module, page parser); each has a fixtures/<source>.html.gz page
+SOURCES = {
+    'naver_news': ('sources.naver_news', 'parse_naver_news_page'),
+    'daum_news': ('sources.daum_news', 'parse_daum_news_page'),
+    'google_search': ('sources.google_search', 'parse_google_search_page'),
+    'google_blogger': ('sources.google_blogger', 'parse_google_blogger_page'),
+    'naver_blog': ('sources.naver_blog', 'parse_naver_blog_page'),
+    'tistory': ('sources.tistory', 'parse_tistory_page'),
+    'medium': ('sources.medium', 'parse_medium_page'),
+    'youtube': ('sources.youtube', 'parse_youtube_page'),
+}
+
+def load_fixture(source):
+    """Read a source's saved result page"""
+    with gzip.open(os.path.join(FIXTURES_DIR, f'{source}.html.gz'), 'rt', encoding='utf-8') as f:
+        return f.read()
+
+def get_parser(source):
+    module_name, function_name = SOURCES[source]
+    return getattr(importlib.import_module(module_name), function_name)
+
+def bench_source(source, backend, repeat):
+    """
+    Benchmark one source's parser with one backend.
+
+    Args:
+        source (str): Source key
+        backend (str): Parser backend
+        repeat (int): Number of timed parses
+
+    Returns:
+        dict: Timing, throughput and memory results
+    """
+    parse = get_parser(source)
+    html = load_fixture(source)
+
+    # Sources print progress and per-item errors; keep the report readable
+    with parsers.use_backend(backend), contextlib.redirect_stdout(io.StringIO()):
+        # Warm up selector caches and imports
+        articles = parse(html) or []
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parse(html)
+            timings.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        parse(html)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    total = sum(timings)
+    timings.sort()
+    return {
+        'source': source,
+        'backend': backend,
+        'page_kb': round(len(html.encode('utf-8')) / 1024, 1),
+        'articles_per_page': len(articles),
+        'repeat': repeat,
+        'median_ms': round(timings[len(timings) // 2] * 1000, 3),
+        'pages_per_sec': round(repeat / total, 2),
+        'articles_per_sec': round(repeat * len(articles) / total, 2),
+        'peak_memory_kb': round(peak / 1024, 1),
+    }
+
+def compare(results, baseline, tolerance):
+    """
+    Compare results with a previous run.
+
+    Returns:
+        list: Human-readable descriptions of regressions
+    """
+    previous = {(r['source'], r['backend']): r for r in baseline['results']}
+    regressions = []
+    for result in results:
+        old = previous.get((result['source'], result['backend']))
+        if old is None:
+            continue
+        if result['articles_per_page'] != old['articles_per_page']:
+            regressions.append(f"{result['source']}/{result['backend']}: extracted {result['articles_per_page']} "
+                               f"articles, baseline {old['articles_per_page']}")
+        if result['pages_per_sec'] < old['pages_per_sec'] * (1 - tolerance):
+            regressions.append(f"{result['source']}/{result['backend']}: {result['pages_per_sec']} pages/sec, "
+                               f"baseline {old['pages_per_sec']}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark source page parsers on saved fixtures')
+    parser.add_argument('--sources', nargs='+', choices=sorted(SOURCES), default=list(SOURCES),
+                        help='Sources to benchmark (default: all)')
+    parser.add_argument('--backends', nargs='+', choices=parsers.BACKENDS, default=parsers.available_backends(),
+                        help='Parser backends to benchmark (default: all installed)')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed parses per source and backend (default: 20)')
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    parser.add_argument('--baseline', help='Fail if results regress against this earlier JSON output')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed pages/sec slowdown against the baseline (default: 0.2 = 20%%)')
+    args = parser.parse_args()
+
+    missing = [b for b in args.backends if b not in parsers.available_backends()]
+    if missing:
+        parser.error(f"backend not installed: {', '.join(missing)}")
+
+    results = []
+    print(f"{'source':<16}{'backend':<13}{'articles':>9}{'median ms':>11}{'pages/s':>10}{'articles/s':>12}{'peak KB':>10}")
+    for source in args.sources:
+        for backend in args.backends:
+            result = bench_source(source, backend, args.repeat)
+            results.append(result)
+            print(f"{source:<16}{backend:<13}{result['articles_per_page']:>9}{result['median_ms']:>11.2f}"
+                  f"{result['pages_per_sec']:>10.1f}{result['articles_per_sec']:>12.1f}{result['peak_memory_kb']:>10.0f}")
+
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions against baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("\nNo regressions against baseline")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Refresh the benchmark fixtures from the live sites.
+
+Fetches one result page per source through the normal HTTP client and stores it
+gzipped in benchmarks/fixtures. Run it when a site changes its markup, then
+re-run bench_parsers.py and save a new baseline.
+
+Usage (from web_app/web_app):
+    python benchmarks/record_fixtures.py --keyword 인공지능
+"""
+
+import argparse
+import gzip
+import os
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(BENCH_DIR, 'fixtures')
+
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from sources import (daum_news, google_blogger, google_search, http_client, medium, naver_blog,
+                     naver_news, tistory, youtube)
+
+# Source -> first result page URL for a keyword, built by the source itself so the fixtures match what it requests
+SEARCH_URLS = {
+    'naver_news': lambda keyword: naver_news.build_search_url(keyword, 1),
+    'daum_news': lambda keyword: daum_news.build_search_url(keyword, 1),
+    'google_search': lambda keyword: google_search.build_search_url(keyword, 1),
+    'google_blogger': lambda keyword: google_blogger.build_search_url(keyword, 1),
+    'naver_blog': lambda keyword: naver_blog.build_search_url(keyword, 1),
+    'tistory': lambda keyword: tistory.build_search_url(keyword, 1),
+    'medium': lambda keyword: medium.build_search_url(keyword, 1),
+    'youtube': youtube.build_search_url,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description='Record live result pages as benchmark fixtures')
+    parser.add_argument('--keyword', default='인공지능', help='Search keyword (default: 인공지능)')
+    parser.add_argument('--sources', nargs='+', choices=sorted(SEARCH_URLS), default=list(SEARCH_URLS),
+                        help='Sources to record (default: all)')
+    args = parser.parse_args()
+
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+
+    for source in args.sources:
+        url = SEARCH_URLS[source](args.keyword)
+        try:
+            response = http_client.get(url, source=source)
+        except Exception as e:
+            print(f"{source}: request failed: {str(e)}")
+            continue
+
+        if response.status_code != 200:
+            print(f"{source}: status code {response.status_code}, fixture not updated")
+            continue
+
+        path = os.path.join(FIXTURES_DIR, f'{source}.html.gz')
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write(response.text)
+        print(f"{source}: saved {len(response.content) // 1024} KB to {path}")
+
+if __name__ == "__main__":
+    main()
@@ -1,104 +1,35 @@
-import requests
-from bs4 import BeautifulSoup
-from openpyxl import Workbook
 from datetime import datetime
-import time
+from itertools import chain
 import argparse
 import os
 import sys
-import re
 
-def get_naver_news(keyword, max_pages=5, start_page=1):
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
-    articles = []
-    
+from sources.export import write_articles
+from sources.stream import iter_sources
+
+def iter_naver_news(keyword, max_pages=5, start_page=1):
+    """Stream Naver News results as they are parsed (the source stops early once pages run dry)"""
     print(f"Searching for '{keyword}' news...")
-    for page in range(start_page, start_page + max_pages):
-        url = f'https://search.naver.com/search.naver?where=news&query={keyword}&sm=tab_pge&sort=0&photo=0&field=0&reporter_article=&pd=0&ds=&de=&docid=&nso=so:r,p:all,a:all&mynews=0&refresh_start=0&related=0&start={((page-1)*10)+1}'
-        
-        try:
-            sys.stdout.write(f"\rFetching page {page}/{start_page + max_pages - 1}...")
-            sys.stdout.flush()
-            
-            response = requests.get(url, headers=headers)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            news_items = soup.select('div.news_wrap.api_ani_send')
-            
-            for item in news_items:
-                title = item.select_one('a.news_tit')
-                content = item.select_one('div.news_dsc')
-                link = title.get('href') if title else None
-                
-                # Extract publisher
-                publisher_elem = item.select_one('a.info.press')
-                publisher = publisher_elem.get_text(strip=True) if publisher_elem else "Unknown"
-                
-                # Extract date
-                date_elem = item.select_one('span.info')
-                date_text = date_elem.get_text(strip=True) if date_elem else ""
-                
-                # Naver usually provides date in format like "5시간 전", "3일 전", "2024.04.12." etc.
-                # Try to extract structured date or use the original text
-                date = date_text
-                
-                if title and content and link:
-                    articles.append({
-                        '제목': title.get_text(strip=True),
-                        '내용': content.get_text(strip=True),
-                        '언론사': publisher,
-                        '날짜': date,
-                        '링크': link
-                    })
-            
-            time.sleep(1)  # 서버 부하 방지를 위한 딜레이
-            
-        except Exception as e:
-            print(f"\nError occurred while crawling page {page}: {str(e)}")
-            continue
-    
-    print(f"\nTotal articles found: {len(articles)}")
+    for count, (_, article) in enumerate(iter_sources(keyword, ['naver_news'], max_pages, start_page), start=1):
+        sys.stdout.write(f"\rArticles found: {count}")
+        sys.stdout.flush()
+        yield article
+    print()
+
+def get_naver_news(keyword, max_pages=5, start_page=1):
+    articles = list(iter_naver_news(keyword, max_pages, start_page))
+    print(f"Total articles found: {len(articles)}")
     return articles
 
 def save_to_excel(articles, filename):
-    wb = Workbook()
-    ws = wb.active
-    
-    # 헤더 추가
-    ws.append(['제목', '내용', '언론사', '날짜', '링크'])
-    
-    # 데이터 추가
-    for article in articles:
-        ws.append([
-            article['제목'],
-            article['내용'],
-            article['언론사'],
-            article['날짜'],
-            article['링크']
-        ])
-    
-    # 열 너비 자동 조정
-    for column in ws.columns:
-        max_length = 0
-        column = [cell for cell in column]
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 100)  # Limit width to prevent extremely wide columns
-        ws.column_dimensions[column[0].column_letter].width = adjusted_width
-    
     # Ensure the directory exists
     os.makedirs(os.path.dirname(filename) if os.path.dirname(filename) else '.', exist_ok=True)
     
-    wb.save(filename)
+    # 행을 바로 파일에 쓰면서 열 너비도 함께 계산
+    count = write_articles(articles, filename, columns=['제목', '내용', '언론사', '날짜', '링크'])
     print(f"Data saved to {filename}")
     print(f"File location: {os.path.abspath(filename)}")
+    return count
 
 def main():
     parser = argparse.ArgumentParser(description='Download news articles from Naver Search')
@@ -123,12 +54,14 @@ def main():
         today = datetime.now().strftime('%Y%m%d')
         filename = f"{args.dir}/{keyword}_news_{today}.xlsx"
     
-    # Start crawling
-    articles = get_naver_news(keyword, max_pages, start_page)
+    # Start crawling; articles are streamed into the file as they are parsed
+    # (without xlsxwriter, openpyxl holds the first rows back to size the columns)
+    articles = iter_naver_news(keyword, max_pages, start_page)
+    first = next(articles, None)
     
-    if articles:
-        save_to_excel(articles, filename)
-        print(f"Successfully downloaded {len(articles)} articles about '{keyword}'")
+    if first is not None:
+        count = save_to_excel(chain([first], articles), filename)
+        print(f"Successfully downloaded {count} articles about '{keyword}'")
     else:
         print("No articles found.")
 
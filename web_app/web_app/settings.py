@@ -14,13 +14,35 @@ DEFAULT_SETTINGS = {
         "default_pages": 5,
         "max_pages": 20,
         "default_sources": ["naver_news", "google_search"],
-        "request_delay": 1.5
+        "request_delay": 1.5,
+        "burst_size": 5,
+        "min_new_articles": 3,
+        "cluster_near_duplicates": True,
+        "near_duplicate_similarity": 0.5,
+        "keep_cluster_representatives": False
     },
     "advanced": {
         "request_timeout": 10,
         "cache_results": True,
         "cache_expiry_hours": 24,
-        "parallel_requests": False
+        "cache_max_entries": 2000,
+        "http_cache": True,
+        "http_cache_max_mb": 200,
+        "fetch_article_bodies": False,
+        "body_workers": 8,
+        "body_per_domain": 2,
+        "parallel_requests": False,
+        "max_workers": 6,
+        "process_pool_parsing": False,
+        "parse_workers": 0,
+        "max_concurrent_requests": 8,
+        "per_host_connections": 2,
+        "prefetch_window": 1,
+        "html_parser": "auto",
+        "max_retries": 2,
+        "circuit_breaker_threshold": 3,
+        "circuit_breaker_cooldown": 300,
+        "archive_downloads": True
     }
 }
 
@@ -134,8 +156,54 @@ def settings_page():
             max_value=5.0,
             value=settings["search"]["request_delay"],
             step=0.1,
-            help="Delay between requests to prevent rate limiting"
+            help="Sustained delay between requests to the same site to prevent rate limiting. "
+                 "Higher values are gentler but make long crawls slower; Naver search uses its own "
+                 "faster limit (0.3 s) and Google/YouTube slower ones"
         )
+        
+        # Burst size
+        settings["search"]["burst_size"] = st.slider(
+            "Request Burst Size",
+            min_value=1,
+            max_value=20,
+            value=settings["search"].get("burst_size", 5),
+            step=1,
+            help="Number of requests that may be sent to a site back-to-back before the delay applies "
+                 "(Naver search allows 10)"
+        )
+        
+        # Early stop
+        settings["search"]["min_new_articles"] = st.slider(
+            "Minimum New Results per Page",
+            min_value=0,
+            max_value=10,
+            value=settings["search"].get("min_new_articles", 3),
+            step=1,
+            help="Stop paging a source once a page adds fewer new results than this (0 stops only on pages with nothing new)"
+        )
+        
+        # Near-duplicate clustering
+        settings["search"]["cluster_near_duplicates"] = st.checkbox(
+            "Group Near-Duplicate Results",
+            value=settings["search"].get("cluster_near_duplicates", True),
+            help="Give results with nearly the same title and text (e.g. rewritten wire stories) a shared Cluster id"
+        )
+        
+        if settings["search"]["cluster_near_duplicates"]:
+            settings["search"]["near_duplicate_similarity"] = st.slider(
+                "Near-Duplicate Similarity",
+                min_value=0.3,
+                max_value=0.95,
+                value=settings["search"].get("near_duplicate_similarity", 0.5),
+                step=0.05,
+                help="How much of two results' text must overlap for them to count as the same story"
+            )
+            
+            settings["search"]["keep_cluster_representatives"] = st.checkbox(
+                "One Result per Story by Default",
+                value=settings["search"].get("keep_cluster_representatives", False),
+                help="Export and visualize only the first result of each group"
+            )
     
     # Advanced Settings
     with advanced_tab:
@@ -151,6 +219,63 @@ def settings_page():
             help="Maximum time to wait for a response from a source"
         )
         
+        # Concurrent page fetching
+        settings["advanced"]["max_concurrent_requests"] = st.slider(
+            "Max Concurrent Requests",
+            min_value=1,
+            max_value=32,
+            value=settings["advanced"].get("max_concurrent_requests", 8),
+            step=1,
+            help="Maximum number of pages fetched at the same time"
+        )
+        
+        settings["advanced"]["per_host_connections"] = st.slider(
+            "Connections per Host",
+            min_value=1,
+            max_value=8,
+            value=settings["advanced"].get("per_host_connections", 2),
+            step=1,
+            help="Maximum simultaneous requests to a single site"
+        )
+        
+        settings["advanced"]["prefetch_window"] = st.slider(
+            "Pages Fetched Ahead",
+            min_value=1,
+            max_value=4,
+            value=settings["advanced"].get("prefetch_window", 1),
+            step=1,
+            help="How many result pages to download in the background while the current page is parsed"
+        )
+        
+        # HTML parser backend
+        parser_options = ["auto", "lxml", "html.parser"]
+        current_parser = settings["advanced"].get("html_parser", "auto")
+        settings["advanced"]["html_parser"] = st.selectbox(
+            "HTML Parser",
+            options=parser_options,
+            index=parser_options.index(current_parser) if current_parser in parser_options else 0,
+            help="Parser used to read result pages; auto uses lxml when it is installed and falls back to html.parser"
+        )
+        
+        # Retries and circuit breaker
+        settings["advanced"]["max_retries"] = st.slider(
+            "Retries per Request",
+            min_value=0,
+            max_value=5,
+            value=settings["advanced"].get("max_retries", 2),
+            step=1,
+            help="How many times to retry a request that timed out or was rate limited"
+        )
+        
+        settings["advanced"]["circuit_breaker_cooldown"] = st.slider(
+            "Failing Source Cool-down (seconds)",
+            min_value=30,
+            max_value=1800,
+            value=settings["advanced"].get("circuit_breaker_cooldown", 300),
+            step=30,
+            help="How long to skip a source after repeated errors instead of waiting on it"
+        )
+        
         # Cache results
         settings["advanced"]["cache_results"] = st.checkbox(
             "Cache Search Results",
@@ -167,6 +292,47 @@ def settings_page():
                 value=settings["advanced"]["cache_expiry_hours"],
                 help="How long to keep cached results before refreshing"
             )
+            
+            # Cache size
+            settings["advanced"]["cache_max_entries"] = st.number_input(
+                "Cache Size (pages)",
+                min_value=100,
+                max_value=100000,
+                value=settings["advanced"].get("cache_max_entries", 2000),
+                step=100,
+                help="Maximum number of cached result pages; the least recently used are removed first"
+            )
+        
+        # HTTP cache
+        settings["advanced"]["http_cache"] = st.checkbox(
+            "Revalidate Unchanged Pages",
+            value=settings["advanced"].get("http_cache", True),
+            help="Keep pages that send ETag/Last-Modified headers on disk and only re-download them when they change"
+        )
+        
+        # Full article text
+        settings["advanced"]["fetch_article_bodies"] = st.checkbox(
+            "Fetch Full Article Text by Default",
+            value=settings["advanced"].get("fetch_article_bodies", False),
+            help="Open every result and save the article text in a 본문 column"
+        )
+        
+        if settings["advanced"]["fetch_article_bodies"]:
+            settings["advanced"]["body_per_domain"] = st.slider(
+                "Article Requests per Publisher",
+                min_value=1,
+                max_value=8,
+                value=settings["advanced"].get("body_per_domain", 2),
+                step=1,
+                help="Maximum articles downloaded at the same time from one site"
+            )
+        
+        # Keep a copy of each export
+        settings["advanced"]["archive_downloads"] = st.checkbox(
+            "Keep a Copy of Downloads",
+            value=settings["advanced"].get("archive_downloads", True),
+            help="Also save every exported file to the downloads folder (written in the background)"
+        )
         
         # Experimental features
         st.subheader("Experimental Features")
@@ -179,11 +345,44 @@ def settings_page():
             help="Query multiple sources simultaneously (may cause rate limiting issues)"
         )
         
-        # Clear cache button
-        if settings["advanced"]["cache_results"]:
-            if st.button("Clear Cache"):
-                st.cache_data.clear()
-                st.success("Cache cleared successfully!")
+        if settings["advanced"]["parallel_requests"]:
+            settings["advanced"]["max_workers"] = st.slider(
+                "Max Parallel Workers",
+                min_value=1,
+                max_value=16,
+                value=settings["advanced"].get("max_workers", 6),
+                step=1,
+                help="Maximum number of source pages fetched at the same time"
+            )
+        
+        # Process pool parsing
+        settings["advanced"]["process_pool_parsing"] = st.checkbox(
+            "Parse Pages in Worker Processes",
+            value=settings["advanced"].get("process_pool_parsing", False),
+            help="Parse result pages on all CPU cores instead of one; most useful with parallel requests and many sources"
+        )
+        
+        if settings["advanced"]["process_pool_parsing"]:
+            settings["advanced"]["parse_workers"] = st.slider(
+                "Parse Worker Processes (0 = one per CPU)",
+                min_value=0,
+                max_value=32,
+                value=settings["advanced"].get("parse_workers", 0),
+                step=1,
+                help="Number of worker processes kept running for parsing"
+            )
+        
+        # Clear cache button (always shown: the HTTP and article text caches stay on when result caching is off)
+        if st.button("Clear Cache", help="Remove cached search results, downloaded pages and article texts"):
+            st.cache_data.clear()
+            try:
+                from sources import article_body, http_cache, result_cache
+                result_cache.clear()
+                http_cache.clear()
+                article_body.clear()
+            except ImportError:
+                pass
+            st.success("Cache cleared successfully!")
     
     # About tab
     with about_tab:
@@ -2,40 +2,288 @@
 Sources package for News & Content Downloader.
 
 This package contains modules for different content sources and integrations.
+
+Every source is described once, in AVAILABLE_SOURCES: its display metadata,
+the module that implements it and the names of its get_* and iter_*
+functions. Importing the package does not import any source module; a source's
+module is imported the first time its function is asked for, so a search only
+pays for the sources that were selected.
+
+Third-party sources can register through the "all_news_downloader.sources"
+entry point group. The entry point name is the source key and it may point to
+either a metadata dictionary (with the same keys as the entries below) or
+directly to a get_* style function:
+
+    [project.entry-points."all_news_downloader.sources"]
+    my_site = "my_package.sources:SOURCE_INFO"
+
+Plugins are listed without being imported: until a plugin source is first
+searched, its label comes from the entry point name and its description from
+the distribution's summary. The entry point is loaded on first use, like the
+built-in source modules.
 """
 
-from datetime import datetime
+import importlib
+import threading
+
+ENTRY_POINT_GROUP = 'all_news_downloader.sources'
 
 # Available sources configuration
+# module is relative to this package, so it works however the package is imported
+# max_pages caps how many pages one search requests from a source (None for no cap)
 AVAILABLE_SOURCES = {
     "naver_news": {
         "name": "Naver News",
         "icon": "🇰🇷",
         "description": "Korean news articles from Naver",
-        "function": "get_naver_news"
+        "module": ".naver_news",
+        "function": "get_naver_news",
+        "iterator": "iter_naver_news",
+        "max_pages": None,
+        "enabled": True,
+    },
+    "daum_news": {
+        "name": "Daum News",
+        "icon": "📰",
+        "description": "Korean news articles from Daum search",
+        "module": ".daum_news",
+        "function": "get_daum_news",
+        "iterator": "iter_daum_news",
+        "max_pages": None,
+        "enabled": True,
     },
     "google_search": {
         "name": "Google Search",
         "icon": "🔍",
         "description": "Web search results from Google",
-        "function": "get_google_search_results"
-    }
+        "module": ".google_search",
+        "function": "get_google_search_results",
+        "iterator": "iter_google_search_results",
+        "max_pages": 3,
+        "enabled": True,
+    },
+    "youtube": {
+        "name": "YouTube",
+        "icon": "▶️",
+        "description": "Video content from YouTube",
+        "module": ".youtube",
+        "function": "get_youtube_videos",
+        "iterator": "iter_youtube_videos",
+        "max_pages": 3,
+        "enabled": True,
+    },
+    "naver_blog": {
+        "name": "Naver Blog",
+        "icon": "📝",
+        "description": "Blog posts from Naver Blog",
+        "module": ".naver_blog",
+        "function": "get_naver_blog_posts",
+        "iterator": "iter_naver_blog_posts",
+        "max_pages": None,
+        "enabled": True,
+    },
+    "tistory": {
+        "name": "Tistory",
+        "icon": "📒",
+        "description": "Blog posts from Tistory",
+        "module": ".tistory",
+        "function": "get_tistory_posts",
+        "iterator": "iter_tistory_posts",
+        "max_pages": None,
+        "enabled": True,
+    },
+    "google_blogger": {
+        "name": "Google Blogger",
+        "icon": "🅱️",
+        "description": "Blog posts hosted on Blogger",
+        "module": ".google_blogger",
+        "function": "get_google_blogger_posts",
+        "iterator": "iter_google_blogger_posts",
+        "max_pages": None,
+        "enabled": True,
+    },
+    "medium": {
+        "name": "Medium",
+        "icon": "✍️",
+        "description": "Articles published on Medium",
+        "module": ".medium",
+        "function": "get_medium_articles",
+        "iterator": "iter_medium_articles",
+        "max_pages": 3,
+        "enabled": True,
+    },
+    "wordpress": {
+        "name": "WordPress",
+        "icon": "🌐",
+        "description": "Posts from popular WordPress blogs (simulated)",
+        "module": ".wordpress",
+        "function": "get_wordpress_posts",
+        "iterator": "iter_wordpress_posts",
+        "max_pages": None,
+        "enabled": True,
+    },
+    "twitter": {
+        "name": "Twitter/X",
+        "icon": "🐦",
+        "description": "Posts from Twitter/X (simulated)",
+        "module": ".twitter",
+        "function": "get_twitter_posts",
+        "iterator": "iter_twitter_posts",
+        "max_pages": 3,
+        "enabled": True,
+    },
+    "threads": {
+        "name": "Threads",
+        "icon": "🧵",
+        "description": "Posts from Threads (simulated)",
+        "module": ".threads",
+        "function": "get_threads_posts",
+        "iterator": "iter_threads_posts",
+        "max_pages": 3,
+        "enabled": True,
+    },
 }
 
+# Source key -> {"function": callable, "iterator": callable}, filled on first use
+_loaded = {}
+_load_lock = threading.Lock()
+
+def register_source(source_key, info):
+    """
+    Add or replace a source.
+
+    Args:
+        source_key (str): Key used in settings and the search page
+        info (dict): Metadata as in AVAILABLE_SOURCES; instead of module/function names
+            it may hold the callables directly under "function" and "iterator", or an
+            importlib.metadata EntryPoint under "entry_point" that is loaded on first use
+    """
+    entry = {
+        "name": source_key.replace('_', ' ').title(),
+        "icon": "🔌",
+        "description": "",
+        "module": None,
+        "iterator": None,
+        "max_pages": None,
+        "enabled": True,
+    }
+    entry.update(info)
+    AVAILABLE_SOURCES[source_key] = entry
+    _loaded.pop(source_key, None)
+
+def _discover_entry_points():
+    """Register sources published by installed packages"""
+    try:
+        from importlib.metadata import entry_points
+        try:
+            found = entry_points(group=ENTRY_POINT_GROUP)
+        except TypeError:
+            # Python < 3.10
+            found = entry_points().get(ENTRY_POINT_GROUP, [])
+    except Exception as e:
+        print(f"Could not read source entry points: {str(e)}")
+        return
+
+    for entry_point in found:
+        if entry_point.name in AVAILABLE_SOURCES:
+            continue
+        info = {"entry_point": entry_point}
+        # Distribution metadata is read from disk without importing the plugin
+        dist = getattr(entry_point, 'dist', None)
+        try:
+            summary = dist.metadata['Summary'] if dist is not None else None
+        except Exception:
+            summary = None
+        if summary:
+            info["description"] = summary
+        register_source(entry_point.name, info)
+
+def _load_entry_point(source_key, info):
+    # Import a plugin on first use and fold what it provides into its entry
+    entry_point = info.pop("entry_point")
+    try:
+        target = entry_point.load()
+    except Exception as e:
+        print(f"Could not load source plugin {source_key}: {str(e)}")
+        return
+
+    if isinstance(target, dict):
+        info.update(target)
+    elif callable(target):
+        info["function"] = target
+    else:
+        print(f"Ignoring source plugin {source_key}: not a dict or function")
+
+def _resolve(source_key, role):
+    info = AVAILABLE_SOURCES[source_key]
+    target = info.get(role)
+    if target is None or callable(target):
+        return target
+    # Built-in modules are named relative to this package, plugins by their full name
+    module = importlib.import_module(info["module"], __package__)
+    return getattr(module, target, None)
+
+def _load(source_key):
+    if source_key not in _loaded:
+        with _load_lock:
+            if source_key not in _loaded:
+                info = AVAILABLE_SOURCES[source_key]
+                if "entry_point" in info:
+                    _load_entry_point(source_key, info)
+                _loaded[source_key] = {
+                    "function": _resolve(source_key, "function"),
+                    "iterator": _resolve(source_key, "iterator"),
+                }
+    return _loaded[source_key]
+
 def get_source_function(source_key):
-    """Get the function for a specific source"""
-    if source_key not in AVAILABLE_SOURCES:
+    """
+    Get the function for a specific source, importing its module on first use.
+
+    Args:
+        source_key (str): Source key, e.g. "naver_news"
+
+    Returns:
+        callable: The source's get_* function, or None if the source is unknown or disabled
+    """
+    if source_key not in AVAILABLE_SOURCES or not AVAILABLE_SOURCES[source_key].get("enabled", True):
         return None
-        
-    function_name = AVAILABLE_SOURCES[source_key]["function"]
-    
-    # Import the appropriate function
-    if function_name == "get_naver_news":
-        from .naver_news import get_naver_news
-        return get_naver_news
-    elif function_name == "get_google_search_results":
-        # This is defined in the main app for now
-        from ..app import get_google_search_results
-        return get_google_search_results
-    
-    return None 
\ No newline at end of file
+    return _load(source_key)["function"]
+
+def get_source_iterator(source_key):
+    """
+    Get the streaming iter_* function for a specific source.
+
+    Sources without one (e.g. plugins that only provide a get_* function) are
+    streamed by iterating over the get_* result.
+
+    Args:
+        source_key (str): Source key, e.g. "naver_news"
+
+    Returns:
+        callable: Called as (keyword, max_pages=..., start_page=...) and returning an iterator,
+            or None if the source is unknown or disabled
+    """
+    function = get_source_function(source_key)
+    if function is None:
+        return None
+    iterator = _load(source_key)["iterator"]
+    if iterator is None:
+        return lambda *args, **kwargs: iter(function(*args, **kwargs))
+    return iterator
+
+def get_max_pages(source_key, pages):
+    """
+    Cap a requested page count at the source's max_pages.
+
+    Args:
+        source_key (str): Source key
+        pages (int): Pages requested
+
+    Returns:
+        int: Pages to fetch from this source
+    """
+    limit = AVAILABLE_SOURCES.get(source_key, {}).get("max_pages")
+    return min(pages, limit) if limit else pages
+
+_discover_entry_points()
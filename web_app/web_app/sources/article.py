@@ -0,0 +1,133 @@
+"""
+Compact record for one search result.
+
+Results used to be plain dictionaries, which cost a hash table per row. An
+Article keeps the known columns in __slots__ instead and behaves like a
+dictionary keyed by the usual column names (제목, 내용, 언론사, 날짜, 링크,
+Source, Cluster, 본문), so code written against dictionaries keeps working:
+article['Source'] = name, article.get('링크'), 'Cluster' in article,
+dict(article) and pd.DataFrame(articles) all do what they did before.
+
+Columns that repeat across many rows (언론사, 날짜, Source) are interned, so
+every result from the same publisher shares one string. Any other column a
+source adds is kept in a small per-row dictionary.
+
+Sources that cannot reach their site fall back to generated stand-in results.
+Those are flagged with mark_placeholders() (the flag is not a column, so it is
+never exported) and is_placeholder() lets callers such as the result cache
+keep them apart from real results.
+"""
+
+import sys
+from collections.abc import MutableMapping
+
+# Column -> slot, in export order
+FIELDS = {
+    '제목': 'title',
+    '내용': 'content',
+    '언론사': 'publisher',
+    '날짜': 'date',
+    '링크': 'link',
+    'Source': 'source',
+    'Cluster': 'cluster',
+    '본문': 'body',
+}
+
+# Columns whose values are shared by many rows
+INTERNED = {'언론사', '날짜', 'Source'}
+
+class Article(MutableMapping):
+    """
+    One search result, readable and writable like a dictionary of columns.
+
+    A column that has not been set is absent (KeyError, not in keys()), exactly
+    as a missing dictionary key would be.
+    """
+
+    __slots__ = tuple(FIELDS.values()) + ('extra', 'placeholder')
+
+    def __init__(self, data=(), **columns):
+        """
+        Args:
+            data (dict or iterable, optional): Columns as a mapping or (column, value) pairs
+            **columns: More columns, as for dict()
+        """
+        self.extra = None
+        self.update(data, **columns)
+
+    def __getitem__(self, column):
+        slot = FIELDS.get(column)
+        if slot is not None:
+            try:
+                return getattr(self, slot)
+            except AttributeError:
+                raise KeyError(column) from None
+        if self.extra is not None and column in self.extra:
+            return self.extra[column]
+        raise KeyError(column)
+
+    def __setitem__(self, column, value):
+        slot = FIELDS.get(column)
+        if slot is None:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[column] = value
+            return
+        if column in INTERNED and type(value) is str:
+            value = sys.intern(value)
+        setattr(self, slot, value)
+
+    def __delitem__(self, column):
+        slot = FIELDS.get(column)
+        try:
+            if slot is not None:
+                delattr(self, slot)
+            elif self.extra is not None:
+                del self.extra[column]
+            else:
+                raise KeyError(column)
+        except AttributeError:
+            raise KeyError(column) from None
+
+    def __iter__(self):
+        for column, slot in FIELDS.items():
+            if hasattr(self, slot):
+                yield column
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"Article({dict(self)!r})"
+
+def mark_placeholders(rows):
+    """
+    Flag generated stand-in results.
+
+    Args:
+        rows (list): Articles made up by a source that could not fetch real ones
+
+    Returns:
+        list: The same rows
+    """
+    for row in rows:
+        row.placeholder = True
+    return rows
+
+def is_placeholder(row):
+    """Check whether a result was generated rather than fetched"""
+    return getattr(row, 'placeholder', False)
+
+def to_articles(rows):
+    """
+    Convert result dictionaries (e.g. decoded from JSON) to Articles.
+
+    Args:
+        rows (list): Dictionaries or Articles
+
+    Returns:
+        list: Articles; rows that already are Articles are kept as they are
+    """
+    return [row if isinstance(row, Article) else Article(row) for row in rows]
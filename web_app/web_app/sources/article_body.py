@@ -0,0 +1,253 @@
+"""
+Full article text for search results.
+
+Search pages only carry a snippet in 내용. add_bodies() follows each result's
+링크, extracts the article's main text and stores it in a 본문 column, which
+then flows into the Excel export and the visualizations like any other column.
+
+Articles are fetched on a thread pool of advanced.body_workers threads, with at
+most advanced.body_per_domain requests in flight to any one publisher (on top
+of the usual per-host rate limit). Extracted bodies are cached on disk by
+canonical URL, so an article that appears again in a later search, or under a
+tracking-parameter variant of its link, is never fetched twice.
+
+The main text is found the way readability-style extractors do it: well-known
+article containers of Korean news sites are tried first, otherwise every block
+is scored by the paragraphs it contains, its link density and class/id hints,
+and the best-scoring block wins.
+"""
+
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+from . import cache_db, http_client
+from .batch import ArticleBatch
+from .config import get_setting
+from .parsers import make_soup
+from .urls import canonical_url
+
+DEFAULT_WORKERS = 8
+DEFAULT_PER_DOMAIN = 2
+
+# Excel refuses cells longer than 32767 characters
+MAX_BODY_CHARS = 32000
+
+# Shorter matches of the known containers are probably not the article
+MIN_BODY_CHARS = 200
+
+# Article containers of common Korean news and blog sites, most specific first
+BODY_SELECTORS = [
+    '#dic_area',
+    '#newsct_article',
+    '#articleBodyContents',
+    '#articeBody',
+    'div.article_view',
+    '#article-view-content-div',
+    '#articleBody',
+    '.article_body',
+    '.se-main-container',
+    '.tt_article_useless_p_margin',
+    '[itemprop="articleBody"]',
+    'article',
+]
+
+# Elements that never hold article text
+STRIP_TAGS = ['script', 'style', 'noscript', 'iframe', 'form', 'nav', 'header', 'footer', 'aside', 'button', 'svg']
+
+POSITIVE_HINTS = re.compile(r'article|body|content|entry|main|news|post|story|text|view', re.IGNORECASE)
+NEGATIVE_HINTS = re.compile(r'ad-|ads|banner|comment|copyright|footer|related|reply|share|sidebar|social|sponsor|subscribe|widget', re.IGNORECASE)
+
+SCHEMA = [
+    'CREATE TABLE IF NOT EXISTS bodies (url TEXT PRIMARY KEY, body TEXT, fetched REAL)',
+]
+
+def _connect():
+    return cache_db.connect('bodies.sqlite', SCHEMA)
+
+def is_enabled():
+    """Check whether full article text should be fetched by default"""
+    return bool(get_setting('advanced', 'fetch_article_bodies', False))
+
+def get_cached(url):
+    """Return the cached body for a canonical URL, or None"""
+    row = _connect().execute('SELECT body FROM bodies WHERE url = ?', (url,)).fetchone()
+    return row[0] if row else None
+
+def store(url, body):
+    """Cache an extracted body under its canonical URL"""
+    _connect().execute(
+        'INSERT OR REPLACE INTO bodies (url, body, fetched) VALUES (?, ?, ?)',
+        (url, body, time.time())
+    )
+
+def clear():
+    """Remove every cached body"""
+    _connect().execute('DELETE FROM bodies')
+
+def _block_text(elem):
+    text = elem.get_text('\n', strip=True)
+    lines = [re.sub(r'\s+', ' ', line) for line in text.split('\n')]
+    return '\n'.join(line for line in lines if line)
+
+def _score_candidates(soup):
+    """Readability-style scoring: credit each paragraph's text to its parent and grandparent"""
+    scores = {}
+
+    for paragraph in soup.find_all(['p', 'div', 'td', 'pre']):
+        # Only text directly in the element, so nested blocks are not counted twice
+        text = ''.join(paragraph.find_all(string=True, recursive=False)).strip()
+        if len(text) < 25:
+            continue
+
+        score = 1 + text.count(',') + text.count('.') + min(len(text) // 100, 3)
+        for ancestor, share in ((paragraph.parent, 1.0), (getattr(paragraph.parent, 'parent', None), 0.5)):
+            if ancestor is None or ancestor.name in ('html', '[document]'):
+                continue
+            if id(ancestor) not in scores:
+                hints = ' '.join(ancestor.get('class', [])) + ' ' + (ancestor.get('id') or '')
+                base = 0
+                if POSITIVE_HINTS.search(hints):
+                    base += 25
+                if NEGATIVE_HINTS.search(hints):
+                    base -= 25
+                scores[id(ancestor)] = [ancestor, base]
+            scores[id(ancestor)][1] += score * share
+
+    best = None
+    best_score = 0
+    for elem, score in scores.values():
+        # Penalize blocks that are mostly links (menus, related-article lists)
+        text_length = len(elem.get_text(strip=True)) or 1
+        link_length = sum(len(a.get_text(strip=True)) for a in elem.find_all('a'))
+        score *= 1 - min(link_length / text_length, 1)
+        if score > best_score:
+            best, best_score = elem, score
+    return best
+
+def extract_main_text(html):
+    """
+    Extract the main article text from a page.
+
+    Args:
+        html (str): The article page HTML
+
+    Returns:
+        str: The article text with one paragraph per line ('' if nothing was found)
+    """
+    soup = make_soup(html)
+    try:
+        for tag in soup.find_all(STRIP_TAGS):
+            tag.decompose()
+
+        for selector in BODY_SELECTORS:
+            elem = soup.select_one(selector)
+            if elem is not None:
+                text = _block_text(elem)
+                if len(text) >= MIN_BODY_CHARS:
+                    return text[:MAX_BODY_CHARS]
+
+        best = _score_candidates(soup)
+        return _block_text(best)[:MAX_BODY_CHARS] if best is not None else ''
+    finally:
+        soup.decompose()
+
+def fetch_body(link):
+    """
+    Fetch one article and extract its text.
+
+    Returns:
+        str: The article text, or '' if it could not be fetched or read
+    """
+    try:
+        response = http_client.get(link)
+    except Exception as e:
+        print(f"Error fetching article {link}: {str(e)}")
+        return ''
+
+    if response.status_code != 200:
+        return ''
+    if 'html' not in response.headers.get('Content-Type', 'text/html'):
+        return ''
+    return extract_main_text(response.text)
+
+def _set_bodies(articles, bodies):
+    if isinstance(articles, ArticleBatch):
+        articles.set_column('본문', bodies)
+    else:
+        for article, body in zip(articles, bodies):
+            article['본문'] = body
+    return articles
+
+def add_bodies(articles, progress=None, workers=None, per_domain=None):
+    """
+    Add the full article text to each result as 본문.
+
+    Args:
+        articles (list or ArticleBatch): Results with a 링크 value; updated in place
+        progress (callable, optional): Called as progress(done, total) from the calling thread
+        workers (int, optional): Fetch threads, defaults to advanced.body_workers
+        per_domain (int, optional): Concurrent requests per publisher, defaults to advanced.body_per_domain
+
+    Returns:
+        list or ArticleBatch: The same articles
+    """
+    if workers is None:
+        workers = get_setting('advanced', 'body_workers', DEFAULT_WORKERS)
+    if per_domain is None:
+        per_domain = get_setting('advanced', 'body_per_domain', DEFAULT_PER_DOMAIN)
+
+    if isinstance(articles, ArticleBatch):
+        links = articles.column('링크')
+    else:
+        links = [article.get('링크') for article in articles]
+    bodies = [''] * len(links)
+
+    # Group results by canonical URL so duplicates are fetched once
+    pending = {}
+    for index, link in enumerate(links):
+        key = canonical_url(link) if link else ''
+        if not key.startswith('http'):
+            continue
+
+        cached = get_cached(key)
+        if cached is not None:
+            bodies[index] = cached
+        else:
+            pending.setdefault(key, (link, []))[1].append(index)
+
+    total = len(pending)
+    if not total:
+        return _set_bodies(articles, bodies)
+
+    domain_slots = {}
+    domain_lock = threading.Lock()
+
+    def fetch(key, link):
+        domain = urlsplit(key).netloc
+        with domain_lock:
+            slots = domain_slots.setdefault(domain, threading.Semaphore(max(1, per_domain)))
+        with slots:
+            return fetch_body(link)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {executor.submit(fetch, key, link): key for key, (link, _) in pending.items()}
+        for done, future in enumerate(as_completed(futures), start=1):
+            key = futures[future]
+            try:
+                body = future.result()
+            except Exception as e:
+                print(f"Error extracting article {key}: {str(e)}")
+                body = ''
+
+            if body:
+                store(key, body)
+            for index in pending[key][1]:
+                bodies[index] = body
+
+            if progress is not None:
+                progress(done, total)
+
+    return _set_bodies(articles, bodies)
@@ -0,0 +1,85 @@
+"""
+Concurrent page fetching for source modules.
+
+Pages are fetched on an asyncio event loop with a global concurrency limit and a
+per-host politeness budget: a cap on simultaneous connections here, plus the
+shared per-host token bucket that http_client applies to every request.
+Results are always returned in the order of the input URLs.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from . import http_client
+from .config import get_setting
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_PER_HOST = 2
+
+async def fetch_all(urls, headers=None, concurrency=None, per_host=None, timeout=None, source=None, raw=False):
+    """
+    Fetch all URLs concurrently.
+
+    Args:
+        urls (list): URLs to fetch
+        headers (dict, optional): Extra request headers merged over the shared defaults
+        concurrency (int, optional): Maximum requests in flight overall
+        per_host (int, optional): Maximum requests in flight per host
+        timeout (float, optional): Request timeout in seconds
+        source (str, optional): Source name for retries and circuit breaking
+        raw (bool, optional): Return (bytes, encoding) pairs instead of decoded text, e.g. to
+            decode in a parse worker (see parse_pool.parse())
+
+    Returns:
+        list: Response bodies in the same order as urls (None for failed pages)
+    """
+    if concurrency is None:
+        concurrency = get_setting('advanced', 'max_concurrent_requests', DEFAULT_CONCURRENCY)
+    if per_host is None:
+        per_host = get_setting('advanced', 'per_host_connections', DEFAULT_PER_HOST)
+
+    limit = asyncio.Semaphore(max(1, concurrency))
+    host_limits = {}
+
+    async def fetch_one(url):
+        host = urlsplit(url).netloc
+        if host not in host_limits:
+            host_limits[host] = asyncio.Semaphore(max(1, per_host))
+
+        async with limit, host_limits[host]:
+            try:
+                response = await asyncio.to_thread(http_client.get, url, headers=headers, timeout=timeout, source=source)
+                if response.status_code != 200:
+                    print(f"Error: {host} returned status code {response.status_code}")
+                    return None
+                if raw:
+                    return response.content, response.encoding
+                return response.text
+            except Exception as e:
+                print(f"Error occurred while fetching {url}: {str(e)}")
+                return None
+
+    return await asyncio.gather(*(fetch_one(url) for url in urls))
+
+def run_sync(coro):
+    """Run a coroutine to completion from synchronous code"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # Already inside an event loop (e.g. a notebook): run on a helper thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+def fetch_pages(urls, headers=None, concurrency=None, per_host=None, timeout=None, source=None, raw=False):
+    """
+    Synchronous wrapper around fetch_all for use in source functions.
+
+    Returns:
+        list: Response bodies (or (bytes, encoding) pairs with raw=True) in the same order
+            as urls (None for failed pages)
+    """
+    return run_sync(fetch_all(urls, headers=headers, concurrency=concurrency, per_host=per_host, timeout=timeout,
+                              source=source, raw=raw))
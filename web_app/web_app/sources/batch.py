@@ -0,0 +1,257 @@
+"""
+Columnar storage for a set of search results.
+
+An ArticleBatch keeps one array per column instead of one record per row, so a
+search's results can be handed to the results table, the Excel export, the
+clustering and body stages and the visualizations without each of them
+rebuilding rows. Low-cardinality columns (언론사, Source) are stored as integer
+codes plus a category list and become pandas categoricals directly. The text
+columns (제목, 내용, 날짜, 링크, 본문) live in NumPy string arrays that grow
+in place, so a large result set is a handful of arrays rather than one Python
+object per cell.
+
+The search page appends results as they stream out of the sources, so no
+intermediate list of rows is built.
+"""
+
+from array import array
+
+import numpy as np
+import pandas as pd
+
+from .article import FIELDS
+
+# Columns with few distinct values, stored as codes into a category list
+CATEGORICAL = ('언론사', 'Source')
+
+# Columns stored in NumPy string arrays
+TEXT = ('제목', '내용', '날짜', '링크', '본문')
+
+try:
+    # Variable-width UTF-8 strings (NumPy 2.0+), with None for missing values
+    TEXT_DTYPE = np.dtypes.StringDType(na_object=None)
+except AttributeError:
+    TEXT_DTYPE = object
+
+# Smallest allocation for a text column; it doubles whenever it fills up
+MIN_CAPACITY = 64
+
+def _text_array(values, capacity=0):
+    # Slots past the given values are spare capacity, missing until filled
+    values = list(values)
+    text = np.full(max(len(values), capacity), None, dtype=TEXT_DTYPE)
+    text[:len(values)] = values
+    return text
+
+class ArticleBatch:
+    """Search results stored column by column"""
+
+    def __init__(self, articles=()):
+        """
+        Args:
+            articles (iterable, optional): Articles or dictionaries to start with
+        """
+        self._values = {}
+        self._text = {}
+        self._codes = {}
+        self._categories = {}
+        self._length = 0
+        self._capacity = 0
+        self._frame = None
+        self.extend(articles)
+
+    def __len__(self):
+        return self._length
+
+    def __contains__(self, column):
+        return column in self._values or column in self._text or column in self._codes
+
+    @property
+    def columns(self):
+        """Column names: the standard columns in export order, then any others in the order first seen"""
+        present = list(self._values) + list(self._text) + list(self._codes)
+        ordered = [column for column in FIELDS if column in present]
+        return ordered + [column for column in present if column not in FIELDS]
+
+    def _add_column(self, column):
+        # Rows appended before the column existed have no value
+        if column in CATEGORICAL:
+            self._codes[column] = array('i', [-1]) * self._length
+            self._categories[column] = {}
+        elif column in TEXT:
+            self._text[column] = _text_array((), self._capacity)
+        else:
+            self._values[column] = [None] * self._length
+
+    def _reserve(self, length):
+        # Grow the text arrays geometrically so appends stay amortized O(1)
+        if length <= self._capacity:
+            return
+        self._capacity = max(length, self._capacity * 2, MIN_CAPACITY)
+        for column, text in self._text.items():
+            grown = _text_array((), self._capacity)
+            grown[:self._length] = text[:self._length]
+            self._text[column] = grown
+
+    def _append_value(self, column, value):
+        if column in self._codes:
+            if value is None:
+                self._codes[column].append(-1)
+            else:
+                categories = self._categories[column]
+                self._codes[column].append(categories.setdefault(value, len(categories)))
+        elif column in self._text:
+            self._text[column][self._length] = value
+        else:
+            self._values[column].append(value)
+
+    def append(self, article, **constants):
+        """
+        Add one result.
+
+        Args:
+            article (Mapping): An Article or dictionary
+            **constants: Extra columns with the same value for this row, e.g. Source="Naver News"
+        """
+        for column in list(article) + list(constants):
+            if column not in self:
+                self._add_column(column)
+
+        self._reserve(self._length + 1)
+        for column in self.columns:
+            value = constants[column] if column in constants else article.get(column)
+            self._append_value(column, value)
+
+        self._length += 1
+        self._frame = None
+
+    def extend(self, articles, **constants):
+        """
+        Add many results, e.g. one page from a source or a source's iter_* generator.
+
+        Args:
+            articles (iterable): Articles or dictionaries, consumed as they arrive
+            **constants: Extra columns with the same value for every row, e.g. Source="Naver News"
+
+        Returns:
+            int: Number of results added
+        """
+        before = self._length
+        for article in articles:
+            self.append(article, **constants)
+        return self._length - before
+
+    def column(self, column):
+        """
+        Get one column's values.
+
+        Returns:
+            list: One value per row (None where the row has no value)
+        """
+        if column in self._codes:
+            categories = list(self._categories[column])
+            return [categories[code] if code >= 0 else None for code in self._codes[column]]
+        if column in self._text:
+            return self._text[column][:self._length].tolist()
+        if column in self._values:
+            return self._values[column]
+        return [None] * self._length
+
+    def set_column(self, column, values):
+        """
+        Replace or add a whole column.
+
+        Args:
+            column (str): Column name
+            values (list): One value per row
+        """
+        values = list(values)
+        if len(values) != self._length:
+            raise ValueError(f"Column {column} has {len(values)} values for {self._length} rows")
+
+        if column in CATEGORICAL:
+            self._codes[column] = array('i')
+            self._categories[column] = {}
+            for value in values:
+                self._append_value(column, value)
+        elif column in TEXT:
+            self._text[column] = _text_array(values, self._capacity)
+        else:
+            self._values[column] = values
+        self._frame = None
+
+    def take(self, indices):
+        """
+        Select rows by position.
+
+        Args:
+            indices (iterable): Row positions, in the order wanted
+
+        Returns:
+            ArticleBatch: A new batch with those rows
+        """
+        positions = np.fromiter(indices, dtype=np.intp)
+        selected = ArticleBatch()
+        selected._length = selected._capacity = len(positions)
+        for column in self.columns:
+            if column in self._codes:
+                codes = np.array(self._codes[column], dtype=np.int32)[positions]
+                selected._codes[column] = array('i', codes.tobytes())
+                selected._categories[column] = dict(self._categories[column])
+            elif column in self._text:
+                selected._text[column] = self._text[column][:self._length][positions]
+            else:
+                values = self._values[column]
+                selected._values[column] = [values[i] for i in positions]
+        return selected
+
+    def head(self, count):
+        """Return the first count rows as a new batch (the batch itself if it is no longer)"""
+        if count >= self._length:
+            return self
+        return self.take(range(count))
+
+    def rows(self, columns=None):
+        """
+        Iterate over rows as tuples, without building records.
+
+        Args:
+            columns (list, optional): Columns to include, defaults to all
+
+        Returns:
+            iterator: One tuple per row, in column order
+        """
+        columns = columns or self.columns
+        return zip(*(self.column(column) for column in columns))
+
+    def to_frame(self, exclude=()):
+        """
+        Get the results as a DataFrame.
+
+        The full frame is built once and reused until the batch changes; each call
+        returns a shallow copy of it, so callers may add or replace columns without
+        changing the cached frame. Categorical columns are built straight from their
+        stored codes.
+
+        Args:
+            exclude (iterable, optional): Columns to leave out, e.g. long article bodies
+
+        Returns:
+            pd.DataFrame: One row per result
+        """
+        if self._frame is None:
+            data = {}
+            for column in self.columns:
+                if column in self._codes:
+                    # A copy, so later appends can still grow the code array
+                    codes = np.array(self._codes[column], dtype=np.int32)
+                    data[column] = pd.Categorical.from_codes(codes, categories=list(self._categories[column]))
+                elif column in self._text:
+                    # Python strings for pandas, which does not take NumPy's string dtype
+                    data[column] = self._text[column][:self._length].astype(object)
+                else:
+                    data[column] = self._values[column]
+            self._frame = pd.DataFrame(data, columns=self.columns)
+
+        exclude = [column for column in exclude if column in self._frame.columns]
+        return self._frame.drop(columns=exclude) if exclude else self._frame.copy(deep=False)
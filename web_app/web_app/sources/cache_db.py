@@ -0,0 +1,40 @@
+"""
+SQLite storage shared by the on-disk caches.
+
+Each cache lives in its own database file under cache/. Connections are opened
+per thread and use WAL mode so several threads and processes can read and write
+the same cache concurrently.
+"""
+
+import os
+import sqlite3
+import threading
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache')
+
+_local = threading.local()
+
+def connect(filename, schema):
+    """
+    Get this thread's connection to a cache database.
+
+    Args:
+        filename (str): Database file name inside the cache directory
+        schema (list): SQL statements run once per connection to create tables and indexes
+
+    Returns:
+        sqlite3.Connection: Connection in autocommit mode
+    """
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    conn = connections.get(filename)
+    if conn is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        conn = sqlite3.connect(os.path.join(CACHE_DIR, filename), timeout=30, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        for statement in schema:
+            conn.execute(statement)
+        connections[filename] = conn
+    return conn
@@ -0,0 +1,53 @@
+"""
+Settings access for source modules.
+
+Source modules run outside of Streamlit (CLI, worker threads, worker processes),
+so they read settings.json directly instead of going through settings.py.
+"""
+
+import json
+import os
+
+SETTINGS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'settings.json')
+
+_cached_settings = None
+_cached_mtime = None
+
+def load_source_settings():
+    """
+    Load settings.json, re-reading it only when the file has changed.
+
+    Returns:
+        dict: The parsed settings, or an empty dict if the file is missing or invalid
+    """
+    global _cached_settings, _cached_mtime
+
+    try:
+        mtime = os.path.getmtime(SETTINGS_PATH)
+    except OSError:
+        return {}
+
+    if _cached_settings is None or mtime != _cached_mtime:
+        try:
+            with open(SETTINGS_PATH, 'r') as f:
+                _cached_settings = json.load(f)
+            _cached_mtime = mtime
+        except Exception as e:
+            print(f"Error loading settings for sources: {str(e)}")
+            return {}
+
+    return _cached_settings
+
+def get_setting(section, key, default=None):
+    """
+    Get a single setting value.
+
+    Args:
+        section (str): Settings section, e.g. "search" or "advanced"
+        key (str): Setting name within the section
+        default: Value returned when the setting is not present
+
+    Returns:
+        The configured value or the default
+    """
+    return load_source_settings().get(section, {}).get(key, default)
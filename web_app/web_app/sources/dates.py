@@ -0,0 +1,177 @@
+"""
+Normalization of the 날짜 column.
+
+Sources store dates the way the site shows them: relative Korean text such as
+"5시간 전", "3일 전" or "어제", absolute dates such as "2024.04.12." or
+"2024년 4월 12일", and occasionally English ("5 days ago", "Jan 15, 2023").
+normalize_dates() turns a whole column into timestamps, resolving relative
+dates against the time the results were fetched.
+
+The work is done once per distinct string: a column is factorized, each unique
+value is matched against precompiled patterns (with results memoized across
+calls), and the answers are broadcast back to the rows with numpy, so archives
+with millions of rows but few distinct date strings normalize quickly.
+"""
+
+import re
+from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Relative dates: "5시간 전", "3 days ago"
+RELATIVE_PATTERN = re.compile(
+    r'(\d+)\s*(초|분|시간|일|주|개월|달|년|seconds?|secs?|minutes?|mins?|hours?|hrs?|days?|weeks?|months?|years?)\s*(?:전|ago)',
+    re.IGNORECASE
+)
+
+# Absolute dates: "2024.04.12.", "2024-4-12", "2024/04/12", "2024년 4월 12일", with an optional time
+ABSOLUTE_PATTERN = re.compile(
+    r'(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})\s*일?\.?'
+    r'(?:\s*(오전|오후|AM|PM)?\s*(\d{1,2}):(\d{2})(?::(\d{2}))?)?',
+    re.IGNORECASE
+)
+
+# Words that name a day relative to today
+DAY_WORDS = {
+    '방금': 0,
+    '오늘': 0,
+    'just now': 0,
+    'today': 0,
+    '어제': 1,
+    'yesterday': 1,
+    '그제': 2,
+    '그저께': 2,
+}
+
+UNIT_OFFSETS = {
+    '초': pd.Timedelta(seconds=1),
+    '분': pd.Timedelta(minutes=1),
+    '시간': pd.Timedelta(hours=1),
+    '일': pd.Timedelta(days=1),
+    '주': pd.Timedelta(weeks=1),
+    '개월': pd.Timedelta(days=30),
+    '달': pd.Timedelta(days=30),
+    '년': pd.Timedelta(days=365),
+    'sec': pd.Timedelta(seconds=1),
+    'min': pd.Timedelta(minutes=1),
+    'h': pd.Timedelta(hours=1),
+    'd': pd.Timedelta(days=1),
+    'w': pd.Timedelta(weeks=1),
+    'mo': pd.Timedelta(days=30),
+    'y': pd.Timedelta(days=365),
+}
+
+def _unit_offset(unit):
+    unit = unit.lower()
+    if unit in UNIT_OFFSETS:
+        return UNIT_OFFSETS[unit]
+    # English units: match on the distinguishing prefix
+    for prefix in ('sec', 'min', 'mo', 'h', 'd', 'w', 'y'):
+        if unit.startswith(prefix):
+            return UNIT_OFFSETS[prefix]
+    return None
+
+@lru_cache(maxsize=4096)
+def parse_date_text(text):
+    """
+    Interpret one date string without anchoring it.
+
+    Args:
+        text (str): The raw date text
+
+    Returns:
+        tuple: ('absolute', Timestamp), ('relative', Timedelta) meaning that long
+            before the fetch time, or None if the text is not a known format
+    """
+    text = text.strip()
+    if not text:
+        return None
+
+    match = ABSOLUTE_PATTERN.search(text)
+    if match:
+        year, month, day, meridiem, hour, minute, second = match.groups()
+        hour = int(hour) if hour else 0
+        if meridiem and meridiem.upper() in ('오후', 'PM') and hour < 12:
+            hour += 12
+        elif meridiem and meridiem.upper() in ('오전', 'AM') and hour == 12:
+            hour = 0
+        try:
+            return ('absolute', pd.Timestamp(datetime(int(year), int(month), int(day), hour,
+                                                      int(minute or 0), int(second or 0))))
+        except ValueError:
+            return None
+
+    match = RELATIVE_PATTERN.search(text)
+    if match:
+        offset = _unit_offset(match.group(2))
+        if offset is not None:
+            return ('relative', offset * int(match.group(1)))
+
+    lowered = text.lower()
+    for word, days in DAY_WORDS.items():
+        if lowered.startswith(word):
+            return ('relative', pd.Timedelta(days=days))
+
+    return None
+
+def normalize_dates(values, fetched_at=None):
+    """
+    Convert a column of raw date strings into timestamps.
+
+    Args:
+        values (pd.Series or list): Raw 날짜 values; timestamps pass through unchanged
+        fetched_at (datetime or pd.Series, optional): When the rows were fetched, either
+            one time for the whole column or one per row. Defaults to now.
+
+    Returns:
+        pd.Series: datetime64 values (NaT where the text could not be read), on the input's index
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(list(values), dtype=object)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+
+    if fetched_at is None:
+        fetched_at = datetime.now()
+    if isinstance(fetched_at, pd.Series):
+        anchor = pd.to_datetime(fetched_at, errors='coerce').to_numpy(dtype='datetime64[ns]')
+    else:
+        anchor = np.datetime64(pd.Timestamp(fetched_at).to_datetime64(), 'ns')
+
+    codes, uniques = pd.factorize(series, sort=False)
+
+    absolute = np.full(len(uniques), np.datetime64('NaT'), dtype='datetime64[ns]')
+    relative = np.full(len(uniques), np.timedelta64('NaT'), dtype='timedelta64[ns]')
+    unknown = []
+
+    for i, value in enumerate(uniques):
+        if isinstance(value, (datetime, pd.Timestamp, np.datetime64)):
+            absolute[i] = pd.Timestamp(value).to_datetime64()
+            continue
+        parsed = parse_date_text(str(value))
+        if parsed is None:
+            unknown.append(i)
+        elif parsed[0] == 'absolute':
+            absolute[i] = parsed[1].to_datetime64()
+        else:
+            relative[i] = parsed[1].to_timedelta64()
+
+    # Anything else (e.g. "Jan 15, 2023") goes through pandas' own parser in one call
+    if unknown:
+        fallback = pd.to_datetime(pd.Series([str(uniques[i]) for i in unknown]), errors='coerce', format='mixed')
+        absolute[unknown] = fallback.to_numpy(dtype='datetime64[ns]')
+
+    # Broadcast the per-value answers to the rows; code -1 marks missing values
+    missing = codes < 0
+    codes = np.where(missing, 0, codes)
+    if len(uniques):
+        row_absolute = absolute[codes]
+        row_relative = relative[codes]
+    else:
+        row_absolute = np.full(len(codes), np.datetime64('NaT'), dtype='datetime64[ns]')
+        row_relative = np.full(len(codes), np.timedelta64('NaT'), dtype='timedelta64[ns]')
+
+    result = np.where(np.isnat(row_absolute), anchor - row_relative, row_absolute)
+    result[missing] = np.datetime64('NaT')
+    return pd.Series(result, index=series.index, name=series.name, dtype='datetime64[ns]')
@@ -1,82 +1,91 @@
-import requests
-from bs4 import BeautifulSoup
-import time
 import random
 from datetime import datetime
 
-def get_daum_news(keyword, max_pages=5, start_page=1):
+from . import http_client, parse_pool
+from .article import Article, mark_placeholders
+from .extract import Extractor
+from .parsers import class_strainer, make_soup
+from .pipeline import prefetch
+
+# Only the result list is built; scripts, styles and navigation are skipped
+RESULTS_STRAINER = class_strainer('ul', 'list_news')
+
+def today():
+    return datetime.now().strftime('%Y.%m.%d')
+
+# Fields of one news item
+SPEC = {
+    'name': 'Daum news',
+    'container': 'ul.list_news li',
+    'fields': {
+        '제목': {'selector': 'a.tit_main', 'required': True},
+        '내용': {'selector': 'div.desc'},
+        '언론사': {'selector': 'span.txt_info:nth-of-type(1)', 'default': 'Unknown'},
+        '날짜': {'selector': 'span.txt_info:nth-of-type(2)', 'default': today},
+        '링크': {'selector': 'a.tit_main', 'attr': 'href'},
+    },
+}
+
+EXTRACTOR = Extractor(SPEC)
+
+def build_search_url(keyword, page):
+    """Build the Daum news search URL for a result page"""
+    return f'https://search.daum.net/search?w=news&q={keyword}&p={page}'
+
+def parse_daum_news_page(html):
     """
-    Fetch news articles from Daum search based on a keyword
+    Extract news articles from one Daum news search result page
+    
+    Args:
+        html (str): The page HTML
+        
+    Returns:
+        list: List of article dictionaries with title, content, publisher, date and link
+    """
+    soup = make_soup(html, parse_only=RESULTS_STRAINER)
+    articles = EXTRACTOR(soup) or []
+    
+    # Free the tree now instead of waiting for the garbage collector
+    soup.decompose()
+    return articles
+
+def iter_daum_news(keyword, max_pages=5, start_page=1):
+    """
+    Yield news articles from Daum search based on a keyword, one page at a time
+    
+    The next page is fetched in the background while the current one is parsed.
     
     Args:
         keyword (str): Search keyword
         max_pages (int): Maximum number of pages to fetch
         start_page (int): Page to start from
         
-    Returns:
-        list: List of article dictionaries with title, content, publisher, date and link
+    Yields:
+        Article: One article with title, content, publisher, date and link, as soon as its page is parsed
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+    found = 0
     
-    articles = []
+    def fetch(page):
+        return http_client.get(build_search_url(keyword, page), source='daum_news')
     
     # Try to fetch real Daum news
     try:
-        for page in range(start_page, start_page + max_pages):
-            url = f'https://search.daum.net/search?w=news&q={keyword}&p={page}'
-            
+        for page, response, error in prefetch(range(start_page, start_page + max_pages), fetch):
             try:
-                response = requests.get(url, headers=headers, timeout=10)
+                if error is not None:
+                    raise error
                 if response.status_code != 200:
                     print(f"Error: Daum returned status code {response.status_code}")
                     break
-                    
-                soup = BeautifulSoup(response.text, 'html.parser')
                 
-                # Extract news items from Daum search
-                news_results = soup.select('ul.list_news li')
+                page_articles = parse_pool.parse(parse_daum_news_page, response.content, response.encoding)
                 
-                if not news_results:
+                if not page_articles:
                     print(f"No Daum news results found on page {page}")
                     break
                 
-                for item in news_results:
-                    try:
-                        # Extract title and link
-                        title_elem = item.select_one('a.tit_main')
-                        if not title_elem:
-                            continue
-                            
-                        title = title_elem.get_text(strip=True)
-                        link = title_elem.get('href', '')
-                        
-                        # Extract content snippet
-                        content_elem = item.select_one('div.desc')
-                        content = content_elem.get_text(strip=True) if content_elem else ""
-                        
-                        # Extract publisher
-                        publisher_elem = item.select_one('span.txt_info:nth-of-type(1)')
-                        publisher = publisher_elem.get_text(strip=True) if publisher_elem else "Unknown"
-                        
-                        # Extract date
-                        date_elem = item.select_one('span.txt_info:nth-of-type(2)')
-                        date = date_elem.get_text(strip=True) if date_elem else datetime.now().strftime('%Y.%m.%d')
-                        
-                        articles.append({
-                            '제목': title,
-                            '내용': content,
-                            '언론사': publisher,
-                            '날짜': date,
-                            '링크': link
-                        })
-                    except Exception as e:
-                        print(f"Error parsing Daum news item: {str(e)}")
-                        continue
-                
-                # Add a short delay to prevent rate limiting
-                time.sleep(random.uniform(1.0, 2.0))
+                yield from page_articles
+                found += len(page_articles)
                 
             except Exception as e:
                 print(f"Error occurred while crawling Daum page {page}: {str(e)}")
@@ -86,10 +95,22 @@ def get_daum_news(keyword, max_pages=5, start_page=1):
         print(f"Daum news crawler error: {str(e)}")
     
     # If no results were found, use placeholders
-    if not articles:
-        articles = generate_placeholder_daum_news(keyword)
+    if not found:
+        yield from generate_placeholder_daum_news(keyword)
+
+def get_daum_news(keyword, max_pages=5, start_page=1):
+    """
+    Fetch news articles from Daum search based on a keyword
     
-    return articles
+    Args:
+        keyword (str): Search keyword
+        max_pages (int): Maximum number of pages to fetch
+        start_page (int): Page to start from
+        
+    Returns:
+        list: List of article dictionaries with title, content, publisher, date and link
+    """
+    return list(iter_daum_news(keyword, max_pages, start_page))
 
 def generate_placeholder_daum_news(keyword):
     """Generate placeholder Daum news articles if real ones can't be fetched"""
@@ -128,12 +149,12 @@ def generate_placeholder_daum_news(keyword):
         # Create news link (using Daum news format)
         news_id = ''.join(random.choices('0123456789', k=10))
         
-        placeholder_articles.append({
+        placeholder_articles.append(Article({
             '제목': title,
             '내용': content,
             '언론사': publisher,
             '날짜': date_str,
             '링크': f"https://news.daum.net/article/{news_id}"
-        })
+        }))
     
-    return placeholder_articles 
\ No newline at end of file
+    return mark_placeholders(placeholder_articles) 
\ No newline at end of file
@@ -0,0 +1,265 @@
+"""
+Streaming Excel export.
+
+Results are written to the workbook row by row rather than built up as cells.
+Column widths are worked out from the values as they stream past instead of in
+a second pass over the written cells.
+
+xlsxwriter (listed in requirements.txt) is used in constant-memory mode: each
+row is flushed to a temporary file as soon as it is written and the column
+widths, tracked over every row, are applied when the file is closed, so memory
+stays flat however many rows are exported. Without it, openpyxl's write-only
+mode is used; it needs the widths before the first row, so the first
+WIDTH_SAMPLE_ROWS rows are held in memory to size the columns and only then
+written out, followed by the rest one at a time.
+
+For the search page's download button a file is rendered straight into memory
+with render_articles() and handed to the button as is; archive() then writes
+the same bytes to the downloads folder on a background thread, so the page
+neither waits on the disk nor reads the file back.
+"""
+
+import io
+import os
+import threading
+
+from .article import FIELDS
+from .batch import ArticleBatch
+
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Engines in order of preference
+ENGINES = ['xlsxwriter', 'openpyxl']
+
+# Rows used to size the columns when the widths must be known up front
+WIDTH_SAMPLE_ROWS = 1000
+
+# Limit width to prevent extremely wide columns
+MAX_WIDTH = 100
+
+def available_engines():
+    """List the Excel writers installed in this environment, preferred first"""
+    return [name for name in ENGINES if name != 'xlsxwriter' or XLSXWRITER_AVAILABLE]
+
+def order_columns(columns):
+    """
+    Put the standard columns first, in export order, followed by any others sorted by name.
+
+    Args:
+        columns (iterable): Column names
+
+    Returns:
+        list: The ordered column names
+    """
+    columns = set(columns)
+    ordered = [column for column in FIELDS if column in columns]
+    return ordered + sorted(columns - set(ordered))
+
+class ExcelStreamWriter:
+    """
+    Write rows to an .xlsx file one at a time.
+
+    Use as a context manager, or call close() when done:
+
+        with ExcelStreamWriter(filename, columns) as writer:
+            for row in rows:
+                writer.append(row)
+    """
+
+    def __init__(self, target, columns, engine=None):
+        """
+        Args:
+            target (str or file): File path or binary file object to write to
+            columns (list): Header row
+            engine (str, optional): "xlsxwriter" or "openpyxl", defaults to the first one installed
+        """
+        installed = available_engines()
+        self.engine = engine if engine in installed else installed[0]
+        self.target = target
+        self.columns = list(columns)
+        self.row_count = 0
+        self._widths = [len(str(column)) for column in self.columns]
+        self._pending = []
+
+        if self.engine == 'xlsxwriter':
+            # Keep values as text: links and titles starting with "=" must not turn into hyperlinks or formulas
+            self._workbook = xlsxwriter.Workbook(target, {
+                'constant_memory': True,
+                'strings_to_urls': False,
+                'strings_to_formulas': False,
+                'strings_to_numbers': False,
+            })
+            self._sheet = self._workbook.add_worksheet()
+            self._sheet.write_row(0, 0, self.columns)
+        else:
+            from openpyxl import Workbook
+            self._workbook = Workbook(write_only=True)
+            self._sheet = self._workbook.create_sheet()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def append(self, row):
+        """
+        Write one row.
+
+        Args:
+            row (sequence): One value per column; None leaves the cell empty
+        """
+        widths = self._widths
+        for index, value in enumerate(row):
+            if value is not None:
+                length = len(str(value))
+                if length > widths[index]:
+                    widths[index] = length
+
+        if self.engine == 'xlsxwriter':
+            self._sheet.write_row(self.row_count + 1, 0, row)
+        elif self._pending is not None:
+            self._pending.append(row)
+            if len(self._pending) >= WIDTH_SAMPLE_ROWS:
+                self._flush_sample()
+        else:
+            self._sheet.append(row)
+        self.row_count += 1
+
+    def _column_width(self, index):
+        return min(self._widths[index] + 2, MAX_WIDTH)
+
+    def _flush_sample(self):
+        # openpyxl writes column widths ahead of the rows, so they are fixed from the sample
+        from openpyxl.utils import get_column_letter
+        for index in range(len(self.columns)):
+            self._sheet.column_dimensions[get_column_letter(index + 1)].width = self._column_width(index)
+
+        self._sheet.append(self.columns)
+        for row in self._pending:
+            self._sheet.append(row)
+        self._pending = None
+
+    def close(self):
+        """Apply the column widths and finish the file"""
+        if self._workbook is None:
+            return
+        if self.engine == 'xlsxwriter':
+            for index in range(len(self.columns)):
+                self._sheet.set_column(index, index, self._column_width(index))
+            self._workbook.close()
+        else:
+            if self._pending is not None:
+                self._flush_sample()
+            self._workbook.save(self.target)
+        self._workbook = None
+
+def write_excel(rows, target, columns, engine=None):
+    """
+    Stream rows into an .xlsx file.
+
+    Args:
+        rows (iterable): One sequence of values per row, in column order
+        target (str or file): File path or binary file object to write to
+        columns (list): Header row
+        engine (str, optional): See ExcelStreamWriter
+
+    Returns:
+        int: Number of rows written
+    """
+    with ExcelStreamWriter(target, columns, engine) as writer:
+        for row in rows:
+            writer.append(row)
+    return writer.row_count
+
+def write_articles(articles, target, columns=None, engine=None):
+    """
+    Stream results into an .xlsx file.
+
+    Args:
+        articles (ArticleBatch or iterable): A batch, or Articles/dictionaries (a generator
+            such as a source's iter_* function is consumed as it goes)
+        target (str or file): File path or binary file object to write to
+        columns (list, optional): Columns to export, defaults to all of a batch's columns
+            in export order, or the standard columns for other inputs
+        engine (str, optional): See ExcelStreamWriter
+
+    Returns:
+        int: Number of rows written
+    """
+    if isinstance(articles, ArticleBatch):
+        columns = columns or order_columns(articles.columns)
+        rows = articles.rows(columns)
+    else:
+        columns = columns or ['제목', '내용', '언론사', '날짜', '링크']
+        rows = ([article.get(column) for column in columns] for article in articles)
+    return write_excel(rows, target, columns, engine)
+
+# Download formats: file extension -> MIME type
+MIME_TYPES = {
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'csv': 'text/csv',
+}
+
+def render_articles(articles, file_format='xlsx', columns=None, engine=None):
+    """
+    Render results into an in-memory file, e.g. for st.download_button.
+
+    Args:
+        articles (ArticleBatch or iterable): See write_articles()
+        file_format (str, optional): "xlsx" or "csv"
+        columns (list, optional): See write_articles()
+        engine (str, optional): See ExcelStreamWriter
+
+    Returns:
+        io.BytesIO: The finished file, positioned at the start
+    """
+    buffer = io.BytesIO()
+    if file_format == 'csv':
+        if not isinstance(articles, ArticleBatch):
+            articles = ArticleBatch(articles)
+        frame = articles.to_frame()
+        frame[columns or order_columns(articles.columns)].to_csv(buffer, index=False, encoding='utf-8')
+    elif file_format == 'xlsx':
+        write_articles(articles, buffer, columns, engine)
+    else:
+        raise ValueError(f"Unsupported export format: {file_format}")
+    buffer.seek(0)
+    return buffer
+
+def _write_file(data, filename):
+    # Written under a temporary name so a half-written file never shows up in the folder
+    partial = filename + '.part'
+    try:
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+        with open(partial, 'wb') as f:
+            f.write(data)
+        os.replace(partial, filename)
+        print(f"Data saved to {filename}")
+    except OSError as e:
+        print(f"Could not save {filename}: {str(e)}")
+
+def archive(buffer, filename, background=True):
+    """
+    Save a rendered file to disk.
+
+    Args:
+        buffer (io.BytesIO): A file from render_articles()
+        filename (str): Where to save it
+        background (bool, optional): Write on a background thread and return immediately
+
+    Returns:
+        threading.Thread: The writer thread, or None when written in the foreground
+    """
+    # A snapshot of the bytes, so the buffer stays free for the download button
+    data = buffer.getvalue()
+    if not background:
+        _write_file(data, filename)
+        return None
+    thread = threading.Thread(target=_write_file, args=(data, filename), daemon=True)
+    thread.start()
+    return thread
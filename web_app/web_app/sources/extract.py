@@ -0,0 +1,143 @@
+"""
+Declarative extraction specs for source modules.
+
+A source describes its result markup as data instead of hand-written
+select_one() chains:
+
+    SPEC = {
+        'name': 'Daum news',
+        'container': 'ul.list_news li',
+        'fields': {
+            '제목': {'selector': 'a.tit_main', 'required': True},
+            '링크': {'selector': 'a.tit_main', 'attr': 'href'},
+            '언론사': {'selector': 'span.txt_info:nth-of-type(1)', 'default': 'Unknown'},
+        },
+    }
+
+Container keys:
+    container: CSS selector, or a list of fallbacks; the first one that matches
+        anything on the page is used
+    fields: Output column -> field spec, in output order
+
+Field keys (all optional):
+    selector: CSS selector or list of fallbacks, tried in order within the item
+    attr: Attribute to read instead of the element's stripped text
+    required: Skip the item when no selector matches
+    default: Value (or zero-argument callable) used when nothing matches
+    transform: Callable applied to the extracted value
+    pattern: Regex the final value must contain, otherwise the item is skipped
+    format: Format string applied last, e.g. "Tistory - {}"
+    value: Constant value; no lookup is done
+
+Extractor compiles every selector with soupsieve once, when the source module is
+imported, so pages are matched with ready-made selector objects rather than
+re-resolving selector strings for every item.
+"""
+
+import re
+
+import soupsieve
+
+from .article import Article
+
+def _as_list(value):
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+class Extractor:
+    """Compiled form of an extraction spec"""
+
+    def __init__(self, spec):
+        self.name = spec.get('name', 'result')
+        self.containers = [soupsieve.compile(selector) for selector in _as_list(spec['container'])]
+        self.fields = []
+
+        for column, field in spec['fields'].items():
+            pattern = field.get('pattern')
+            self.fields.append({
+                'column': column,
+                'selectors': [soupsieve.compile(selector) for selector in _as_list(field.get('selector'))],
+                'attr': field.get('attr'),
+                'required': field.get('required', False),
+                'default': field.get('default', ''),
+                'transform': field.get('transform'),
+                'pattern': re.compile(pattern) if pattern else None,
+                'format': field.get('format'),
+                'has_value': 'value' in field,
+                'value': field.get('value'),
+            })
+
+    def find_items(self, soup):
+        """Return the result containers of the first container selector that matches"""
+        for container in self.containers:
+            items = container.select(soup)
+            if items:
+                return items
+        return []
+
+    def extract_item(self, item):
+        """
+        Extract one result from a container element.
+
+        Returns:
+            Article: The result, or None if a required field is missing or a pattern does not match
+        """
+        row = Article()
+        for field in self.fields:
+            if field['has_value']:
+                row[field['column']] = field['value']
+                continue
+
+            elem = None
+            for selector in field['selectors']:
+                elem = selector.select_one(item)
+                if elem is not None:
+                    break
+
+            if elem is None:
+                if field['required']:
+                    return None
+                value = field['default']() if callable(field['default']) else field['default']
+            else:
+                if field['attr']:
+                    value = elem.get(field['attr'], '')
+                else:
+                    value = elem.get_text(strip=True)
+                if field['transform']:
+                    value = field['transform'](value)
+
+            if field['pattern'] is not None and not field['pattern'].search(value or ''):
+                return None
+            if field['format']:
+                value = field['format'].format(value)
+
+            row[field['column']] = value
+        return row
+
+    def __call__(self, soup):
+        """
+        Extract every result on a parsed page.
+
+        Args:
+            soup (BeautifulSoup): The parsed page
+
+        Returns:
+            list: List of Articles, or None if no container matched
+        """
+        items = self.find_items(soup)
+        if not items:
+            return None
+
+        results = []
+        for item in items:
+            try:
+                row = self.extract_item(item)
+            except Exception as e:
+                print(f"Error parsing {self.name} item: {str(e)}")
+                continue
+            if row is not None:
+                results.append(row)
+        return results
@@ -1,99 +1,107 @@
-import requests
-from bs4 import BeautifulSoup
-import time
 import random
 import re
 from datetime import datetime, timedelta
 import urllib.parse
 
-def get_google_blogger_posts(keyword, max_pages=1, start_page=1):
+from . import http_client, parse_pool
+from .article import Article, mark_placeholders
+from .extract import Extractor
+from .parsers import class_strainer, make_soup
+from .pipeline import prefetch
+
+# Only the result blocks are built
+RESULTS_STRAINER = class_strainer('div', 'g')
+
+def today():
+    return datetime.now().strftime('%Y.%m.%d')
+
+def snippet_date(content):
+    """Find a date like "5 Mar 2024" in a result snippet, defaulting to today"""
+    date_match = re.search(r'(\d{1,2} [A-Za-z]{3} \d{4})', content)
+    if date_match:
+        try:
+            return datetime.strptime(date_match.group(1), '%d %b %Y').strftime('%Y.%m.%d')
+        except ValueError:
+            pass
+    return today()
+
+# Fields of one Google result; only Blogger links are kept
+SPEC = {
+    'name': 'Google Blogger result',
+    'container': 'div.g',
+    'fields': {
+        '제목': {'selector': 'h3', 'required': True},
+        '내용': {'selector': 'div.VwiC3b'},
+        '언론사': {'value': 'Google Blogger - Google Blogger'},
+        # The date, if any, is part of the snippet
+        '날짜': {'selector': 'div.VwiC3b', 'transform': snippet_date, 'default': today},
+        '링크': {'selector': 'a', 'attr': 'href', 'pattern': r'blogspot\.com|blogger\.com'},
+    },
+}
+
+EXTRACTOR = Extractor(SPEC)
+
+def build_search_url(keyword, page):
+    """Build the Google search URL (limited to Blogger blogs) for a result page"""
+    return f'https://www.google.com/search?q={urllib.parse.quote(keyword)}+site:blogspot.com&start={(page - 1) * 10}'
+
+def parse_google_blogger_page(html):
     """
-    Fetch blog posts from Google Blogger based on a keyword
+    Extract Blogger posts from one Google search result page
+    
+    Args:
+        html (str): The page HTML
+        
+    Returns:
+        list: List of post dictionaries, or None if the page has no search results
+    """
+    soup = make_soup(html, parse_only=RESULTS_STRAINER)
+    results = EXTRACTOR(soup)
+    
+    # Free the tree now instead of waiting for the garbage collector
+    soup.decompose()
+    return results
+
+def iter_google_blogger_posts(keyword, max_pages=1, start_page=1):
+    """
+    Yield blog posts from Google Blogger based on a keyword, one page at a time
+    
+    The next page is fetched in the background while the current one is parsed.
     
     Args:
         keyword (str): Search keyword
         max_pages (int): Maximum number of pages to fetch
         start_page (int): Page to start from
         
-    Returns:
-        list: List of post dictionaries with title, content, author, date and link
+    Yields:
+        Article: One post with title, content, author, date and link, as soon as its page is parsed
     """
-    results = []
+    found = 0
     headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36',
-        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Referer': 'https://www.google.com/',
     }
     
-    encoded_keyword = urllib.parse.quote(keyword)
+    def fetch(page):
+        # Use Google search with site:blogger.com to find Blogger posts
+        return http_client.get(build_search_url(keyword, page), headers=headers, source='google_blogger')
     
     try:
-        for page in range(start_page, start_page + max_pages):
-            # Use Google search with site:blogger.com to find Blogger posts
-            start_index = (page - 1) * 10
-            url = f'https://www.google.com/search?q={encoded_keyword}+site:blogspot.com&start={start_index}'
-            
+        for page, response, error in prefetch(range(start_page, start_page + max_pages), fetch):
             try:
-                response = requests.get(url, headers=headers, timeout=10)
+                if error is not None:
+                    raise error
                 if response.status_code != 200:
                     print(f"Error: Google search for Blogger returned status code {response.status_code}")
                     break
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                page_results = parse_pool.parse(parse_google_blogger_page, response.content, response.encoding)
                 
-                # Extract search results
-                search_results = soup.select('div.g')
-                
-                if not search_results:
+                if page_results is None:
                     print("No Google Blogger results found on page")
                     break
                 
-                for item in search_results:
-                    try:
-                        # Extract title and link
-                        title_elem = item.select_one('h3')
-                        if not title_elem:
-                            continue
-                            
-                        title = title_elem.get_text(strip=True)
-                        
-                        link_elem = item.select_one('a')
-                        link = link_elem.get('href', '') if link_elem else ""
-                        
-                        # Only include Blogger links
-                        if not ('blogspot.com' in link or 'blogger.com' in link):
-                            continue
-                        
-                        # Extract content snippet
-                        content_elem = item.select_one('div.VwiC3b')
-                        content = content_elem.get_text(strip=True) if content_elem else ""
-                        
-                        # Extract date and blog name (might be included in the snippet)
-                        blog_name = "Google Blogger"
-                        date_str = datetime.now().strftime('%Y.%m.%d')
-                        
-                        # Try to extract date from content
-                        date_match = re.search(r'(\d{1,2} [A-Za-z]{3} \d{4})', content)
-                        if date_match:
-                            try:
-                                date_obj = datetime.strptime(date_match.group(1), '%d %b %Y')
-                                date_str = date_obj.strftime('%Y.%m.%d')
-                            except:
-                                pass
-                        
-                        results.append({
-                            '제목': title,
-                            '내용': content,
-                            '언론사': f"Google Blogger - {blog_name}",
-                            '날짜': date_str,
-                            '링크': link
-                        })
-                    except Exception as e:
-                        print(f"Error parsing Google Blogger result: {str(e)}")
-                        continue
-                
-                time.sleep(random.uniform(2.0, 3.0))  # Longer delay for Google search to avoid blocking
+                yield from page_results
+                found += len(page_results)
                 
             except Exception as e:
                 print(f"Error occurred while crawling Google Blogger page {page}: {str(e)}")
@@ -103,10 +111,22 @@ def get_google_blogger_posts(keyword, max_pages=1, start_page=1):
         print(f"Google Blogger search error: {str(e)}")
     
     # If we couldn't find any results or request was blocked, use placeholders
-    if not results:
-        return generate_placeholder_blogger_posts(keyword)
+    if not found:
+        yield from generate_placeholder_blogger_posts(keyword)
+
+def get_google_blogger_posts(keyword, max_pages=1, start_page=1):
+    """
+    Fetch blog posts from Google Blogger based on a keyword
     
-    return results
+    Args:
+        keyword (str): Search keyword
+        max_pages (int): Maximum number of pages to fetch
+        start_page (int): Page to start from
+        
+    Returns:
+        list: List of post dictionaries with title, content, author, date and link
+    """
+    return list(iter_google_blogger_posts(keyword, max_pages, start_page))
 
 def generate_placeholder_blogger_posts(keyword):
     """Generate simulated Google Blogger posts for demo purposes"""
@@ -151,12 +171,12 @@ def generate_placeholder_blogger_posts(keyword):
         post_slug = title.lower().replace(' ', '-').replace(':', '').replace('?', '').replace('[', '').replace(']', '')
         post_slug = re.sub(r'[^\w\-]', '', post_slug)
         
-        placeholder_results.append({
+        placeholder_results.append(Article({
             '제목': title,
             '내용': content,
             '언론사': f"Google Blogger - {blog_name}",
             '날짜': publish_date,
             '링크': f"https://{blog_id}.blogspot.com/{datetime.now().year}/{random.randint(1, 12)}/{post_slug}.html"
-        })
+        }))
     
-    return placeholder_results 
\ No newline at end of file
+    return mark_placeholders(placeholder_results) 
\ No newline at end of file
@@ -1,101 +1,105 @@
-import requests
-from bs4 import BeautifulSoup
-import time
 import random
-import re
 from datetime import datetime
 
-def get_google_search_results(keyword, max_pages=1, start_page=1):
+from . import http_client, parse_pool
+from .article import Article, mark_placeholders
+from .extract import Extractor
+from .parsers import class_strainer, make_soup
+from .pipeline import prefetch
+from .urls import unwrap_redirect
+
+# Only the result blocks are built (both known layouts)
+RESULTS_STRAINER = class_strainer('div', ['g', 'Gx5Zad'])
+
+def clean_link(link):
+    """Remove the Google redirect from a result link"""
+    link = unwrap_redirect(link)
+    # A redirect without a usable target
+    if link.startswith('/url?'):
+        return None
+    return link
+
+def meta_source(meta_text):
+    return meta_text.split(" - ", 1)[0]
+
+def meta_date(meta_text):
+    return meta_text.split(" - ", 1)[1] if " - " in meta_text else ""
+
+# Fields of one search result; the source and date share one meta line
+SPEC = {
+    'name': 'Google',
+    'container': ['div.g', 'div.Gx5Zad'],
+    'fields': {
+        '제목': {'selector': ['h3', '.DKV0Md'], 'required': True},
+        '내용': {'selector': ['.VwiC3b', '.s3v9rd']},
+        '언론사': {'selector': ['.MUxGbd', '.NJjxre'], 'transform': meta_source},
+        '날짜': {'selector': ['.MUxGbd', '.NJjxre'], 'transform': meta_date},
+        '링크': {'selector': 'a', 'attr': 'href', 'required': True, 'transform': clean_link},
+    },
+}
+
+EXTRACTOR = Extractor(SPEC)
+
+def build_search_url(keyword, page):
+    """Build the Google search URL for a result page"""
+    return f'https://www.google.com/search?q={keyword}&start={(page - 1) * 10}'
+
+def parse_google_search_page(html):
     """
-    Fetch search results from Google based on a keyword
+    Extract search results from one Google result page
+    
+    Args:
+        html (str): The page HTML
+        
+    Returns:
+        list: List of result dictionaries with title, snippet, source, date and link
+    """
+    soup = make_soup(html, parse_only=RESULTS_STRAINER)
+    results = EXTRACTOR(soup) or []
+    
+    # Free the tree now instead of waiting for the garbage collector
+    soup.decompose()
+    return results
+
+def iter_google_search_results(keyword, max_pages=1, start_page=1):
+    """
+    Yield search results from Google based on a keyword, one page at a time
+    
+    The next page is fetched in the background while the current one is parsed.
     
     Args:
         keyword (str): Search keyword
         max_pages (int): Maximum number of pages to fetch
         start_page (int): Page to start from
         
-    Returns:
-        list: List of result dictionaries with title, snippet, source, date and link
+    Yields:
+        Article: One result with title, snippet, source, date and link, as soon as its page is parsed
     """
-    results = []
+    found = 0
     headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.5',
         'Referer': 'https://www.google.com/',
         'DNT': '1',
-        'Connection': 'keep-alive',
         'Upgrade-Insecure-Requests': '1',
     }
     
+    def fetch(page):
+        return http_client.get(build_search_url(keyword, page), headers=headers, source='google_search')
+    
     # Try to fetch real Google results
     try:
-        for page in range(start_page, start_page + max_pages):
-            # Google search URL with start parameter
-            start_idx = (page - 1) * 10
-            url = f'https://www.google.com/search?q={keyword}&start={start_idx}'
-            
+        for page, response, error in prefetch(range(start_page, start_page + max_pages), fetch):
             try:
-                response = requests.get(url, headers=headers, timeout=10)
+                if error is not None:
+                    raise error
                 if response.status_code != 200:
                     print(f"Error: Google returned status code {response.status_code}")
                     break
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Get search results
-                search_results = soup.select('div.g')
-                if not search_results:
-                    # Try another selector
-                    search_results = soup.select('div.Gx5Zad')
+                page_results = parse_pool.parse(parse_google_search_page, response.content, response.encoding)
                 
-                for result in search_results:
-                    try:
-                        # Extract title and link
-                        title_elem = result.select_one('h3') or result.select_one('.DKV0Md')
-                        link_elem = result.select_one('a')
-                        
-                        if not title_elem or not link_elem:
-                            continue
-                            
-                        title = title_elem.get_text(strip=True)
-                        link = link_elem.get('href', '')
-                        
-                        # Clean link - remove Google redirect
-                        if link.startswith('/url?'):
-                            link = re.search(r'url=([^&]+)', link)
-                            if link:
-                                link = link.group(1)
-                        
-                        # Extract snippet
-                        snippet_elem = result.select_one('.VwiC3b') or result.select_one('.s3v9rd')
-                        snippet = snippet_elem.get_text(strip=True) if snippet_elem else ""
-                        
-                        # Extract source and date
-                        meta_elem = result.select_one('.MUxGbd') or result.select_one('.NJjxre')
-                        meta_text = meta_elem.get_text(strip=True) if meta_elem else ""
-                        
-                        # Try to separate source and date
-                        source = meta_text
-                        date = ""
-                        if " - " in meta_text:
-                            parts = meta_text.split(" - ", 1)
-                            source = parts[0]
-                            date = parts[1]
-                        
-                        results.append({
-                            '제목': title,
-                            '내용': snippet,
-                            '언론사': source,
-                            '날짜': date,
-                            '링크': link
-                        })
-                    except Exception as e:
-                        print(f"Error parsing result: {str(e)}")
-                        continue
-                
-                # Random delay to avoid rate limiting
-                time.sleep(random.uniform(1.0, 3.0))
+                yield from page_results
+                found += len(page_results)
                 
             except Exception as e:
                 print(f"Error occurred while crawling Google page {page}: {str(e)}")
@@ -105,23 +109,35 @@ def get_google_search_results(keyword, max_pages=1, start_page=1):
         print(f"Google search error: {str(e)}")
     
     # If we failed to get real results or got no results, use simulated data
-    if not results:
+    if not found:
         # Generate placeholder results
-        return generate_placeholder_google_results(keyword)
+        yield from generate_placeholder_google_results(keyword)
+
+def get_google_search_results(keyword, max_pages=1, start_page=1):
+    """
+    Fetch search results from Google based on a keyword
     
-    return results
+    Args:
+        keyword (str): Search keyword
+        max_pages (int): Maximum number of pages to fetch
+        start_page (int): Page to start from
+        
+    Returns:
+        list: List of result dictionaries with title, snippet, source, date and link
+    """
+    return list(iter_google_search_results(keyword, max_pages, start_page))
 
 def generate_placeholder_google_results(keyword):
     """Generate simulated Google search results for demo purposes"""
     placeholder_results = []
     for i in range(1, random.randint(5, 12)):
-        placeholder_results.append({
+        placeholder_results.append(Article({
             '제목': f"Google result: {keyword} - Article {i}",
             '내용': f"This is a sample Google search result about {keyword}. It includes relevant information that matches the search query and might interest the user.",
             '언론사': f"google.com/sample-site-{i}",
             '날짜': datetime.now().strftime('%Y-%m-%d'),
             '링크': f"https://www.google.com/search?q={keyword.replace(' ', '+')}#{i}"
-        })
+        }))
     
     # Add some variety
     common_domains = ['medium.com', 'wikipedia.org', 'github.com', 'cnn.com', 'bbc.com', 'nytimes.com']
@@ -131,4 +147,4 @@ def generate_placeholder_google_results(keyword):
             result['언론사'] = domain
             result['링크'] = f"https://{domain}/article-about-{keyword.replace(' ', '-')}"
     
-    return placeholder_results 
\ No newline at end of file
+    return mark_placeholders(placeholder_results) 
\ No newline at end of file
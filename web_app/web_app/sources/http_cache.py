@@ -0,0 +1,147 @@
+"""
+Conditional-GET cache for source requests.
+
+Responses that carry validators (ETag or Last-Modified) are stored on disk with
+their body. The next request for the same URL sends If-None-Match /
+If-Modified-Since, and a 304 Not Modified reply is answered from the stored body
+instead of downloading the payload again. Feeds, blog APIs and other endpoints
+that support validators benefit automatically; pages without validators are
+never stored.
+
+Controlled by advanced.http_cache (on by default) and capped at
+advanced.http_cache_max_mb, trimming least recently used responses first.
+"""
+
+import json
+import time
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from . import cache_db
+from .config import get_setting
+
+DEFAULT_MAX_MB = 200
+
+# Headers that describe the original transfer rather than the stored (decoded) body
+TRANSFER_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+SCHEMA = [
+    'CREATE TABLE IF NOT EXISTS responses ('
+    'url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, headers TEXT, encoding TEXT, '
+    'body BLOB, size INTEGER, accessed REAL)',
+    'CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)',
+]
+
+def _connect():
+    return cache_db.connect('http.sqlite', SCHEMA)
+
+def is_enabled():
+    """Check whether the HTTP cache is turned on in settings"""
+    return bool(get_setting('advanced', 'http_cache', True))
+
+def lookup(url):
+    """
+    Find the stored response for a URL.
+
+    Returns:
+        dict: Stored entry with etag, last_modified, headers, encoding and body, or None
+    """
+    row = _connect().execute(
+        'SELECT etag, last_modified, headers, encoding, body FROM responses WHERE url = ?', (url,)
+    ).fetchone()
+    if row is None:
+        return None
+
+    return {
+        'url': url,
+        'etag': row[0],
+        'last_modified': row[1],
+        'headers': json.loads(row[2]),
+        'encoding': row[3],
+        'body': row[4],
+    }
+
+def validator_headers(entry):
+    """Build the conditional request headers for a stored entry"""
+    headers = {}
+    if entry['etag']:
+        headers['If-None-Match'] = entry['etag']
+    if entry['last_modified']:
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+def store(url, response):
+    """
+    Store the response for a requested URL if it is cacheable.
+
+    Only complete 200 responses with an ETag or Last-Modified header are kept,
+    and anything marked Cache-Control: no-store is skipped.
+    """
+    if response.status_code != 200:
+        return
+
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return
+    if 'no-store' in response.headers.get('Cache-Control', '').lower():
+        return
+
+    headers = {k: v for k, v in response.headers.items() if k.lower() not in TRANSFER_HEADERS}
+    body = response.content
+
+    _connect().execute(
+        'INSERT OR REPLACE INTO responses (url, etag, last_modified, headers, encoding, body, size, accessed) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+        (url, etag, last_modified, json.dumps(headers), response.encoding, body, len(body), time.time())
+    )
+    trim()
+
+def revalidated(entry, not_modified):
+    """
+    Build a full response from a stored entry after the server answered 304.
+
+    Args:
+        entry (dict): Stored entry from lookup
+        not_modified (requests.Response): The 304 response
+
+    Returns:
+        requests.Response: A 200 response carrying the stored body
+    """
+    headers = CaseInsensitiveDict(entry['headers'])
+    # The 304 may carry refreshed validators
+    for name in ('ETag', 'Last-Modified', 'Cache-Control', 'Date', 'Expires'):
+        if name in not_modified.headers:
+            headers[name] = not_modified.headers[name]
+
+    _connect().execute(
+        'UPDATE responses SET etag = ?, last_modified = ?, headers = ?, accessed = ? WHERE url = ?',
+        (headers.get('ETag'), headers.get('Last-Modified'), json.dumps(dict(headers)), time.time(), entry['url'])
+    )
+
+    response = Response()
+    response.status_code = 200
+    response.reason = 'OK'
+    response.headers = headers
+    response._content = entry['body']
+    response.encoding = entry['encoding']
+    response.url = entry['url']
+    response.request = not_modified.request
+    response.elapsed = not_modified.elapsed
+    response.from_cache = True
+    return response
+
+def trim():
+    """Remove least recently used responses beyond the size cap"""
+    max_bytes = get_setting('advanced', 'http_cache_max_mb', DEFAULT_MAX_MB) * 1024 * 1024
+    _connect().execute(
+        'DELETE FROM responses WHERE url IN ('
+        'SELECT url FROM (SELECT url, SUM(size) OVER (ORDER BY accessed DESC) AS running FROM responses) '
+        'WHERE running > ?)',
+        (max_bytes,)
+    )
+
+def clear():
+    """Remove every stored response"""
+    _connect().execute('DELETE FROM responses')
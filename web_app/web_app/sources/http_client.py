@@ -0,0 +1,141 @@
+"""
+Shared HTTP client for source modules.
+
+All sources go through one pooled requests.Session so that connections (and their
+TLS sessions) are kept alive and reused per host instead of being re-established
+for every page. The session also carries the common browser headers and the
+default timeout, so source modules only pass what is specific to them.
+
+Responses with ETag/Last-Modified validators are revalidated through http_cache.
+"""
+
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import http_cache, rate_limit, resilience
+from .config import get_setting
+
+DEFAULT_TIMEOUT = 10
+POOL_HOSTS = 32
+POOL_CONNECTIONS_PER_HOST = 8
+
+# urllib3 only decodes brotli responses when a brotli module is installed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    """
+    Get the process-wide pooled session, creating it on first use.
+
+    Returns:
+        requests.Session: Session with keep-alive pools and default headers
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                per_host = max(POOL_CONNECTIONS_PER_HOST, get_setting('advanced', 'per_host_connections', 0))
+                adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=per_host)
+
+                session = requests.Session()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers.update(DEFAULT_HEADERS)
+                _session = session
+
+    return _session
+
+def get(url, headers=None, timeout=None, source=None, **kwargs):
+    """
+    Send a GET request through the shared session.
+
+    Every attempt waits for the host's rate-limit token before sending, and
+    transient failures are retried under the source's circuit breaker. When a
+    validated copy of the URL is in the HTTP cache the request is made
+    conditional, and a 304 reply is returned as the cached 200 response.
+
+    Args:
+        url (str): URL to fetch
+        headers (dict, optional): Extra headers merged over the defaults
+        timeout (float, optional): Timeout in seconds, defaults to advanced.request_timeout
+        source (str, optional): Source name for the circuit breaker, defaults to the host
+        **kwargs: Passed through to requests
+
+    Returns:
+        requests.Response: The response
+
+    Raises:
+        resilience.CircuitOpenError: If the source is failing and cooling down
+    """
+    if timeout is None:
+        timeout = get_setting('advanced', 'request_timeout', DEFAULT_TIMEOUT)
+
+    use_cache = http_cache.is_enabled() and not kwargs.get('params') and not kwargs.get('stream')
+    cached = http_cache.lookup(url) if use_cache else None
+    if cached is not None:
+        headers = dict(headers or {})
+        headers.update(http_cache.validator_headers(cached))
+
+    def send():
+        rate_limit.acquire(url)
+        return get_session().get(url, headers=headers, timeout=timeout, **kwargs)
+
+    response = resilience.call_with_retries(send, source or urlsplit(url).netloc)
+
+    if cached is not None and response.status_code == 304:
+        return http_cache.revalidated(cached, response)
+    if use_cache:
+        http_cache.store(url, response)
+    return response
+
+def post(url, json=None, headers=None, timeout=None, source=None, **kwargs):
+    """
+    Send a POST request through the shared session.
+
+    Used for JSON APIs such as YouTube's continuation endpoint. Requests are
+    rate limited and retried like get(), but never cached.
+
+    Args:
+        url (str): URL to post to
+        json (dict, optional): JSON body
+        headers (dict, optional): Extra headers merged over the defaults
+        timeout (float, optional): Timeout in seconds, defaults to advanced.request_timeout
+        source (str, optional): Source name for the circuit breaker, defaults to the host
+        **kwargs: Passed through to requests
+
+    Returns:
+        requests.Response: The response
+
+    Raises:
+        resilience.CircuitOpenError: If the source is failing and cooling down
+    """
+    if timeout is None:
+        timeout = get_setting('advanced', 'request_timeout', DEFAULT_TIMEOUT)
+
+    def send():
+        rate_limit.acquire(url)
+        return get_session().post(url, json=json, headers=headers, timeout=timeout, **kwargs)
+
+    return resilience.call_with_retries(send, source or urlsplit(url).netloc)
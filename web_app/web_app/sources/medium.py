@@ -1,123 +1,136 @@
-import requests
-from bs4 import BeautifulSoup
-import time
+from bs4 import SoupStrainer
 import random
 import re
 from datetime import datetime, timedelta
 
-def get_medium_articles(keyword, max_pages=1, start_page=1):
+from . import http_client, parse_pool
+from .article import Article, mark_placeholders
+from .extract import Extractor
+from .parsers import make_soup
+from .pipeline import prefetch
+
+# Medium's result markup changes too often to target, but skipping <head> drops its large inline styles and scripts
+RESULTS_STRAINER = SoupStrainer('body')
+
+def absolute_link(link):
+    # Medium links sometimes need the prefix
+    if link.startswith('/'):
+        return 'https://medium.com' + link
+    return link
+
+def clean_snippet(content):
+    content = re.sub(r'\s+', ' ', content).strip()  # Clean up whitespace
+    return content[:500] + ('...' if len(content) > 500 else '')
+
+def parse_medium_date(date_text):
+    """Convert Medium's relative ("5 days ago") or absolute ("Jan 15, 2023") dates"""
+    date = "Unknown date"
+    if re.search(r'\d{1,2} \w+ ago', date_text):
+        # Parse relative dates like "5 days ago"
+        match = re.search(r'(\d{1,2}) (\w+) ago', date_text)
+        if match:
+            num = int(match.group(1))
+            unit = match.group(2).lower()
+            
+            # Convert to approximate date
+            if 'minute' in unit or 'min' in unit:
+                date = datetime.now().strftime('%Y-%m-%d')
+            elif 'hour' in unit:
+                date = datetime.now().strftime('%Y-%m-%d')
+            elif 'day' in unit:
+                date = (datetime.now() - timedelta(days=num)).strftime('%Y-%m-%d')
+            elif 'week' in unit:
+                date = (datetime.now() - timedelta(weeks=num)).strftime('%Y-%m-%d')
+            elif 'month' in unit:
+                date = (datetime.now() - timedelta(days=num*30)).strftime('%Y-%m-%d')
+            elif 'year' in unit:
+                date = (datetime.now() - timedelta(days=num*365)).strftime('%Y-%m-%d')
+    elif re.search(r'\w+ \d{1,2}, \d{4}', date_text):
+        # Parse absolute dates like "Jan 15, 2023"
+        date = date_text
+    return date
+
+# Fields of one article card; Medium changes its HTML often, hence the fallbacks
+SPEC = {
+    'name': 'Medium article',
+    'container': ['div.postArticle', 'article'],
+    'fields': {
+        '제목': {'selector': ['h3', 'h2'], 'required': True},
+        '내용': {'selector': ['div.postArticle-content', 'section[aria-label="Post preview"]'], 'transform': clean_snippet},
+        '언론사': {'selector': ['a[data-user-id]', 'div[aria-label="Author"]'], 'default': 'Unknown Author', 'format': 'Medium - {}'},
+        '날짜': {'selector': ['time', 'div.postMetaInline'], 'transform': parse_medium_date, 'default': 'Unknown date'},
+        '링크': {'selector': ['a[data-post-id]', 'a[href*="medium.com"]'], 'attr': 'href', 'required': True, 'transform': absolute_link},
+    },
+}
+
+EXTRACTOR = Extractor(SPEC)
+
+def build_search_url(keyword, page):
+    """Build the Medium search URL for a result page"""
+    url = f'https://medium.com/search?q={keyword}'
+    if page > 1:
+        # Medium search pagination is not straightforward
+        # This is an approximation
+        url = f'{url}&page={page}'
+    return url
+
+def parse_medium_page(html):
     """
-    Fetch blog posts from Medium based on a keyword
+    Extract articles from one Medium search result page
+    
+    Args:
+        html (str): The page HTML
+        
+    Returns:
+        list: List of article dictionaries, or None if the page has no articles
+    """
+    soup = make_soup(html, parse_only=RESULTS_STRAINER)
+    results = EXTRACTOR(soup)
+    
+    # Free the tree now instead of waiting for the garbage collector
+    soup.decompose()
+    return results
+
+def iter_medium_articles(keyword, max_pages=1, start_page=1):
+    """
+    Yield blog posts from Medium based on a keyword, one page at a time
+    
+    The next page is fetched in the background while the current one is parsed.
     
     Args:
         keyword (str): Search keyword
         max_pages (int): Maximum number of pages to fetch
         start_page (int): Page to start from
         
-    Returns:
-        list: List of article dictionaries with title, content, author, date and link
+    Yields:
+        Article: One article with title, content, author, date and link, as soon as its page is parsed
     """
-    results = []
+    found = 0
     headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36',
         'Accept-Language': 'en-US,en;q=0.9',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
     }
     
+    def fetch(page):
+        return http_client.get(build_search_url(keyword, page), headers=headers, source='medium')
+    
     # Try to fetch real Medium results
     try:
-        for page in range(start_page, start_page + max_pages):
-            url = f'https://medium.com/search?q={keyword}'
-            if page > 1:
-                # Medium search pagination is not straightforward
-                # This is an approximation
-                url = f'{url}&page={page}'
-                
+        for page, response, error in prefetch(range(start_page, start_page + max_pages), fetch):
             try:
-                response = requests.get(url, headers=headers, timeout=10)
+                if error is not None:
+                    raise error
                 if response.status_code != 200:
                     print(f"Error: Medium returned status code {response.status_code}")
                     break
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Extract articles from the search results
-                articles = soup.select('div.postArticle')
-                if not articles:
-                    # Try another selector as Medium changes its HTML structure
-                    articles = soup.select('article')
+                page_results = parse_pool.parse(parse_medium_page, response.content, response.encoding)
                 
-                if not articles:
+                if page_results is None:
                     print("No articles found on Medium page")
                     break
                 
-                for article in articles:
-                    try:
-                        # Extract title and link
-                        title_elem = article.select_one('h3') or article.select_one('h2')
-                        link_elem = article.select_one('a[data-post-id]') or article.select_one('a[href*="medium.com"]')
-                        
-                        if not title_elem or not link_elem:
-                            continue
-                            
-                        title = title_elem.get_text(strip=True)
-                        link = link_elem.get('href', '')
-                        
-                        # Medium links sometimes need the prefix
-                        if link.startswith('/'):
-                            link = 'https://medium.com' + link
-                        
-                        # Extract snippet/content
-                        content_elem = article.select_one('div.postArticle-content') or article.select_one('section[aria-label="Post preview"]')
-                        content = content_elem.get_text(strip=True) if content_elem else ""
-                        content = re.sub(r'\s+', ' ', content).strip()  # Clean up whitespace
-                        
-                        # Extract author
-                        author_elem = article.select_one('a[data-user-id]') or article.select_one('div[aria-label="Author"]')
-                        author = author_elem.get_text(strip=True) if author_elem else "Unknown Author"
-                        
-                        # Extract date (Medium usually shows relative dates)
-                        date_elem = article.select_one('time') or article.select_one('div.postMetaInline')
-                        date = "Unknown date"
-                        if date_elem:
-                            date_text = date_elem.get_text(strip=True)
-                            if re.search(r'\d{1,2} \w+ ago', date_text):
-                                # Parse relative dates like "5 days ago"
-                                match = re.search(r'(\d{1,2}) (\w+) ago', date_text)
-                                if match:
-                                    num = int(match.group(1))
-                                    unit = match.group(2).lower()
-                                    
-                                    # Convert to approximate date
-                                    if 'minute' in unit or 'min' in unit:
-                                        date = datetime.now().strftime('%Y-%m-%d')
-                                    elif 'hour' in unit:
-                                        date = datetime.now().strftime('%Y-%m-%d')
-                                    elif 'day' in unit:
-                                        date = (datetime.now() - timedelta(days=num)).strftime('%Y-%m-%d')
-                                    elif 'week' in unit:
-                                        date = (datetime.now() - timedelta(weeks=num)).strftime('%Y-%m-%d')
-                                    elif 'month' in unit:
-                                        date = (datetime.now() - timedelta(days=num*30)).strftime('%Y-%m-%d')
-                                    elif 'year' in unit:
-                                        date = (datetime.now() - timedelta(days=num*365)).strftime('%Y-%m-%d')
-                            elif re.search(r'\w+ \d{1,2}, \d{4}', date_text):
-                                # Parse absolute dates like "Jan 15, 2023"
-                                date = date_text
-                        
-                        results.append({
-                            '제목': title,
-                            '내용': content[:500] + ('...' if len(content) > 500 else ''),
-                            '언론사': f"Medium - {author}",
-                            '날짜': date,
-                            '링크': link
-                        })
-                    except Exception as e:
-                        print(f"Error parsing Medium article: {str(e)}")
-                        continue
-                
-                # Medium may rate limit requests
-                time.sleep(random.uniform(1.5, 3.0))
+                yield from page_results
+                found += len(page_results)
                 
             except Exception as e:
                 print(f"Error occurred while crawling Medium page {page}: {str(e)}")
@@ -127,11 +140,23 @@ def get_medium_articles(keyword, max_pages=1, start_page=1):
         print(f"Medium search error: {str(e)}")
     
     # If we failed to get real results or got no results, use simulated data
-    if not results:
+    if not found:
         # Generate placeholder results
-        return generate_placeholder_medium_articles(keyword)
+        yield from generate_placeholder_medium_articles(keyword)
+
+def get_medium_articles(keyword, max_pages=1, start_page=1):
+    """
+    Fetch blog posts from Medium based on a keyword
     
-    return results
+    Args:
+        keyword (str): Search keyword
+        max_pages (int): Maximum number of pages to fetch
+        start_page (int): Page to start from
+        
+    Returns:
+        list: List of article dictionaries with title, content, author, date and link
+    """
+    return list(iter_medium_articles(keyword, max_pages, start_page))
 
 def generate_placeholder_medium_articles(keyword):
     """Generate simulated Medium blog posts for demo purposes"""
@@ -180,12 +205,12 @@ def generate_placeholder_medium_articles(keyword):
         # Generate a random Medium article ID
         article_id = ''.join(random.choices('abcdefghijklmnopqrstuvwxyz0123456789', k=12))
         
-        placeholder_results.append({
+        placeholder_results.append(Article({
             '제목': title,
             '내용': content,
             '언론사': f"Medium - {author}",
             '날짜': publish_date,
             '링크': f"https://medium.com/@{author.lower().replace(' ', '')}/{keyword.lower().replace(' ', '-')}-{article_id}"
-        })
+        }))
     
-    return placeholder_results 
\ No newline at end of file
+    return mark_placeholders(placeholder_results) 
\ No newline at end of file
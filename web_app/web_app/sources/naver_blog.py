@@ -1,91 +1,95 @@
-import requests
-from bs4 import BeautifulSoup
-import time
 import random
 import re
 from datetime import datetime, timedelta
 import urllib.parse
 
-def get_naver_blog_posts(keyword, max_pages=1, start_page=1):
+from . import http_client, parse_pool
+from .article import Article, mark_placeholders
+from .extract import Extractor
+from .parsers import class_strainer, make_soup
+from .pipeline import prefetch
+
+# Only the post containers are built (both known layouts)
+RESULTS_STRAINER = class_strainer(['li', 'div'], ['bx', 'total_area'])
+
+def today():
+    return datetime.now().strftime('%Y.%m.%d')
+
+# Fields of one blog post
+SPEC = {
+    'name': 'Naver Blog post',
+    'container': ['li.bx', 'div.total_area'],
+    'fields': {
+        '제목': {'selector': 'a.api_txt_lines.total_tit', 'required': True},
+        '내용': {'selector': 'div.api_txt_lines.dsc_txt'},
+        '언론사': {'selector': 'a.sub_txt.sub_name', 'default': 'Naver Blog', 'format': 'Naver Blog - {}'},
+        '날짜': {'selector': 'span.sub_time', 'default': today},
+        '링크': {'selector': 'a.api_txt_lines.total_tit', 'attr': 'href'},
+    },
+}
+
+EXTRACTOR = Extractor(SPEC)
+
+def build_search_url(keyword, page):
+    """Build the Naver blog search URL for a result page"""
+    return f'https://search.naver.com/search.naver?where=post&sm=tab_jum&query={urllib.parse.quote(keyword)}&start={(page - 1) * 10 + 1}'
+
+def parse_naver_blog_page(html):
     """
-    Fetch blog posts from Naver Blog based on a keyword
+    Extract blog posts from one Naver Blog search result page
+    
+    Args:
+        html (str): The page HTML
+        
+    Returns:
+        list: List of post dictionaries, or None if the page has no result list
+    """
+    soup = make_soup(html, parse_only=RESULTS_STRAINER)
+    results = EXTRACTOR(soup)
+    
+    # Free the tree now instead of waiting for the garbage collector
+    soup.decompose()
+    return results
+
+def iter_naver_blog_posts(keyword, max_pages=1, start_page=1):
+    """
+    Yield blog posts from Naver Blog based on a keyword, one page at a time
+    
+    The next page is fetched in the background while the current one is parsed.
     
     Args:
         keyword (str): Search keyword
         max_pages (int): Maximum number of pages to fetch
         start_page (int): Page to start from
         
-    Returns:
-        list: List of post dictionaries with title, content, author, date and link
+    Yields:
+        Article: One post with title, content, author, date and link, as soon as its page is parsed
     """
-    results = []
+    found = 0
     headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36',
-        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Referer': 'https://search.naver.com',
     }
     
-    encoded_keyword = urllib.parse.quote(keyword)
+    def fetch(page):
+        return http_client.get(build_search_url(keyword, page), headers=headers, source='naver_blog')
     
     try:
-        for page in range(start_page, start_page + max_pages):
-            start_index = (page - 1) * 10 + 1
-            url = f'https://search.naver.com/search.naver?where=post&sm=tab_jum&query={encoded_keyword}&start={start_index}'
-            
+        for page, response, error in prefetch(range(start_page, start_page + max_pages), fetch):
             try:
-                response = requests.get(url, headers=headers, timeout=10)
+                if error is not None:
+                    raise error
                 if response.status_code != 200:
                     print(f"Error: Naver Blog search returned status code {response.status_code}")
                     break
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Extract blog posts from the search results
-                blog_items = soup.select('li.bx')
+                page_results = parse_pool.parse(parse_naver_blog_page, response.content, response.encoding)
                 
-                if not blog_items:
-                    # Try alternative selector
-                    blog_items = soup.select('div.total_area')
-                
-                if not blog_items:
+                if page_results is None:
                     print("No Naver Blog posts found on page")
                     break
                 
-                for item in blog_items:
-                    try:
-                        # Extract title and link
-                        title_elem = item.select_one('a.api_txt_lines.total_tit')
-                        if not title_elem:
-                            continue
-                            
-                        title = title_elem.get_text(strip=True)
-                        link = title_elem.get('href', '')
-                        
-                        # Extract content/description
-                        content_elem = item.select_one('div.api_txt_lines.dsc_txt')
-                        content = content_elem.get_text(strip=True) if content_elem else ""
-                        
-                        # Extract blog name and author
-                        blog_elem = item.select_one('a.sub_txt.sub_name')
-                        blog_name = blog_elem.get_text(strip=True) if blog_elem else "Naver Blog"
-                        
-                        # Extract date
-                        date_elem = item.select_one('span.sub_time')
-                        date = date_elem.get_text(strip=True) if date_elem else datetime.now().strftime('%Y.%m.%d')
-                        
-                        results.append({
-                            '제목': title,
-                            '내용': content,
-                            '언론사': f"Naver Blog - {blog_name}",
-                            '날짜': date,
-                            '링크': link
-                        })
-                    except Exception as e:
-                        print(f"Error parsing Naver Blog post: {str(e)}")
-                        continue
-                
-                time.sleep(random.uniform(1.0, 2.0))
+                yield from page_results
+                found += len(page_results)
                 
             except Exception as e:
                 print(f"Error occurred while crawling Naver Blog page {page}: {str(e)}")
@@ -95,11 +99,23 @@ def get_naver_blog_posts(keyword, max_pages=1, start_page=1):
         print(f"Naver Blog search error: {str(e)}")
     
     # If we failed to get real results or got no results, use simulated data
-    if not results:
+    if not found:
         # Generate placeholder results
-        return generate_placeholder_naver_blog_posts(keyword)
+        yield from generate_placeholder_naver_blog_posts(keyword)
+
+def get_naver_blog_posts(keyword, max_pages=1, start_page=1):
+    """
+    Fetch blog posts from Naver Blog based on a keyword
     
-    return results
+    Args:
+        keyword (str): Search keyword
+        max_pages (int): Maximum number of pages to fetch
+        start_page (int): Page to start from
+        
+    Returns:
+        list: List of post dictionaries with title, content, author, date and link
+    """
+    return list(iter_naver_blog_posts(keyword, max_pages, start_page))
 
 def generate_placeholder_naver_blog_posts(keyword):
     """Generate simulated Naver Blog posts for demo purposes"""
@@ -149,12 +165,12 @@ def generate_placeholder_naver_blog_posts(keyword):
         blog_id = ''.join(random.choice('abcdefghijklmnopqrstuvwxyz0123456789') for _ in range(8))
         post_id = ''.join(random.choice('0123456789') for _ in range(10))
         
-        placeholder_results.append({
+        placeholder_results.append(Article({
             '제목': title,
             '내용': content,
             '언론사': f"Naver Blog - {blog_name}",
             '날짜': publish_date,
             '링크': f"https://blog.naver.com/{blog_id}/{post_id}"
-        })
+        }))
     
-    return placeholder_results 
\ No newline at end of file
+    return mark_placeholders(placeholder_results) 
\ No newline at end of file
@@ -4,87 +4,129 @@ Naver News source module for News & Content Downloader.
 This module provides functionality to search and extract news articles from Naver.
 """
 
-import requests
-from bs4 import BeautifulSoup
-import time
-from datetime import datetime
+from . import parse_pool
+from .async_fetch import fetch_pages
+from .config import get_setting
+from .extract import Extractor
+from .pagination import Paginator
+from .parsers import class_strainer, make_soup
+from .pipeline import prefetch
+
+# Only the article containers are built; scripts, styles and navigation are skipped
+RESULTS_STRAINER = class_strainer('div', 'news_wrap')
+
+def build_search_url(keyword, page):
+    """Build the Naver news search URL for a result page"""
+    return f'https://search.naver.com/search.naver?where=news&query={keyword}&sm=tab_pge&sort=0&photo=0&field=0&reporter_article=&pd=0&ds=&de=&docid=&nso=so:r,p:all,a:all&mynews=0&refresh_start=0&related=0&start={((page-1)*10)+1}'
+
+# Fields of one search result
+SPEC = {
+    'name': 'Naver news',
+    'container': 'div.news_wrap.api_ani_send',
+    'fields': {
+        '제목': {'selector': 'a.news_tit', 'required': True},
+        '내용': {'selector': 'div.news_dsc', 'required': True},
+        # Publisher and date are optional
+        '언론사': {'selector': 'div.info_group a.info.press'},
+        '날짜': {'selector': 'div.info_group span.info'},
+        '링크': {'selector': 'a.news_tit', 'attr': 'href'},
+    },
+}
+
+EXTRACTOR = Extractor(SPEC)
+
+def parse_naver_news_page(html):
+    """
+    Extract articles from one Naver news search result page.
+
+    Args:
+        html (str): The page HTML
+
+    Returns:
+        list: List of dictionaries containing article data
+    """
+    soup = make_soup(html, parse_only=RESULTS_STRAINER)
+    articles = EXTRACTOR(soup) or []
+
+    # Free the tree now instead of waiting for the garbage collector
+    soup.decompose()
+    return articles
+
+def iter_naver_news(keyword, max_pages=5, start_page=1):
+    """
+    Yield news articles from Naver for a keyword search, one page at a time.
+
+    Pages are fetched concurrently in windows and parsed in page order while the
+    next window downloads. The first window is a single page and the windows grow
+    with the pages parsed (up to advanced.max_concurrent_requests), so the request
+    made ahead of the parser stays small until the keyword has proven productive.
+    The search stops early once a page adds fewer than search.min_new_articles
+    articles that were not on earlier pages.
+
+    Args:
+        keyword (str): The search term to look for
+        max_pages (int, optional): Maximum number of pages to fetch. Defaults to 5.
+        start_page (int, optional): Page to start from. Defaults to 1.
+
+    Yields:
+        Article: One article not seen on an earlier page, as soon as its page is parsed
+    """
+    end_page = start_page + max_pages if max_pages > 0 else start_page + 1
+
+    pages = list(range(start_page, end_page))
+    paginator = Paginator(len(pages))
+    window = max(1, get_setting('advanced', 'max_concurrent_requests', 8))
+
+    def fetch(batch):
+        # Fetch a window of pages concurrently, as raw bytes that are decoded where they are parsed
+        paginator.record_requests(len(batch))
+        return fetch_pages([build_search_url(keyword, page) for page in batch], source='naver_news', raw=True)
+
+    for batch, responses, error in prefetch(paginator.windows(pages, window), fetch):
+        if error is not None:
+            print(f"Error occurred while fetching pages {batch[0]}-{batch[-1]}: {str(error)}")
+            continue
+
+        # Parse the window in page order
+        for page, response in zip(batch, responses):
+            if response is None:
+                continue
+
+            try:
+                content, encoding = response
+                page_articles = parse_pool.parse(parse_naver_news_page, content, encoding)
+
+                if not page_articles:
+                    print(f"No articles found on page {page}")
+                else:
+                    print(f"Total articles found: {len(page_articles)}")
+                yield from paginator.add_page(page_articles)
+
+            except Exception as e:
+                print(f"Error occurred while parsing page {page}: {str(e)}")
+                continue
+
+            if paginator.should_stop:
+                break
+
+        if paginator.should_stop:
+            print(f"Stopped after page {page}: fewer than {paginator.min_new_items} new articles "
+                  f"({paginator.pages_saved} page requests saved)")
+            break
 
 def get_naver_news(keyword, max_pages=5, start_page=1):
     """
     Fetch news articles from Naver based on a keyword search.
-    
+
     Args:
         keyword (str): The search term to look for
         max_pages (int, optional): Maximum number of pages to fetch. Defaults to 5.
         start_page (int, optional): Page to start from. Defaults to 1.
-        
+
     Returns:
         list: List of dictionaries containing article data
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
-    articles = []
-    
-    end_page = start_page + max_pages if max_pages > 0 else start_page + 1
-    
-    for page in range(start_page, end_page):
-        url = f'https://search.naver.com/search.naver?where=news&query={keyword}&sm=tab_pge&sort=0&photo=0&field=0&reporter_article=&pd=0&ds=&de=&docid=&nso=so:r,p:all,a:all&mynews=0&refresh_start=0&related=0&start={((page-1)*10)+1}'
-        
-        try:
-            response = requests.get(url, headers=headers)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            news_items = soup.select('div.news_wrap.api_ani_send')
-            
-            if not news_items:
-                print(f"No articles found on page {page}")
-                break
-                
-            print(f"Total articles found: {len(news_items)}")
-            
-            for item in news_items:
-                title_elem = item.select_one('a.news_tit')
-                content_elem = item.select_one('div.news_dsc')
-                info_elem = item.select_one('div.info_group')
-                
-                if title_elem and content_elem:
-                    title = title_elem.get_text(strip=True)
-                    content = content_elem.get_text(strip=True)
-                    link = title_elem.get('href')
-                    
-                    # Extract publisher and date if available
-                    publisher = ""
-                    date = ""
-                    
-                    if info_elem:
-                        publisher_elem = info_elem.select_one('a.info.press')
-                        if publisher_elem:
-                            publisher = publisher_elem.get_text(strip=True)
-                            
-                        date_elem = info_elem.select_one('span.info')
-                        if date_elem:
-                            date = date_elem.get_text(strip=True)
-                    
-                    article = {
-                        '제목': title,
-                        '내용': content,
-                        '언론사': publisher,
-                        '날짜': date,
-                        '링크': link
-                    }
-                    
-                    articles.append(article)
-            
-            # Sleep to avoid being blocked
-            time.sleep(1)
-            
-        except Exception as e:
-            print(f"Error occurred while crawling page {page}: {str(e)}")
-            continue
-    
-    return articles
+    return list(iter_naver_news(keyword, max_pages, start_page))
 
 if __name__ == "__main__":
     # Test the module
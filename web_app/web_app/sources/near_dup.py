@@ -0,0 +1,200 @@
+"""
+Near-duplicate clustering of search results.
+
+Wire stories are republished by dozens of outlets with small edits to the
+title and lead, so a crawl can hold many rows of the same story under different
+URLs. Each result's 제목 and 내용 are reduced to a set of character shingles
+(which copes with Korean particles better than words) and summarized by a
+MinHash signature; results whose estimated Jaccard similarity reaches
+search.near_duplicate_similarity share a cluster.
+
+Candidate pairs come from LSH banding: signatures are cut into bands, and only
+results that agree exactly on at least one band are compared, so clustering
+stays close to linear in the number of results.
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from .batch import ArticleBatch
+from .config import get_setting
+
+DEFAULT_SIMILARITY = 0.5
+
+SHINGLE_SIZE = 3
+
+# 16 bands of 4 rows: pairs above ~0.5 similarity are almost always compared,
+# pairs below ~0.3 almost never are
+BANDS = 16
+ROWS_PER_BAND = 4
+NUM_PERMUTATIONS = BANDS * ROWS_PER_BAND
+
+# Multiply-add-shift hash functions standing in for random permutations
+_random = np.random.default_rng(20240412)
+_MULTIPLIERS = _random.integers(1, 2 ** 63, size=NUM_PERMUTATIONS, dtype=np.uint64) | np.uint64(1)
+_OFFSETS = _random.integers(0, 2 ** 63, size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+# Punctuation, brackets and symbols carry no content ("[속보]", "…", quotes)
+NOISE_PATTERN = re.compile(r'[^\w]+|_')
+
+def is_enabled():
+    """Check whether search results should be clustered"""
+    return bool(get_setting('search', 'cluster_near_duplicates', True))
+
+@lru_cache(maxsize=65536)
+def _shingle_hash(shingle):
+    return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest(), 'little')
+
+def shingles(text):
+    """
+    Split a text into overlapping character shingles, ignoring spacing and punctuation.
+
+    Args:
+        text (str): The text
+
+    Returns:
+        set: The shingles (empty if the text has no letters or digits)
+    """
+    text = NOISE_PATTERN.sub('', str(text)).lower()
+    if len(text) <= SHINGLE_SIZE:
+        return {text} if text else set()
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+def signature(text):
+    """
+    Compute the MinHash signature of a text.
+
+    Args:
+        text (str): The text to summarize
+
+    Returns:
+        np.ndarray: NUM_PERMUTATIONS uint32 values, or None if the text has no shingles
+    """
+    text_shingles = shingles(text)
+    if not text_shingles:
+        return None
+
+    hashes = np.fromiter((_shingle_hash(s) for s in text_shingles), dtype=np.uint64, count=len(text_shingles))
+    # One row per shingle, one column per hash function; uint64 arithmetic wraps as intended
+    permuted = (hashes[:, None] * _MULTIPLIERS + _OFFSETS) >> np.uint64(32)
+    return permuted.min(axis=0).astype(np.uint32)
+
+def cluster_ids(texts, similarity=None):
+    """
+    Group texts whose estimated Jaccard similarity reaches a threshold.
+
+    Args:
+        texts (iterable): One text per result
+        similarity (float, optional): Smallest similarity counted as a duplicate (0-1),
+            defaults to search.near_duplicate_similarity
+
+    Returns:
+        list: A cluster id per text; ids are numbered from 1 in order of first appearance
+    """
+    if similarity is None:
+        similarity = get_setting('search', 'near_duplicate_similarity', DEFAULT_SIMILARITY)
+
+    signatures = [signature(text) for text in texts]
+    parent = list(range(len(signatures)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets = {}
+    for i, sig in enumerate(signatures):
+        if sig is None:
+            continue
+        for band in range(BANDS):
+            key = (band, sig[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND].tobytes())
+            buckets.setdefault(key, []).append(i)
+
+    compared = set()
+    for members in buckets.values():
+        for position, i in enumerate(members):
+            for j in members[:position]:
+                if (j, i) in compared:
+                    continue
+                compared.add((j, i))
+                if np.mean(signatures[i] == signatures[j]) >= similarity:
+                    root_i, root_j = find(i), find(j)
+                    if root_i != root_j:
+                        # Keep the earliest result as the root so it becomes the representative
+                        parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    numbers = {}
+    return [numbers.setdefault(find(i), len(numbers) + 1) for i in range(len(signatures))]
+
+def _texts(rows):
+    if isinstance(rows, ArticleBatch):
+        return [f"{title or ''} {content or ''}" for title, content in rows.rows(['제목', '내용'])]
+    if isinstance(rows, pd.DataFrame):
+        title = rows['제목'] if '제목' in rows.columns else pd.Series('', index=rows.index)
+        content = rows['내용'] if '내용' in rows.columns else pd.Series('', index=rows.index)
+        return (title.fillna('').astype(str) + ' ' + content.fillna('').astype(str)).tolist()
+    return [f"{row.get('제목', '')} {row.get('내용', '')}" for row in rows]
+
+def add_clusters(rows, similarity=None):
+    """
+    Label results with the id of their near-duplicate cluster.
+
+    Args:
+        rows (list, ArticleBatch or pd.DataFrame): Results (a list or batch is updated in place)
+        similarity (float, optional): See cluster_ids()
+
+    Returns:
+        list, ArticleBatch or pd.DataFrame: The results with a Cluster value; a DataFrame is returned as a copy
+    """
+    ids = cluster_ids(_texts(rows), similarity)
+    if isinstance(rows, ArticleBatch):
+        rows.set_column('Cluster', ids)
+        return rows
+    if isinstance(rows, pd.DataFrame):
+        rows = rows.copy()
+        rows['Cluster'] = ids
+        return rows
+    for row, cluster in zip(rows, ids):
+        row['Cluster'] = cluster
+    return rows
+
+def keep_representatives(rows, similarity=None):
+    """
+    Keep the first result of each near-duplicate cluster.
+
+    Results without a Cluster value are clustered first.
+
+    Args:
+        rows (list, ArticleBatch or pd.DataFrame): The results
+        similarity (float, optional): See cluster_ids()
+
+    Returns:
+        list, ArticleBatch or pd.DataFrame: One result per cluster, in the original order
+    """
+    if isinstance(rows, ArticleBatch):
+        if 'Cluster' not in rows:
+            add_clusters(rows, similarity)
+        first = {}
+        for index, cluster in enumerate(rows.column('Cluster')):
+            first.setdefault(cluster, index)
+        return rows.take(first.values())
+
+    if isinstance(rows, pd.DataFrame):
+        if 'Cluster' not in rows.columns:
+            rows = add_clusters(rows, similarity)
+        return rows.drop_duplicates(subset='Cluster', keep='first')
+
+    if any('Cluster' not in row for row in rows):
+        add_clusters(rows, similarity)
+    seen = set()
+    representatives = []
+    for row in rows:
+        if row['Cluster'] not in seen:
+            seen.add(row['Cluster'])
+            representatives.append(row)
+    return representatives
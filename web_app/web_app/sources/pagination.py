@@ -0,0 +1,90 @@
+"""
+Adaptive pagination for source modules.
+
+A Paginator follows the pages of one search, remembers the canonical URL of every
+item it has seen, and tells the source to stop as soon as a page contributes
+fewer than search.min_new_articles new items. Search engines keep serving their
+last page (or repeats of earlier ones) past the end of the results, so deep
+crawls of niche keywords would otherwise spend most of their requests on pages
+with nothing new.
+
+Sources that fetch several pages at once take their batches from windows():
+the first window is a single page and each later one is as large as the number
+of pages parsed so far (up to the source's concurrency limit), so a keyword
+that runs dry on its second page costs two or three requests rather than a
+full window.
+"""
+
+from .config import get_setting
+from .urls import SeenIndex
+
+DEFAULT_MIN_NEW_ITEMS = 3
+
+class Paginator:
+    """Tracks seen items across the pages of one search"""
+
+    def __init__(self, total_pages, min_new_items=None, link_key='링크'):
+        """
+        Args:
+            total_pages (int): Number of pages the search would request without early stopping
+            min_new_items (int, optional): Stop when a page adds fewer new items than this
+            link_key (str, optional): Item key holding the link used for de-duplication
+        """
+        if min_new_items is None:
+            min_new_items = get_setting('search', 'min_new_articles', DEFAULT_MIN_NEW_ITEMS)
+
+        self.total_pages = total_pages
+        self.min_new_items = min_new_items
+        self.link_key = link_key
+        self.seen = SeenIndex()
+        self.pages_requested = 0
+        self.pages_parsed = 0
+        self.should_stop = False
+
+    def record_requests(self, count=1):
+        """Record page requests made (pages may be fetched ahead of parsing)"""
+        self.pages_requested += count
+
+    def add_page(self, items):
+        """
+        Record one page of items.
+
+        Args:
+            items (list): Items parsed from the page, in order
+
+        Returns:
+            list: The items not seen on earlier pages
+        """
+        new_items = self.seen.filter(items, self.link_key)
+        self.pages_parsed += 1
+
+        # A page with nothing new always ends the search
+        if not new_items or len(new_items) < self.min_new_items:
+            self.should_stop = True
+
+        return new_items
+
+    def windows(self, pages, max_window):
+        """
+        Split pages into fetch batches that grow as pages turn out to have new items.
+
+        The batches are produced lazily, so each one is sized from the pages parsed
+        by the time it is requested; none are produced once the search has stopped.
+
+        Args:
+            pages (list): Page numbers in order
+            max_window (int): Largest batch, e.g. the concurrency limit
+
+        Yields:
+            list: The next pages to fetch
+        """
+        position = 0
+        while position < len(pages) and not self.should_stop:
+            size = min(max(1, max_window), max(1, self.pages_parsed))
+            yield pages[position:position + size]
+            position += size
+
+    @property
+    def pages_saved(self):
+        """Number of page requests skipped by stopping early"""
+        return max(0, self.total_pages - self.pages_requested)
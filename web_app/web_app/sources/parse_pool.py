@@ -0,0 +1,136 @@
+"""
+Optional process pool for the parse stage.
+
+BeautifulSoup parsing is CPU-bound and holds the GIL, so parsing pages from
+several sources at once in one process runs on a single core. With
+advanced.process_pool_parsing enabled, sources hand the raw page bytes to a
+pool of worker processes instead; each worker decodes and parses the page with
+the source's normal parser and sends back compact tuples rather than pickled
+dictionaries.
+
+The pool is created on first use and kept for the life of the process, so its
+workers (which import the source modules when they start) stay warm across
+searches. Calling threads only wait on the result, which releases the GIL, so
+sources searched in parallel parse on separate cores.
+"""
+
+import importlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .article import Article
+from .config import get_setting
+
+# Result columns, in the order used for the tuples sent back by workers
+COLUMNS = ('제목', '내용', '언론사', '날짜', '링크')
+
+# Imported by each worker when it starts so the first page does not pay for it
+# (relative to this package, so they resolve under whatever name it was imported as)
+WARM_MODULES = [
+    '.naver_news',
+    '.daum_news',
+    '.google_search',
+    '.google_blogger',
+    '.naver_blog',
+    '.tistory',
+    '.medium',
+]
+
+_executor = None
+_executor_workers = None
+_executor_lock = threading.Lock()
+
+def is_enabled():
+    """Check whether page parsing should use the process pool"""
+    return bool(get_setting('advanced', 'process_pool_parsing', False))
+
+def get_worker_count():
+    """Number of worker processes, from advanced.parse_workers (0 means one per CPU)"""
+    workers = get_setting('advanced', 'parse_workers', 0)
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+def _warm_worker():
+    for module in WARM_MODULES:
+        try:
+            importlib.import_module(module, __package__)
+        except ImportError:
+            pass
+
+def get_executor():
+    """
+    Get the shared process pool, creating it on first use.
+
+    The pool is rebuilt if advanced.parse_workers has changed.
+
+    Returns:
+        ProcessPoolExecutor: The pool
+    """
+    global _executor, _executor_workers
+
+    workers = get_worker_count()
+    with _executor_lock:
+        if _executor is None or _executor_workers != workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            # spawn: forking a process that runs Streamlit's threads is not safe
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_warm_worker
+            )
+            # Workers start lazily; start them all now so they are warm for the first search
+            for _ in range(workers):
+                _executor.submit(os.getpid)
+            _executor_workers = workers
+        return _executor
+
+def shutdown():
+    """Stop the worker processes"""
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+def _decode(markup, encoding):
+    if isinstance(markup, bytes):
+        return markup.decode(encoding or 'utf-8', errors='replace')
+    return markup
+
+def _parse_in_worker(parser, markup, encoding):
+    """Worker side: parse a page and pack the rows as tuples"""
+    rows = parser(_decode(markup, encoding))
+    if rows is None:
+        return None
+    return [tuple(row.get(column, '') for column in COLUMNS) for row in rows]
+
+def parse(parser, markup, encoding=None):
+    """
+    Run a source's page parser, in the process pool when it is enabled.
+
+    Args:
+        parser (callable): Module-level page parser, e.g. parse_daum_news_page
+        markup (bytes or str): The page, preferably the raw response bytes
+        encoding (str, optional): Encoding of the bytes, defaults to UTF-8
+
+    Returns:
+        list: The parser's result (a list of Articles, or None)
+    """
+    if not is_enabled():
+        return parser(_decode(markup, encoding))
+
+    try:
+        rows = get_executor().submit(_parse_in_worker, parser, markup, encoding).result()
+    except BrokenProcessPool as e:
+        # A worker died; start a fresh pool next time and parse this page here
+        print(f"Parse worker failed, parsing in process: {str(e)}")
+        shutdown()
+        return parser(_decode(markup, encoding))
+
+    if rows is None:
+        return None
+    return [Article(zip(COLUMNS, row)) for row in rows]
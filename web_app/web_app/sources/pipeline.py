@@ -0,0 +1,82 @@
+"""
+Fetch/parse pipelining for source modules.
+
+prefetch() runs the fetch stage of a source on a background thread so that the
+next page is already downloading while the current one is being parsed. The
+producer fetches pages one at a time (keeping per-host concurrency at 1) and may
+run at most `window` pages ahead of the consumer, so memory stays bounded and a
+source that stops early only wastes that many requests.
+
+Items are drawn from their iterable only once there is room in the window. A
+source whose items are themselves batches of pages can therefore produce them
+lazily (see Paginator.windows), and each batch is sized from what the consumer
+has parsed by then rather than when the crawl started.
+"""
+
+import queue
+import threading
+
+from .config import get_setting
+
+DEFAULT_WINDOW = 1
+
+_DONE = object()
+
+def prefetch(items, fetch, window=None):
+    """
+    Fetch items ahead of the consumer, yielding results in input order.
+
+    Args:
+        items (iterable): Work items, e.g. page numbers, drawn one at a time as room frees up
+        fetch (callable): Called with each item on the producer thread
+        window (int, optional): How many items the fetch stage may run ahead,
+            defaults to advanced.prefetch_window
+
+    Yields:
+        tuple: (item, result, error) where error is the exception raised by
+            fetch (result is None in that case)
+    """
+    if window is None:
+        window = get_setting('advanced', 'prefetch_window', DEFAULT_WINDOW)
+
+    results = queue.Queue()
+    slots = threading.Semaphore(max(1, window))
+    stop = threading.Event()
+
+    def produce():
+        try:
+            iterator = iter(items)
+            while True:
+                # Wait for room in the window, giving up if the consumer went away
+                while not slots.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+
+                # Only now decide what to fetch next
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+
+                try:
+                    results.put((item, fetch(item), None))
+                except Exception as e:
+                    results.put((item, None, e))
+        finally:
+            results.put(_DONE)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            entry = results.get()
+            if entry is _DONE:
+                return
+            # The consumer now owns this page; let the producer start the next one
+            slots.release()
+            yield entry
+    finally:
+        stop.set()
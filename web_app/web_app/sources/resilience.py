@@ -0,0 +1,167 @@
+"""
+Retries and circuit breaking for source requests.
+
+Transient failures (connection errors, timeouts, 429 and 5xx responses) are
+retried a bounded number of times with full-jitter exponential backoff, honoring
+the server's Retry-After header when it sends one. Each source has a circuit
+breaker: after advanced.circuit_breaker_threshold failed requests in a row it
+opens and every request for that source fails immediately with CircuitOpenError
+until advanced.circuit_breaker_cooldown seconds have passed. The first request
+after the cool-down is a trial; success closes the circuit, failure re-opens it.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+
+from .config import get_setting
+
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 10.0
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_COOLDOWN = 300
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because its source's circuit is open"""
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one source"""
+
+    def __init__(self, name):
+        self.name = name
+        self.failures = 0
+        self.opened_at = None
+        self.open_for = 0
+        self.lock = threading.Lock()
+
+    def before_call(self):
+        """Raise CircuitOpenError if the circuit is open and still cooling down"""
+        with self.lock:
+            if self.opened_at is None:
+                return
+            remaining = self.opened_at + self.open_for - time.monotonic()
+            if remaining > 0:
+                raise CircuitOpenError(f"{self.name} is temporarily disabled after repeated errors (retry in {remaining:.0f}s)")
+            # Cool-down elapsed: let this call through as a trial
+            self.opened_at = None
+            self.failures = get_setting('advanced', 'circuit_breaker_threshold', DEFAULT_FAILURE_THRESHOLD) - 1
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self, hold_for=None):
+        """
+        Count a failed request, opening the circuit at the threshold.
+
+        Args:
+            hold_for (float, optional): Open immediately for at least this many seconds
+                (used when the server asks us to back off longer than we will wait)
+        """
+        with self.lock:
+            self.failures += 1
+            threshold = get_setting('advanced', 'circuit_breaker_threshold', DEFAULT_FAILURE_THRESHOLD)
+            if self.failures >= threshold or hold_for is not None:
+                cooldown = get_setting('advanced', 'circuit_breaker_cooldown', DEFAULT_COOLDOWN)
+                self.open_for = max(cooldown, hold_for or 0)
+                self.opened_at = time.monotonic()
+                print(f"Circuit opened for {self.name} for {self.open_for:.0f}s after {self.failures} failed requests")
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+def get_breaker(name):
+    """Get the process-wide circuit breaker for a source"""
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name)
+        return _breakers[name]
+
+def retry_after_seconds(response):
+    """
+    Parse a Retry-After header.
+
+    Returns:
+        float: Seconds to wait, or None if the header is missing or invalid
+    """
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+def backoff_delay(attempt, base_delay=DEFAULT_BASE_DELAY, max_delay=DEFAULT_MAX_DELAY):
+    """Full-jitter exponential backoff for a retry attempt (0-based)"""
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+def call_with_retries(send, source, max_retries=None, max_delay=DEFAULT_MAX_DELAY):
+    """
+    Send a request with retries, guarded by the source's circuit breaker.
+
+    Args:
+        send (callable): Sends the request and returns a requests.Response
+        source (str): Source name used to pick the circuit breaker
+        max_retries (int, optional): Retries after the first attempt, defaults to advanced.max_retries
+        max_delay (float, optional): Longest single wait; a longer Retry-After ends the retries
+
+    Returns:
+        requests.Response: The final response (possibly still an error status)
+
+    Raises:
+        CircuitOpenError: If the source's circuit is open
+        requests.RequestException: If every attempt failed without a response
+    """
+    if max_retries is None:
+        max_retries = get_setting('advanced', 'max_retries', DEFAULT_MAX_RETRIES)
+
+    breaker = get_breaker(source)
+    breaker.before_call()
+
+    response = None
+    error = None
+    hold_for = None
+
+    for attempt in range(max_retries + 1):
+        try:
+            response = send()
+            error = None
+        except requests.RequestException as e:
+            response = None
+            error = e
+        else:
+            if response.status_code not in RETRY_STATUSES:
+                breaker.record_success()
+                return response
+
+        if attempt == max_retries:
+            break
+
+        delay = backoff_delay(attempt, max_delay=max_delay)
+        if response is not None:
+            retry_after = retry_after_seconds(response)
+            if retry_after is not None:
+                if retry_after > max_delay:
+                    hold_for = retry_after
+                    break
+                delay = retry_after
+        time.sleep(delay)
+
+    breaker.record_failure(hold_for)
+    if response is not None:
+        return response
+    raise error
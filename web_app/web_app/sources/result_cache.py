@@ -0,0 +1,104 @@
+"""
+Persistent cache for source search results.
+
+Results are stored per (source, normalized keyword, page) in a SQLite database
+under cache/, so they survive restarts and are shared between Streamlit worker
+processes. Entries expire after advanced.cache_expiry_hours, and once the cache
+holds more than advanced.cache_max_entries pages the least recently used ones
+are trimmed. Nothing is read or written when advanced.cache_results is off.
+"""
+
+import json
+import time
+
+from . import cache_db
+from .article import to_articles
+from .config import get_setting
+
+DEFAULT_EXPIRY_HOURS = 24
+DEFAULT_MAX_ENTRIES = 2000
+
+SCHEMA = [
+    'CREATE TABLE IF NOT EXISTS results ('
+    'source TEXT, keyword TEXT, page INTEGER, created REAL, accessed REAL, payload TEXT, '
+    'PRIMARY KEY (source, keyword, page))',
+    'CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)',
+]
+
+def _connect():
+    return cache_db.connect('results.sqlite', SCHEMA)
+
+def normalize_keyword(keyword):
+    """Normalize a keyword so trivially different spellings share a cache entry"""
+    return ' '.join(keyword.split()).casefold()
+
+def is_enabled():
+    """Check whether result caching is turned on in settings"""
+    return bool(get_setting('advanced', 'cache_results', True))
+
+def get_expiry_seconds():
+    """Get the configured time-to-live in seconds"""
+    return get_setting('advanced', 'cache_expiry_hours', DEFAULT_EXPIRY_HOURS) * 3600
+
+def get(source, keyword, page):
+    """
+    Look up cached results for one source page.
+
+    Args:
+        source (str): Source key, e.g. "naver_news"
+        keyword (str): Search keyword
+        page (int): Page number
+
+    Returns:
+        list: The cached results as Articles, or None if missing or expired
+    """
+    key = (source, normalize_keyword(keyword), page)
+    conn = _connect()
+
+    row = conn.execute(
+        'SELECT created, payload FROM results WHERE source = ? AND keyword = ? AND page = ?', key
+    ).fetchone()
+    if row is None:
+        return None
+
+    now = time.time()
+    if now - row[0] > get_expiry_seconds():
+        conn.execute('DELETE FROM results WHERE source = ? AND keyword = ? AND page = ?', key)
+        return None
+
+    conn.execute('UPDATE results SET accessed = ? WHERE source = ? AND keyword = ? AND page = ?', (now,) + key)
+    return to_articles(json.loads(row[1]))
+
+def put(source, keyword, page, results):
+    """
+    Store results for one source page and trim the cache.
+
+    Args:
+        source (str): Source key
+        keyword (str): Search keyword
+        page (int): Page number
+        results (list): Articles (or dictionaries) to store
+    """
+    now = time.time()
+    conn = _connect()
+    conn.execute(
+        'INSERT OR REPLACE INTO results (source, keyword, page, created, accessed, payload) VALUES (?, ?, ?, ?, ?, ?)',
+        (source, normalize_keyword(keyword), page, now, now, json.dumps([dict(result) for result in results], ensure_ascii=False))
+    )
+    trim()
+
+def trim():
+    """Drop expired entries, then the least recently used ones beyond the size cap"""
+    conn = _connect()
+    conn.execute('DELETE FROM results WHERE created < ?', (time.time() - get_expiry_seconds(),))
+
+    max_entries = get_setting('advanced', 'cache_max_entries', DEFAULT_MAX_ENTRIES)
+    conn.execute(
+        'DELETE FROM results WHERE rowid IN '
+        '(SELECT rowid FROM results ORDER BY accessed DESC LIMIT -1 OFFSET ?)',
+        (max_entries,)
+    )
+
+def clear():
+    """Remove every cached result"""
+    _connect().execute('DELETE FROM results')
@@ -0,0 +1,166 @@
+"""
+Streaming access to several sources at once.
+
+Every source has an iter_* generator that yields results as each page is
+parsed. merge_sources() runs several of them side by side and yields
+(source key, article) pairs in whatever order they arrive, so the first results
+can be shown or written while slower sources are still downloading.
+
+A bounded queue sits between the sources and the consumer: a source that gets
+ahead simply waits, so memory stays flat however many pages are requested.
+"""
+
+import asyncio
+import queue
+import threading
+
+from . import get_source_iterator
+from .async_fetch import run_sync
+
+DEFAULT_QUEUE_SIZE = 100
+
+_DONE = object()
+
+def iter_source(source_key, keyword, max_pages=1, start_page=1):
+    """
+    Stream one source's results.
+
+    Args:
+        source_key (str): Source key, e.g. "naver_news"
+        keyword (str): Search keyword
+        max_pages (int, optional): Maximum number of pages to fetch
+        start_page (int, optional): Page to start from
+
+    Returns:
+        iterator: The source's iter_* generator
+
+    Raises:
+        KeyError: If the source is unknown or disabled
+    """
+    function = get_source_iterator(source_key)
+    if function is None:
+        raise KeyError(source_key)
+    return function(keyword, max_pages=max_pages, start_page=start_page)
+
+async def merge_sources(keyword, source_keys, max_pages=1, start_page=1, queue_size=None, iterate=None, concurrency=None):
+    """
+    Stream results from several sources concurrently.
+
+    Each source's generator is advanced on a worker thread; results are passed on
+    as soon as any source produces one. A source that fails is reported and
+    skipped without stopping the others.
+
+    Args:
+        keyword (str): Search keyword
+        source_keys (list): Source keys to search
+        max_pages (int or dict, optional): Pages per source, or a source key -> pages mapping
+        start_page (int, optional): Page to start from
+        queue_size (int, optional): Results buffered ahead of the consumer
+        iterate (callable, optional): Called as iterate(source_key, keyword, max_pages, start_page)
+            to open each source's stream, defaults to iter_source()
+        concurrency (int, optional): Sources streamed at the same time, defaults to all of them;
+            1 searches them one after another in the given order
+
+    Yields:
+        tuple: (source key, Article)
+    """
+    results = asyncio.Queue(maxsize=max(1, queue_size or DEFAULT_QUEUE_SIZE))
+    iterators = {}
+    iterate = iterate or iter_source
+    # Waiting sources are let in first come, first served, i.e. in source order
+    slots = asyncio.Semaphore(concurrency) if concurrency else None
+
+    async def stream(source_key):
+        pages = max_pages.get(source_key, 1) if isinstance(max_pages, dict) else max_pages
+        iterator = iterators[source_key] = iterate(source_key, keyword, pages, start_page)
+        while True:
+            article = await asyncio.to_thread(next, iterator, _DONE)
+            if article is _DONE:
+                break
+            # Waits here when the consumer falls behind
+            await results.put((source_key, article))
+
+    async def drain(source_key):
+        try:
+            if slots is None:
+                await stream(source_key)
+            else:
+                async with slots:
+                    await stream(source_key)
+        except Exception as e:
+            print(f"Error streaming {source_key}: {str(e)}")
+
+    async def drain_all():
+        try:
+            await asyncio.gather(*(drain(source_key) for source_key in source_keys))
+        finally:
+            await results.put(_DONE)
+
+    producer = asyncio.create_task(drain_all())
+    try:
+        while True:
+            entry = await results.get()
+            if entry is _DONE:
+                break
+            yield entry
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+        for iterator in iterators.values():
+            # Plugin sources without an iter_* function stream a plain iterator
+            close = getattr(iterator, 'close', None)
+            try:
+                if close is not None:
+                    close()
+            except ValueError:
+                # Still running on its worker thread; it stops at its next result
+                pass
+
+def iter_sources(keyword, source_keys, max_pages=1, start_page=1, queue_size=None, iterate=None, concurrency=None):
+    """
+    Synchronous version of merge_sources() for Streamlit pages and scripts.
+
+    The merge runs on its own event loop in a background thread. Stopping early
+    (breaking out of the loop or closing the generator) stops every source.
+
+    Yields:
+        tuple: (source key, Article)
+    """
+    results = queue.Queue(maxsize=max(1, queue_size or DEFAULT_QUEUE_SIZE))
+    stop = threading.Event()
+
+    async def pump():
+        stream = merge_sources(keyword, source_keys, max_pages, start_page, queue_size, iterate, concurrency)
+        try:
+            async for entry in stream:
+                if stop.is_set():
+                    break
+                await asyncio.to_thread(results.put, entry)
+        finally:
+            await stream.aclose()
+
+    def run():
+        try:
+            run_sync(pump())
+        finally:
+            # Nobody is reading any more once the consumer has stopped
+            if not stop.is_set():
+                results.put(_DONE)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            entry = results.get()
+            if entry is _DONE:
+                return
+            yield entry
+    finally:
+        stop.set()
+        # Unblock the pump if it is waiting for room in the queue; it stops before its next put
+        try:
+            while True:
+                results.get_nowait()
+        except queue.Empty:
+            pass
@@ -5,6 +5,8 @@ from datetime import datetime, timedelta
 import json
 import time
 
+from .article import Article, mark_placeholders
+
 def get_threads_posts(keyword, max_pages=1, start_page=1):
     """
     Fetch posts from Threads platform based on a keyword
@@ -21,6 +23,14 @@ def get_threads_posts(keyword, max_pages=1, start_page=1):
     # This is a placeholder implementation that generates simulated results
     return generate_placeholder_threads_posts(keyword, count=max_pages)
 
+def iter_threads_posts(keyword, max_pages=1, start_page=1):
+    """
+    Yield posts one at a time, like the other sources' iter_* functions
+    
+    Results are simulated, so they are all generated up front.
+    """
+    yield from get_threads_posts(keyword, max_pages, start_page)
+
 def generate_placeholder_threads_posts(keyword, count=1):
     """Generate simulated Threads posts for demo purposes"""
     results = []
@@ -108,15 +118,15 @@ def generate_placeholder_threads_posts(keyword, count=1):
         # Generate unique thread ID
         thread_id = ''.join(random.choice('0123456789abcdef') for _ in range(16))
         
-        results.append({
+        results.append(Article({
             '제목': f"@{handle}: {content[:50]}..." if len(content) > 50 else f"@{handle}: {content}",
             '내용': f"{content}\n\n{engagement} • {relative_time}",
             '언론사': f"Threads - @{handle}",
             '날짜': f"{date_str} {time_str}",
             '링크': f"https://threads.net/@{handle}/post/{thread_id}"
-        })
+        }))
     
     # Add a short delay to simulate network latency
     time.sleep(0.5)
     
-    return results 
\ No newline at end of file
+    return mark_placeholders(results) 
\ No newline at end of file
@@ -1,91 +1,93 @@
-import requests
-from bs4 import BeautifulSoup
-import time
 import random
 import re
 from datetime import datetime, timedelta
 
-def get_tistory_posts(keyword, max_pages=1, start_page=1):
+from . import http_client, parse_pool
+from .article import Article, mark_placeholders
+from .extract import Extractor
+from .parsers import class_strainer, make_soup
+from .pipeline import prefetch
+
+# Only the result containers are built (both known layouts)
+RESULTS_STRAINER = class_strainer(['ul', 'div'], ['list_info', 'c-item'])
+
+def today():
+    return datetime.now().strftime('%Y.%m.%d')
+
+# Fields of one Daum blog search result; only Tistory links are kept
+SPEC = {
+    'name': 'Tistory post',
+    'container': ['ul.list_info li', 'div.c-item'],
+    'fields': {
+        '제목': {'selector': ['a.f_link_b', 'a.tit_main'], 'required': True},
+        '내용': {'selector': ['p.f_eb', 'div.desc']},
+        '언론사': {'selector': ['div.etc_info a.f_url', 'span.f_nb'], 'default': 'Tistory Blog', 'format': 'Tistory - {}'},
+        '날짜': {'selector': ['span.f_nb', 'span.txt_info'], 'default': today},
+        '링크': {'selector': ['a.f_link_b', 'a.tit_main'], 'attr': 'href', 'pattern': r'tistory\.com'},
+    },
+}
+
+EXTRACTOR = Extractor(SPEC)
+
+def build_search_url(keyword, page):
+    """Build the Daum blog search URL (limited to Tistory) for a result page"""
+    return f'https://search.daum.net/search?w=blog&q={keyword}+site%3Atistory.com&p={page}'
+
+def parse_tistory_page(html):
     """
-    Fetch blog posts from Tistory based on a keyword
+    Extract Tistory posts from one Daum blog search result page
+    
+    Args:
+        html (str): The page HTML
+        
+    Returns:
+        list: List of post dictionaries, or None if the page has no result list
+    """
+    soup = make_soup(html, parse_only=RESULTS_STRAINER)
+    results = EXTRACTOR(soup)
+    
+    # Free the tree now instead of waiting for the garbage collector
+    soup.decompose()
+    return results
+
+def iter_tistory_posts(keyword, max_pages=1, start_page=1):
+    """
+    Yield blog posts from Tistory based on a keyword, one page at a time
+    
+    The next page is fetched in the background while the current one is parsed.
     
     Args:
         keyword (str): Search keyword
         max_pages (int): Maximum number of pages to fetch
         start_page (int): Page to start from
         
-    Returns:
-        list: List of post dictionaries with title, content, author, date and link
+    Yields:
+        Article: One post with title, content, author, date and link, as soon as its page is parsed
     """
-    results = []
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36',
-        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-    }
+    found = 0
+    
+    def fetch(page):
+        # Using Daum search to find Tistory posts (since Tistory is owned by Kakao/Daum)
+        return http_client.get(build_search_url(keyword, page), source='tistory')
     
     # Try to fetch real Tistory results
     try:
-        for page in range(start_page, start_page + max_pages):
-            # Using Daum search to find Tistory posts (since Tistory is owned by Kakao/Daum)
-            url = f'https://search.daum.net/search?w=blog&q={keyword}+site%3Atistory.com&p={page}'
-            
+        for page, response, error in prefetch(range(start_page, start_page + max_pages), fetch):
             try:
-                response = requests.get(url, headers=headers, timeout=10)
+                if error is not None:
+                    raise error
                 if response.status_code != 200:
                     print(f"Error: Tistory search returned status code {response.status_code}")
                     break
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                page_results = parse_pool.parse(parse_tistory_page, response.content, response.encoding)
                 
-                # Extract blog posts from the search results
-                blog_items = soup.select('ul.list_info li')
-                if not blog_items:
-                    # Try another selector
-                    blog_items = soup.select('div.c-item')
-                
-                if not blog_items:
+                if page_results is None:
                     print("No Tistory posts found on page")
                     break
                 
-                for item in blog_items:
-                    try:
-                        # Extract title and link
-                        title_elem = item.select_one('a.f_link_b') or item.select_one('a.tit_main')
-                        if not title_elem:
-                            continue
-                            
-                        title = title_elem.get_text(strip=True)
-                        link = title_elem.get('href', '')
-                        
-                        # Only include Tistory posts
-                        if 'tistory.com' not in link:
-                            continue
-                        
-                        # Extract content/description
-                        content_elem = item.select_one('p.f_eb') or item.select_one('div.desc')
-                        content = content_elem.get_text(strip=True) if content_elem else ""
-                        
-                        # Extract blog name and author
-                        blog_elem = item.select_one('div.etc_info a.f_url') or item.select_one('span.f_nb')
-                        blog_name = blog_elem.get_text(strip=True) if blog_elem else "Tistory Blog"
-                        
-                        # Extract date
-                        date_elem = item.select_one('span.f_nb') or item.select_one('span.txt_info')
-                        date = date_elem.get_text(strip=True) if date_elem else datetime.now().strftime('%Y.%m.%d')
-                        
-                        results.append({
-                            '제목': title,
-                            '내용': content,
-                            '언론사': f"Tistory - {blog_name}",
-                            '날짜': date,
-                            '링크': link
-                        })
-                    except Exception as e:
-                        print(f"Error parsing Tistory post: {str(e)}")
-                        continue
-                
-                time.sleep(random.uniform(1.0, 2.0))
+                yield from page_results
+                found += len(page_results)
                 
             except Exception as e:
                 print(f"Error occurred while crawling Tistory page {page}: {str(e)}")
@@ -95,11 +97,23 @@ def get_tistory_posts(keyword, max_pages=1, start_page=1):
         print(f"Tistory search error: {str(e)}")
     
     # If we failed to get real results or got no results, use simulated data
-    if not results:
+    if not found:
         # Generate placeholder results
-        return generate_placeholder_tistory_posts(keyword)
+        yield from generate_placeholder_tistory_posts(keyword)
+
+def get_tistory_posts(keyword, max_pages=1, start_page=1):
+    """
+    Fetch blog posts from Tistory based on a keyword
     
-    return results
+    Args:
+        keyword (str): Search keyword
+        max_pages (int): Maximum number of pages to fetch
+        start_page (int): Page to start from
+        
+    Returns:
+        list: List of post dictionaries with title, content, author, date and link
+    """
+    return list(iter_tistory_posts(keyword, max_pages, start_page))
 
 def generate_placeholder_tistory_posts(keyword):
     """Generate simulated Tistory blog posts for demo purposes"""
@@ -150,12 +164,12 @@ def generate_placeholder_tistory_posts(keyword):
         post_slug = title.lower().replace(' ', '-').replace(':', '').replace('?', '').replace('[', '').replace(']', '')
         post_slug = re.sub(r'[^\w\-]', '', post_slug)
         
-        placeholder_results.append({
+        placeholder_results.append(Article({
             '제목': title,
             '내용': content,
             '언론사': f"Tistory - {blog_name}",
             '날짜': publish_date,
             '링크': f"https://{blog_subdomain}.tistory.com/{random.randint(1, 999)}"
-        })
+        }))
     
-    return placeholder_results 
\ No newline at end of file
+    return mark_placeholders(placeholder_results) 
\ No newline at end of file
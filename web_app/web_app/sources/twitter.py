@@ -4,6 +4,8 @@ import re
 from datetime import datetime, timedelta
 import json
 
+from .article import Article, mark_placeholders
+
 def get_twitter_posts(keyword, max_pages=1, start_page=1):
     """
     Fetch tweets from Twitter/X based on a keyword
@@ -20,6 +22,14 @@ def get_twitter_posts(keyword, max_pages=1, start_page=1):
     # For demonstration purposes, we'll use a placeholder implementation
     return generate_placeholder_twitter_posts(keyword, max_pages)
 
+def iter_twitter_posts(keyword, max_pages=1, start_page=1):
+    """
+    Yield tweets one at a time, like the other sources' iter_* functions
+    
+    Results are simulated, so they are all generated up front.
+    """
+    yield from get_twitter_posts(keyword, max_pages, start_page)
+
 def generate_placeholder_twitter_posts(keyword, count=1):
     """Generate simulated Twitter/X posts for demo purposes"""
     results = []
@@ -123,12 +133,12 @@ def generate_placeholder_twitter_posts(keyword, count=1):
         # Generate unique tweet ID
         tweet_id = ''.join(random.choices('0123456789', k=19))
         
-        results.append({
+        results.append(Article({
             '제목': f"@{handle}: {content[:50]}...",  # Use first part of content as title
             '내용': f"{content}\n\n{engagement} • {relative_time}",
             '언론사': f"Twitter/X - @{handle}",
             '날짜': f"{date_str} {time_str}",
             '링크': f"https://twitter.com/{handle}/status/{tweet_id}"
-        })
+        }))
     
-    return results 
\ No newline at end of file
+    return mark_placeholders(results) 
\ No newline at end of file
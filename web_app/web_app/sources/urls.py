@@ -0,0 +1,174 @@
+"""
+URL helpers shared by source modules.
+
+canonical_url() reduces the many spellings of one article's address (tracking
+parameters, mobile hosts, Google redirects, Naver and Daum news mirrors) to one
+key, and SeenIndex uses those keys to drop repeated results as they arrive from
+several sources.
+"""
+
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'ref', 'ref_src',
+    'sa', 'ved', 'usg', 'ei', 'sca_esv', 'ntype', 'spm'
+}
+
+# Host prefixes of mobile and www mirrors that serve the same pages
+MIRROR_PREFIXES = ('www.', 'm.', 'mobile.')
+
+# Naver news article addresses: n.news.naver.com/mnews/article/001/0014600123,
+# news.naver.com/main/read.naver?oid=001&aid=0014600123 and their mobile forms
+NAVER_ARTICLE_PATH = re.compile(r'^/(?:mnews/)?article/(?:\w+/)?(\d{3})/(\d{10})')
+NAVER_NEWS_HOSTS = {'news.naver.com', 'n.news.naver.com', 'sports.news.naver.com', 'entertain.naver.com'}
+
+# Daum news article ids are shared by v.daum.net/v/<id> and news.daum.net/article/<id>
+DAUM_ARTICLE_PATH = re.compile(r'^/(?:v|article)/(\d{17}|\w{20,})')
+DAUM_NEWS_HOSTS = {'v.daum.net', 'news.v.daum.net', 'news.daum.net'}
+
+def unwrap_redirect(url):
+    """
+    Return the target of a Google result redirect (/url?q=... or /url?url=...).
+
+    Args:
+        url (str): A result link, relative or absolute
+
+    Returns:
+        str: The decoded target URL, or the input unchanged if it is not a redirect
+    """
+    if not url:
+        return url
+
+    parts = urlsplit(url)
+    if parts.path == '/url' and (not parts.netloc or 'google.' in parts.netloc):
+        params = dict(parse_qsl(parts.query))
+        target = params.get('q') or params.get('url')
+        if target and target.startswith('http'):
+            return target
+    return url
+
+def _strip_mirror_prefix(host):
+    for prefix in MIRROR_PREFIXES:
+        if host.startswith(prefix) and host.count('.') > 1:
+            return host[len(prefix):]
+    return host
+
+def canonical_url(url):
+    """
+    Reduce a URL to a canonical form for de-duplication.
+
+    Follows Google redirects, lowercases the scheme and host, treats http and
+    https as one, drops www/mobile host prefixes, the fragment, tracking
+    parameters (utm_* and click ids) and any trailing slash on the path, and
+    sorts the remaining query. Naver and Daum news articles map to one address
+    per article id whichever mirror they were linked from.
+
+    Args:
+        url (str): URL to normalize
+
+    Returns:
+        str: The canonical URL ('' for empty input)
+    """
+    if not url:
+        return ''
+
+    parts = urlsplit(unwrap_redirect(url.strip()))
+
+    scheme = parts.scheme.lower()
+    if scheme == 'http':
+        scheme = 'https'
+    host = _strip_mirror_prefix(parts.hostname or '')
+    if parts.port and parts.port not in (80, 443):
+        host = f'{host}:{parts.port}'
+
+    params = parse_qsl(parts.query, keep_blank_values=True)
+
+    if host in NAVER_NEWS_HOSTS:
+        query = dict(params)
+        match = NAVER_ARTICLE_PATH.match(parts.path)
+        if match:
+            return f'https://n.news.naver.com/article/{match.group(1)}/{match.group(2)}'
+        if query.get('oid') and query.get('aid'):
+            return f"https://n.news.naver.com/article/{query['oid']}/{query['aid']}"
+
+    if host in DAUM_NEWS_HOSTS:
+        match = DAUM_ARTICLE_PATH.match(parts.path)
+        if match:
+            return f'https://v.daum.net/v/{match.group(1)}'
+
+    query = sorted(
+        (key, value) for key, value in params
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip('/') or '/'
+
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+def url_key(url):
+    """
+    Hash a URL's canonical form into a compact key.
+
+    Args:
+        url (str): URL to hash
+
+    Returns:
+        bytes: An 8-byte digest, or None for empty input
+    """
+    canonical = canonical_url(url)
+    if not canonical:
+        return None
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=8).digest()
+
+class SeenIndex:
+    """
+    Remembers which URLs have been seen, by hash of their canonical form.
+
+    Only 8-byte digests are kept, so an index over a long multi-source search
+    stays small however long the URLs are.
+    """
+
+    def __init__(self):
+        self._keys = set()
+        self.duplicates = 0
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, url):
+        key = url_key(url)
+        return key is not None and key in self._keys
+
+    def add(self, url):
+        """
+        Record a URL.
+
+        Args:
+            url (str): URL to record
+
+        Returns:
+            bool: True if the URL had not been seen before (or is empty, and so cannot be compared)
+        """
+        key = url_key(url)
+        if key is None:
+            return True
+        if key in self._keys:
+            self.duplicates += 1
+            return False
+        self._keys.add(key)
+        return True
+
+    def filter(self, items, link_key='링크'):
+        """
+        Keep the items whose link has not been seen, recording their links.
+
+        Args:
+            items (list): Result dictionaries, in order
+            link_key (str, optional): Item key holding the link
+
+        Returns:
+            list: The new items, in their original order
+        """
+        return [item for item in items if self.add(item.get(link_key))]
@@ -6,6 +6,8 @@ import re
 from datetime import datetime, timedelta
 import json
 
+from .article import Article, mark_placeholders
+
 def get_wordpress_posts(keyword, max_pages=1, start_page=1):
     """
     Fetch blog posts from WordPress-based blogs based on a keyword
@@ -34,6 +36,14 @@ def get_wordpress_posts(keyword, max_pages=1, start_page=1):
     # For demonstration, we'll use a placeholder implementation
     return generate_placeholder_wordpress_posts(keyword)
 
+def iter_wordpress_posts(keyword, max_pages=1, start_page=1):
+    """
+    Yield posts one at a time, like the other sources' iter_* functions
+    
+    Results are simulated, so they are all generated up front.
+    """
+    yield from get_wordpress_posts(keyword, max_pages, start_page)
+
 def generate_placeholder_wordpress_posts(keyword):
     """Generate simulated WordPress blog posts for demo purposes"""
     placeholder_results = []
@@ -100,12 +110,12 @@ def generate_placeholder_wordpress_posts(keyword):
         read_time = random.randint(4, 15)
         content = f"{content} • {read_time} min read • {comments} comments"
         
-        placeholder_results.append({
+        placeholder_results.append(Article({
             '제목': title,
             '내용': content,
             '언론사': f"{site['name']} [{site['category']}]",
             '날짜': date,
             '링크': f"https://{site['domain']}/{date.replace('-', '/')}/{slug}/"
-        })
+        }))
     
-    return placeholder_results 
\ No newline at end of file
+    return mark_placeholders(placeholder_results) 
\ No newline at end of file
@@ -1,80 +1,273 @@
-import requests
-from bs4 import BeautifulSoup
-import time
+import json
 import random
 import re
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 import urllib.parse
 
-def get_youtube_videos(keyword, max_pages=1, start_page=1):
+from . import http_client
+from .article import Article, mark_placeholders
+
+SEARCH_URL = 'https://www.youtube.com/results?search_query={query}'
+CONTINUATION_URL = 'https://www.youtube.com/youtubei/v1/search?key={api_key}'
+
+def build_search_url(keyword):
+    """Build the YouTube search URL (later pages are continuation requests, not URLs)"""
+    return SEARCH_URL.format(query=urllib.parse.quote(keyword))
+
+# The page assigns its initial search results to ytInitialData in an inline script
+INITIAL_DATA_MARKERS = ('var ytInitialData = ', 'window["ytInitialData"] = ', 'ytInitialData = ')
+
+# Never scan further than this for the JSON blob
+MAX_INITIAL_DATA_CHARS = 8 * 1024 * 1024
+
+API_KEY_PATTERN = re.compile(r'"INNERTUBE_API_KEY"\s*:\s*"([^"]+)"')
+CLIENT_VERSION_PATTERN = re.compile(r'"INNERTUBE_CLIENT_VERSION"\s*:\s*"([^"]+)"')
+DEFAULT_CLIENT_VERSION = '2.20240101.00.00'
+
+_decoder = json.JSONDecoder()
+
+# Continuation tokens are remembered per (keyword, page) so that a request for page N
+# resumes from page N's token instead of replaying the search and every earlier page
+CONTINUATION_CACHE_SIZE = 256
+CONTINUATION_TTL = 30 * 60
+
+_continuations = OrderedDict()
+_continuations_lock = threading.Lock()
+
+def remember_continuation(keyword, page, state):
     """
-    Fetch videos from YouTube based on a keyword
+    Store what is needed to request a page of a search.
+
+    Args:
+        keyword (str): Search keyword
+        page (int): The page the token leads to
+        state (tuple): (api_key, client context, continuation token)
+    """
+    with _continuations_lock:
+        _continuations[(keyword, page)] = (time.monotonic(), state)
+        _continuations.move_to_end((keyword, page))
+        while len(_continuations) > CONTINUATION_CACHE_SIZE:
+            _continuations.popitem(last=False)
+
+def find_continuation(keyword, page):
+    """
+    Look up a remembered token for a page.
+
+    Returns:
+        tuple: (api_key, client context, continuation token), or None if unknown or expired
+    """
+    with _continuations_lock:
+        entry = _continuations.get((keyword, page))
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > CONTINUATION_TTL:
+            del _continuations[(keyword, page)]
+            return None
+        _continuations.move_to_end((keyword, page))
+        return entry[1]
+
+def extract_initial_data(html):
+    """
+    Pull the ytInitialData JSON object out of a search page.
+
+    The object is decoded in place with the C JSON scanner starting at the
+    marker, so the scan stops at the object's closing brace and only a bounded
+    window of the page is ever examined.
+
+    Args:
+        html (str): The page HTML
+
+    Returns:
+        dict: The decoded object, or None if the page does not carry it
+    """
+    for marker in INITIAL_DATA_MARKERS:
+        start = html.find(marker)
+        if start == -1:
+            continue
+        start = html.find('{', start + len(marker))
+        if start == -1:
+            continue
+        try:
+            data, _ = _decoder.raw_decode(html[start:start + MAX_INITIAL_DATA_CHARS])
+            return data
+        except ValueError:
+            continue
+    return None
+
+def walk_video_renderers(node):
+    """
+    Find the video results and the continuation token in a search response.
+
+    The walk is iterative and does not descend into video renderers, so the
+    (large) rest of each video node is never visited.
+
+    Args:
+        node (dict or list): ytInitialData or a continuation response
+
+    Returns:
+        tuple: (list of videoRenderer dicts in page order, continuation token or None)
+    """
+    videos = []
+    continuation = None
+    stack = [node]
+
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if 'videoRenderer' in current:
+                videos.append(current['videoRenderer'])
+                continue
+            command = current.get('continuationCommand')
+            if isinstance(command, dict) and command.get('token'):
+                continuation = command['token']
+                continue
+            stack.extend(reversed(list(current.values())))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+
+    return videos, continuation
+
+def _text(node):
+    """Read YouTube's {"simpleText": ...} or {"runs": [...]} text objects"""
+    if not isinstance(node, dict):
+        return ""
+    if 'simpleText' in node:
+        return node['simpleText']
+    return ''.join(run.get('text', '') for run in node.get('runs', []))
+
+def video_to_result(video):
+    """
+    Convert a videoRenderer node into a result row.
+
+    Returns:
+        dict: Result with title, description, channel, date and link, or None without a video id
+    """
+    video_id = video.get('videoId')
+    if not video_id:
+        return None
+
+    snippets = video.get('detailedMetadataSnippets') or []
+    if snippets:
+        description = _text(snippets[0].get('snippetText'))
+    else:
+        description = _text(video.get('descriptionSnippet'))
+
+    channel = _text(video.get('ownerText')) or _text(video.get('longBylineText')) or "YouTube"
+
+    return Article({
+        '제목': _text(video.get('title')),
+        '내용': description,
+        '언론사': f"YouTube - {channel}",
+        '날짜': _text(video.get('publishedTimeText')) or "Recent",
+        '링크': f'https://www.youtube.com/watch?v={video_id}'
+    })
+
+def results_from(node):
+    """Convert every video in a search response, returning (results, continuation token)"""
+    videos, continuation = walk_video_renderers(node)
+    results = [result for result in map(video_to_result, videos) if result is not None]
+    return results, continuation
+
+def parse_youtube_page(html):
+    """
+    Extract videos from one YouTube search result page
+    
+    Args:
+        html (str): The page HTML
+        
+    Returns:
+        list: List of video dictionaries with title, content, channel, date and link
+    """
+    data = extract_initial_data(html)
+    if data is None:
+        return []
+    return results_from(data)[0]
+
+def iter_youtube_videos(keyword, max_pages=1, start_page=1):
+    """
+    Yield videos from YouTube based on a keyword, one page at a time
+    
+    The first page comes from the search page's embedded ytInitialData; each
+    further page is requested with the previous page's continuation token, the
+    same way the site loads more results when scrolling. Pages therefore have
+    to be fetched one after another, but every token is remembered, so a later
+    call for the next page (the search page asks for one page at a time)
+    resumes from it with a single request.
     
     Args:
         keyword (str): Search keyword
         max_pages (int): Maximum number of pages to fetch
         start_page (int): Page to start from
         
-    Returns:
-        list: List of video dictionaries with title, content, channel, date and link
+    Yields:
+        Article: One video with title, content, channel, date and link, as soon as its page is parsed
     """
-    results = []
+    found = 0
     headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36',
-        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Referer': 'https://www.google.com',
     }
     
-    encoded_keyword = urllib.parse.quote(keyword)
+    last_page = start_page + max_pages - 1
     
     try:
-        for page in range(start_page, start_page + max_pages):
-            # YouTube search URL
-            url = f'https://www.youtube.com/results?search_query={encoded_keyword}&page={page}'
-            
+        state = find_continuation(keyword, start_page) if start_page > 1 else None
+        if state is not None:
+            page = start_page
+        else:
+            response = http_client.get(build_search_url(keyword), headers=headers, timeout=15, source='youtube')
+            if response.status_code != 200:
+                print(f"Error: YouTube search returned status code {response.status_code}")
+            else:
+                html = response.text
+                data = extract_initial_data(html)
+                if data is None:
+                    print("YouTube search page did not contain ytInitialData")
+                else:
+                    page_results, continuation = results_from(data)
+                    if start_page <= 1:
+                        yield from page_results
+                        found += len(page_results)
+                    
+                    api_key = API_KEY_PATTERN.search(html)
+                    version = CLIENT_VERSION_PATTERN.search(html)
+                    client = {
+                        'clientName': 'WEB',
+                        'clientVersion': version.group(1) if version else DEFAULT_CLIENT_VERSION,
+                        'hl': 'ko',
+                        'gl': 'KR',
+                    }
+                    if continuation and api_key:
+                        state = (api_key.group(1), client, continuation)
+                        remember_continuation(keyword, 2, state)
+            page = 2
+        
+        # Follow continuation tokens for the remaining pages
+        while state is not None and page <= last_page:
+            api_key, client, continuation = state
             try:
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_client.post(
+                    CONTINUATION_URL.format(api_key=api_key),
+                    json={'context': {'client': client}, 'continuation': continuation},
+                    headers=headers,
+                    timeout=15,
+                    source='youtube'
+                )
                 if response.status_code != 200:
-                    print(f"Error: YouTube search returned status code {response.status_code}")
+                    print(f"Error: YouTube continuation returned status code {response.status_code}")
                     break
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Try to extract video information
-                # Note: YouTube uses JavaScript rendering, so web scraping might be limited
-                # This is a basic implementation that might need adjustments based on YouTube's structure
+                page_results, continuation = results_from(response.json())
+                if page >= start_page:
+                    yield from page_results
+                    found += len(page_results)
+                page += 1
                 
-                # Look for initial data in the script
-                scripts = soup.find_all('script')
-                video_data = []
-                
-                for script in scripts:
-                    if script.string and 'var ytInitialData' in script.string:
-                        # Found the script with video data
-                        # This is a simplified approach that might not be reliable
-                        # A more robust solution would use a headless browser like Selenium
-                        print("Found YouTube data script, but parsing it requires more sophisticated techniques")
-                        break
-                
-                # Simple fallback to extract what we can
-                titles = soup.select('a#video-title')
-                if titles:
-                    for title_elem in titles[:10]:  # Limit to 10 results per page
-                        title = title_elem.get_text(strip=True)
-                        link = 'https://www.youtube.com' + title_elem.get('href', '')
-                        
-                        # We don't have direct access to other elements
-                        # So we'll create placeholders
-                        results.append({
-                            '제목': title,
-                            '내용': "YouTube video description (unavailable without JavaScript)",
-                            '언론사': "YouTube",
-                            '날짜': "Recent",
-                            '링크': link
-                        })
-                
-                time.sleep(random.uniform(2.0, 4.0))  # Longer delay for YouTube
+                state = (api_key, client, continuation) if continuation else None
+                if state is not None:
+                    remember_continuation(keyword, page, state)
                 
             except Exception as e:
                 print(f"Error occurred while crawling YouTube page {page}: {str(e)}")
@@ -83,12 +276,23 @@ def get_youtube_videos(keyword, max_pages=1, start_page=1):
     except Exception as e:
         print(f"YouTube search error: {str(e)}")
     
-    # YouTube data is hard to scrape without JavaScript
-    # Use placeholder data to ensure we have results
-    if not results:
-        return generate_placeholder_youtube_videos(keyword)
+    # Fall back to placeholder data if YouTube could not be reached
+    if not found:
+        yield from generate_placeholder_youtube_videos(keyword)
+
+def get_youtube_videos(keyword, max_pages=1, start_page=1):
+    """
+    Fetch videos from YouTube based on a keyword
     
-    return results
+    Args:
+        keyword (str): Search keyword
+        max_pages (int): Maximum number of pages to fetch
+        start_page (int): Page to start from
+        
+    Returns:
+        list: List of video dictionaries with title, content, channel, date and link
+    """
+    return list(iter_youtube_videos(keyword, max_pages, start_page))
 
 def generate_placeholder_youtube_videos(keyword):
     """Generate simulated YouTube videos for demo purposes"""
@@ -138,12 +342,12 @@ def generate_placeholder_youtube_videos(keyword):
         """
         video_description = re.sub(r'\s+', ' ', video_description).strip()
         
-        placeholder_results.append({
+        placeholder_results.append(Article({
             '제목': title,
             '내용': video_description,
             '언론사': f"YouTube - {channel_name}",
             '날짜': publish_date,
             '링크': f"https://www.youtube.com/watch?v={video_id}"
-        })
+        }))
     
-    return placeholder_results 
\ No newline at end of file
+    return mark_placeholders(placeholder_results) 
\ No newline at end of file
@@ -12,6 +12,11 @@ import plotly.graph_objects as go
 import re
 from datetime import datetime
 
+from sources.batch import ArticleBatch
+from sources.config import get_setting
+from sources.dates import normalize_dates
+from sources.near_dup import keep_representatives
+
 # Set style for plots
 plt.style.use('dark_background')
 sns.set_style("darkgrid")
@@ -111,17 +116,19 @@ def count_sources(df):
         return source_counts
     return None
 
-def visualize_page():
-    """Main visualization page"""
-    st.title("Data Visualization")
-    st.write("Analyze and visualize your search results")
+def choose_saved_file():
+    """
+    Let the user pick a saved Excel file and load it.
     
+    Returns:
+        tuple: (DataFrame, time the file was saved), or (None, None) if nothing could be loaded
+    """
     # Load Excel files
     excel_files, error = load_excel_files()
     
     if error:
         st.error(error)
-        return
+        return None, None
     
     # Convert files to info dictionaries
     file_infos = [get_file_info(file) for file in excel_files]
@@ -152,7 +159,37 @@ def visualize_page():
     df, error = load_data(selected_file)
     if error:
         st.error(error)
-        return
+        return None, None
+    
+    # Relative dates ("3일 전") count back from when the file was saved
+    return df, datetime.fromtimestamp(os.path.getmtime(selected_file))
+
+def visualize_page():
+    """Main visualization page"""
+    st.title("Data Visualization")
+    st.write("Analyze and visualize your search results")
+    
+    # Results handed over by the search page's "Visualize These Results" button
+    current = st.session_state.get('visualization_data')
+    use_current = False
+    if current is not None and len(current):
+        use_current = st.radio("Data", ["Current search results", "Saved file"], horizontal=True) == "Current search results"
+    
+    if use_current:
+        # The batch's cached DataFrame, with categorical source columns; nothing is rebuilt
+        df = current.to_frame() if isinstance(current, ArticleBatch) else current
+        fetched_at = st.session_state.get('visualization_fetched_at') or datetime.now()
+        st.subheader(f"Current search: {st.session_state.get('visualization_keyword', '')}")
+    else:
+        df, fetched_at = choose_saved_file()
+        if df is None:
+            return
+    
+    # Count each syndicated story once; files saved without a Cluster column are clustered here
+    if st.checkbox("One Result per Story",
+                   value=get_setting('search', 'keep_cluster_representatives', False),
+                   help="Keep only the first of each group of near-identical results (e.g. rewritten wire stories)"):
+        df = keep_representatives(df)
     
     # Show basic stats
     st.subheader("Data Overview")
@@ -169,8 +206,12 @@ def visualize_page():
         st.metric("Unique Sources", sources)
     with col3:
         if '날짜' in df.columns:
-            dates = len(df['날짜'].unique())
-            st.metric("Date Range", dates)
+            # Relative dates ("3일 전") count back from when the results were fetched
+            dates = normalize_dates(df['날짜'], fetched_at=fetched_at)
+            if dates.notna().any():
+                st.metric("Date Range (days)", (dates.max() - dates.min()).days)
+            else:
+                st.metric("Date Range", "N/A")
         else:
             st.metric("Date Range", "N/A")
     
@@ -181,7 +222,11 @@ def visualize_page():
         st.subheader("Word Cloud Visualization")
         # Combine title and content text
         if '제목' in df.columns and '내용' in df.columns:
-            combined_text = ' '.join(df['제목'].astype(str) + ' ' + df['내용'].astype(str))
+            # Prefer the full article text where it was fetched
+            text_col = df['내용']
+            if '본문' in df.columns:
+                text_col = df['본문'].where(df['본문'].notna() & (df['본문'].astype(str).str.strip() != ''), df['내용'])
+            combined_text = ' '.join(df['제목'].astype(str) + ' ' + text_col.astype(str))
             combined_text = clean_text(combined_text)
             
             if combined_text:
@@ -233,7 +278,7 @@ def visualize_page():
         st.subheader("Content Length Analysis")
         if '내용' in df.columns:
             # Calculate content lengths
-            df['content_length'] = df['내용'].astype(str).apply(len)
+            df = df.assign(content_length=df['내용'].astype(str).str.len())
             
             # Histogram
             fig = px.histogram(